@@ -18,27 +18,94 @@ from datetime import datetime, timedelta
 import yfinance as yf
 from typing import Dict, List, Tuple
 import warnings
+import os
+import re
+import sys
+from functools import lru_cache
+from concurrent.futures import ProcessPoolExecutor, TimeoutError, as_completed
 
 warnings.filterwarnings("ignore")
 
+# Prefer the Rust-backed calamine reader when python-calamine is installed
+try:
+    import python_calamine  # noqa: F401
+
+    EXCEL_ENGINE = "calamine"
+except ImportError:
+    EXCEL_ENGINE = None  # pandas default (openpyxl)
+
+# Parquet sidecars need pyarrow or fastparquet; without either, always read Excel
+try:
+    import pyarrow  # noqa: F401
+
+    PARQUET_AVAILABLE = True
+except ImportError:
+    try:
+        import fastparquet  # noqa: F401
+
+        PARQUET_AVAILABLE = True
+    except ImportError:
+        PARQUET_AVAILABLE = False
+
+# Scanner result subfolders that hold watchlist reports
+WATCHLIST_CATEGORIES = {"sp500", "nasdaq100", "portfolio"}
+
+# Only the columns backtest_report actually reads from "Top Buy Setups"
+WATCHLIST_COLUMNS = {
+    "Ticker",
+    "Rank",
+    "Quality",
+    "Quality Flag",
+    "Current Price",
+    "Vol R:R",
+    "Vol Stop Loss %",
+    "Target R1",
+}
+
+# Seconds a worker may spend on one report (price history is downloaded before
+# the workers start, so a report that runs longer than this is stuck)
+REPORT_TIMEOUT = 300
+
+# Report date part of a filename stem, e.g. sp500_watchlist_20260111_1525
+_DATE_RE = re.compile(r"(?:^|_)(\d{8})(?=_|$)")
+
+
+@lru_cache(maxsize=4096)
+def _date_from_filename(name: str):
+    """Parse the YYYYMMDD part of a filename stem (None if there is none)"""
+    match = _DATE_RE.search(name)
+    return datetime.strptime(match.group(1), "%Y%m%d") if match else None
+
 
 class WatchlistBacktest:
     """
     Backtest historical Watchlist recommendations
     """
 
-    def __init__(self, results_dir: Path = None):
+    def __init__(self, results_dir: Path = None, session=None):
         """
         Initialize backtester
 
         Args:
             results_dir: Path to scanner_results directory
+            session: Optional HTTP session shared by all yfinance requests
         """
         if results_dir is None:
             results_dir = Path("scanner_results")
 
         self.results_dir = results_dir
+        self.session = session
         self.backtest_results = []
+        self._tickers = {}
+        self._watchlist_files = {}
+
+    def _ticker(self, ticker: str) -> yf.Ticker:
+        """Return a cached yf.Ticker bound to the shared session"""
+        stock = self._tickers.get(ticker)
+        if stock is None:
+            stock = yf.Ticker(ticker, session=self.session)
+            self._tickers[ticker] = stock
+        return stock
 
     def find_watchlist_files(self, category: str = None) -> List[Path]:
         """
@@ -50,30 +117,24 @@ class WatchlistBacktest:
         Returns:
             List of Excel file paths
         """
-        files = []
-
-        # Search in main results_dir and archive
-        search_paths = [self.results_dir, self.results_dir / "archive"]
+        if category in self._watchlist_files:
+            return list(self._watchlist_files[category])
 
-        for search_path in search_paths:
-            if not search_path.exists():
-                continue
+        # Main results_dir and archive, in category subfolders
+        search_paths = {self.results_dir, self.results_dir / "archive"}
+        categories = {category} if category else WATCHLIST_CATEGORIES
 
-            # Search in category subfolders
-            if category:
-                category_dir = search_path / category
-                if category_dir.exists():
-                    files.extend(category_dir.glob("*_watchlist_*.xlsx"))
-            else:
-                # Search all subfolders
-                for subfolder in ["sp500", "nasdaq100", "portfolio"]:
-                    subfolder_path = search_path / subfolder
-                    if subfolder_path.exists():
-                        files.extend(subfolder_path.glob("*_watchlist_*.xlsx"))
+        # One directory walk instead of a glob per subfolder
+        files = [
+            path
+            for path in self.results_dir.rglob("*_watchlist_*.xlsx")
+            if path.parent.name in categories and path.parent.parent in search_paths
+        ]
 
         # Sort by date (newest first)
-        files.sort(reverse=True)
-        return files
+        files.sort(key=lambda path: path.name, reverse=True)
+        self._watchlist_files[category] = files
+        return list(files)
 
     def extract_date_from_filename(self, file_path: Path) -> datetime:
         """
@@ -86,20 +147,15 @@ class WatchlistBacktest:
             datetime object
         """
         try:
-            # Extract timestamp from filename
-            filename = file_path.stem
-            parts = filename.split("_")
-
-            # Find date part (YYYYMMDD format)
-            for part in parts:
-                if len(part) == 8 and part.isdigit():
-                    date_str = part
-                    return datetime.strptime(date_str, "%Y%m%d")
-        except:
+            # Extract timestamp from filename (parsed once per name)
+            report_date = _date_from_filename(file_path.stem)
+        except ValueError:
             # Fallback to file modification time
             return datetime.fromtimestamp(file_path.stat().st_mtime)
 
-        return datetime.now()
+        if report_date is None:
+            return datetime.now()
+        return report_date
 
     def parse_watchlist_excel(self, file_path: Path) -> pd.DataFrame:
         """
@@ -112,8 +168,18 @@ class WatchlistBacktest:
             DataFrame with recommendations
         """
         try:
-            # Read Top Buy Setups sheet
-            df = pd.read_excel(file_path, sheet_name="Top Buy Setups", skiprows=3)
+            df = self._read_parquet_sidecar(file_path)
+
+            if df is None:
+                # Read Top Buy Setups sheet (needed columns only)
+                df = pd.read_excel(
+                    file_path,
+                    sheet_name="Top Buy Setups",
+                    skiprows=3,
+                    usecols=lambda col: col in WATCHLIST_COLUMNS,
+                    engine=EXCEL_ENGINE,
+                )
+                self._write_parquet_sidecar(file_path, df)
 
             # Extract report date from filename
             report_date = self.extract_date_from_filename(file_path)
@@ -125,6 +191,92 @@ class WatchlistBacktest:
             print(f"Error parsing {file_path.name}: {e}")
             return pd.DataFrame()
 
+    def _read_parquet_sidecar(self, file_path: Path):
+        """
+        Load the cached Parquet copy of a report if it is still current
+
+        Args:
+            file_path: Path to Excel file
+
+        Returns:
+            DataFrame from the sidecar, or None if missing/stale/unreadable
+        """
+        if not PARQUET_AVAILABLE:
+            return None
+
+        sidecar = file_path.with_suffix(".parquet")
+        try:
+            if sidecar.stat().st_mtime < file_path.stat().st_mtime:
+                return None
+            return pd.read_parquet(sidecar)
+        except Exception:
+            return None
+
+    def _write_parquet_sidecar(self, file_path: Path, df: pd.DataFrame):
+        """
+        Save a Parquet copy of a parsed report next to the Excel file
+
+        Args:
+            file_path: Path to Excel file
+            df: Raw Top Buy Setups data read from file_path
+        """
+        if not PARQUET_AVAILABLE:
+            return
+
+        try:
+            # Store mixed-type columns (e.g. "N/A" next to numbers) as text
+            df = df.copy()
+            for col in df.columns[df.dtypes == object]:
+                df[col] = df[col].map(str, na_action="ignore")
+            df.to_parquet(file_path.with_suffix(".parquet"), index=False)
+        except Exception as e:
+            print(f"[WARNING] Could not cache {file_path.name}: {e}")
+
+    def _parse_report_columns(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Parse Vol R:R and stop loss columns for all rows at once
+
+        Args:
+            df: Raw watchlist DataFrame from parse_watchlist_excel
+
+        Returns:
+            DataFrame with vol_rr_value and stop_pct columns, invalid rows dropped
+        """
+        df = df.copy()
+
+        # Fill in any columns missing from older report layouts
+        defaults = {
+            "Ticker": "",
+            "Rank": 0,
+            "Quality": "",
+            "Quality Flag": "",
+            "Current Price": 0,
+            "Vol R:R": "",
+            "Vol Stop Loss %": "",
+            "Target R1": 0,
+        }
+        for col, default in defaults.items():
+            if col not in df.columns:
+                df[col] = default
+
+        # Parse vol_rr (format: "1:3.5" -> 3.5), unparseable -> 0
+        df["vol_rr_value"] = pd.to_numeric(
+            df["Vol R:R"].astype(str).str.split(":").str[-1], errors="coerce"
+        ).fillna(0.0)
+
+        # Parse stop loss % (format: "-5.0%" -> 5.0), unparseable -> 5.0
+        df["stop_pct"] = pd.to_numeric(
+            df["Vol Stop Loss %"].astype(str).str.replace("[-%]", "", regex=True),
+            errors="coerce",
+        ).fillna(5.0)
+
+        df["Current Price"] = pd.to_numeric(df["Current Price"], errors="coerce")
+        df["Target R1"] = pd.to_numeric(df["Target R1"], errors="coerce")
+
+        # Skip rows without a ticker or a valid entry price
+        valid = df["Current Price"].gt(0) & df["Ticker"].notna() & df["Ticker"].ne("")
+        return df[valid]
+
     def fetch_price_history(
         self, ticker: str, start_date: datetime, end_date: datetime
     ) -> pd.DataFrame:
@@ -140,13 +292,99 @@ class WatchlistBacktest:
             DataFrame with OHLCV data
         """
         try:
-            stock = yf.Ticker(ticker)
+            stock = self._ticker(ticker)
             df = stock.history(start=start_date, end=end_date)
             return df
         except Exception as e:
             print(f"Error fetching {ticker}: {e}")
             return pd.DataFrame()
 
+    def fetch_price_histories(
+        self, tickers: List[str], start_date: datetime, end_date: datetime
+    ) -> Dict[str, pd.DataFrame]:
+        """
+        Fetch historical price data for many tickers in one batched download
+
+        Args:
+            tickers: Stock symbols
+            start_date: Start date for price data
+            end_date: End date for price data
+
+        Returns:
+            Dict of ticker -> DataFrame with OHLCV data (failed tickers omitted)
+        """
+        if not tickers:
+            return {}
+
+        try:
+            data = yf.download(
+                tickers,
+                start=start_date,
+                end=end_date,
+                group_by="ticker",
+                auto_adjust=True,
+                progress=False,
+                session=self.session,
+            )
+        except Exception as e:
+            print(f"Error fetching batch of {len(tickers)} tickers: {e}")
+            return {}
+
+        if data.empty:
+            return {}
+
+        histories = {}
+        if isinstance(data.columns, pd.MultiIndex):
+            for ticker in data.columns.get_level_values(0).unique():
+                df = data[ticker].dropna(how="all")
+                if not df.empty:
+                    histories[ticker] = df
+        elif len(tickers) == 1:
+            histories[tickers[0]] = data.dropna(how="all")
+
+        return histories
+
+    def _slice_history(
+        self, history: pd.DataFrame, start_date: datetime, end_date: datetime
+    ) -> pd.DataFrame:
+        """
+        Cut one report's window out of a prefetched price history
+
+        Args:
+            history: Prefetched OHLCV data (or None if the ticker failed)
+            start_date: Start date for price data
+            end_date: End date for price data (exclusive, like history())
+
+        Returns:
+            DataFrame with OHLCV data for the window
+        """
+        if history is None or history.empty:
+            return pd.DataFrame()
+
+        index = history.index
+        if index.tz is not None:
+            index = index.tz_localize(None)
+        return history[(index >= start_date) & (index < end_date)]
+
+    def _report_window(
+        self, report_date: datetime, holding_period: int
+    ) -> Tuple[datetime, datetime]:
+        """
+        Price window needed to backtest a report
+
+        Args:
+            report_date: Date the report was generated
+            holding_period: Days to hold for performance measurement
+
+        Returns:
+            (start_date, end_date) tuple, end capped at today
+        """
+        start_date = report_date + timedelta(days=1)
+        end_date = report_date + timedelta(days=max(holding_period, 90) + 10)
+
+        # Don't try to fetch future data
+        return start_date, min(end_date, datetime.now())
+
     def calculate_performance(
         self,
         entry_price: float,
@@ -169,6 +407,11 @@ class WatchlistBacktest:
         if price_history.empty or entry_price <= 0:
             return {}
 
+        # float32 is plenty for price math and halves the data scanned per trade
+        highs = price_history["High"].to_numpy(dtype=np.float32)
+        lows = price_history["Low"].to_numpy(dtype=np.float32)
+        closes = price_history["Close"].to_numpy(dtype=np.float32)
+
         stop_price = entry_price * (1 - vol_stop_pct / 100)
 
         # Calculate returns at various intervals
@@ -182,26 +425,28 @@ class WatchlistBacktest:
         for days in [7, 14, 30, 60, 90]:
             # Use available data up to the requested period
             # If we have fewer days than requested, use what we have
-            actual_days = min(days, len(price_history))
+            actual_days = min(days, len(closes))
 
             if actual_days > 0:
-                period_data = price_history.iloc[:actual_days]
+                # Array slices are views, no per-period DataFrame copies
+                period_highs = highs[:actual_days]
+                period_lows = lows[:actual_days]
 
                 # Check if stop was hit and when
-                stop_hit_mask = period_data["Low"] <= stop_price
+                stop_hit_mask = period_lows <= stop_price
                 stop_hit = stop_hit_mask.any()
-                stop_hit_day = stop_hit_mask.idxmax() if stop_hit else None
+                stop_hit_day = stop_hit_mask.argmax() if stop_hit else None
 
                 # Check if R1 target was hit and when
                 r1_hit = False
                 r1_hit_day = None
                 if target_r1 and target_r1 > 0:
-                    r1_hit_mask = period_data["High"] >= target_r1
+                    r1_hit_mask = period_highs >= target_r1
                     r1_hit = r1_hit_mask.any()
-                    r1_hit_day = r1_hit_mask.idxmax() if r1_hit else None
+                    r1_hit_day = r1_hit_mask.argmax() if r1_hit else None
 
                 # Determine exit: stop first, then R1 target, then hold to end
-                exit_price = period_data.iloc[-1]["Close"]  # Default: hold to end
+                exit_price = closes[actual_days - 1]  # Default: hold to end
                 exit_reason = "hold"
 
                 if stop_hit and r1_hit:
@@ -225,11 +470,11 @@ class WatchlistBacktest:
                 return_pct = (exit_price - entry_price) / entry_price * 100
 
                 # Max favorable excursion (highest gain reached)
-                max_price = period_data["High"].max()
+                max_price = period_highs.max()
                 mfe = (max_price - entry_price) / entry_price * 100
 
                 # Max adverse excursion (worst drawdown)
-                min_price = period_data["Low"].min()
+                min_price = period_lows.min()
                 mae = (min_price - entry_price) / entry_price * 100
 
                 results[f"return_{days}d"] = return_pct
@@ -243,7 +488,11 @@ class WatchlistBacktest:
         return results
 
     def backtest_report(
-        self, file_path: Path, holding_period: int = 30
+        self,
+        file_path: Path,
+        holding_period: int = 30,
+        report_df: pd.DataFrame = None,
+        price_cache: Dict[str, pd.DataFrame] = None,
     ) -> pd.DataFrame:
         """
         Backtest a single watchlist report
@@ -251,61 +500,114 @@ class WatchlistBacktest:
         Args:
             file_path: Path to watchlist Excel file
             holding_period: Days to hold for performance measurement
+            report_df: Already parsed report (parsed from file_path if None)
+            price_cache: Prefetched ticker -> OHLCV data (fetched per ticker if None)
 
         Returns:
             DataFrame with backtest results
         """
-        print(f"\nBacktesting: {file_path.name}")
-
-        # Parse the report
-        df = self.parse_watchlist_excel(file_path)
+        return pd.DataFrame(
+            self.backtest_report_records(
+                file_path, holding_period, report_df, price_cache
+            )
+        )
 
-        if df.empty:
-            return pd.DataFrame()
+    def backtest_report_records(
+        self,
+        file_path: Path,
+        holding_period: int = 30,
+        report_df: pd.DataFrame = None,
+        price_cache: Dict[str, pd.DataFrame] = None,
+        progress: List[str] = None,
+    ) -> List[Dict]:
+        """
+        Backtest a single watchlist report, returning one dict per trade
 
-        report_date = df["report_date"].iloc[0]
-        results = []
+        Args:
+            file_path: Path to watchlist Excel file
+            holding_period: Days to hold for performance measurement
+            report_df: Already parsed report (parsed from file_path if None)
+            price_cache: Prefetched ticker -> OHLCV data (fetched per ticker if None)
+            progress: List to collect progress lines in (written to stdout
+                      once the report is done if None)
 
-        for idx, row in df.iterrows():
-            ticker = row.get("Ticker", "")
-            rank = row.get("Rank", 0)
-            quality = row.get("Quality", "")
-            quality_flag = row.get("Quality Flag", "")
-            entry_price = row.get("Current Price", 0)
-            vol_rr = row.get("Vol R:R", "")
-            vol_stop_loss_pct = (
-                row.get("Vol Stop Loss %", "").replace("-", "").replace("%", "")
+        Returns:
+            List of backtest result records
+        """
+        # Buffer progress lines and write them in one go per report
+        lines = [f"\nBacktesting: {file_path.name}"]
+        try:
+            return self._backtest_rows(
+                file_path, holding_period, report_df, price_cache, lines
             )
-            target_r1 = row.get("Target R1", 0)
+        finally:
+            if progress is None:
+                sys.stdout.write("\n".join(lines) + "\n")
+                sys.stdout.flush()
+            else:
+                progress.extend(lines)
 
-            if not ticker or entry_price <= 0:
-                continue
+    def _backtest_rows(
+        self,
+        file_path: Path,
+        holding_period: int,
+        report_df: pd.DataFrame,
+        price_cache: Dict[str, pd.DataFrame],
+        lines: List[str],
+    ) -> List[Dict]:
+        """
+        Backtest every valid row of a report (see backtest_report_records)
 
-            # Parse vol_rr (format: "1:3.5" -> 3.5)
-            try:
-                if isinstance(vol_rr, str) and ":" in vol_rr:
-                    vol_rr_value = float(vol_rr.split(":")[1])
-                else:
-                    vol_rr_value = float(vol_rr) if vol_rr else 0
-            except:
-                vol_rr_value = 0
+        Args:
+            file_path: Path to watchlist Excel file
+            holding_period: Days to hold for performance measurement
+            report_df: Already parsed report (parsed from file_path if None)
+            price_cache: Prefetched ticker -> OHLCV data (fetched per ticker if None)
+            lines: Progress lines are appended here
 
-            # Parse stop loss %
-            try:
-                stop_pct = float(vol_stop_loss_pct) if vol_stop_loss_pct else 5.0
-            except:
-                stop_pct = 5.0
+        Returns:
+            List of backtest result records
+        """
+        # Parse the report
+        df = self.parse_watchlist_excel(file_path) if report_df is None else report_df
 
-            # Fetch price data
-            start_date = report_date + timedelta(days=1)
-            end_date = report_date + timedelta(days=max(holding_period, 90) + 10)
+        if df.empty:
+            return []
 
-            # Don't try to fetch future data
-            today = datetime.now()
-            if end_date > today:
-                end_date = today
+        report_date = df["report_date"].iloc[0]
+        results = []
 
-            price_data = self.fetch_price_history(ticker, start_date, end_date)
+        # Parse all rows in one vectorized pass
+        df = self._parse_report_columns(df)
+
+        # Fetch window is the same for every trade in the report
+        start_date, end_date = self._report_window(report_date, holding_period)
+
+        for (
+            ticker,
+            rank,
+            quality,
+            quality_flag,
+            entry_price,
+            vol_rr_value,
+            stop_pct,
+            target_r1,
+        ) in zip(
+            df["Ticker"],
+            df["Rank"],
+            df["Quality"],
+            df["Quality Flag"],
+            df["Current Price"],
+            df["vol_rr_value"],
+            df["stop_pct"],
+            df["Target R1"],
+        ):
+            if price_cache is None:
+                price_data = self.fetch_price_history(ticker, start_date, end_date)
+            else:
+                price_data = self._slice_history(
+                    price_cache.get(ticker), start_date, end_date
+                )
 
             if not price_data.empty:
                 perf = self.calculate_performance(
@@ -325,14 +627,19 @@ class WatchlistBacktest:
                 }
 
                 results.append(result)
-                print(
+                lines.append(
                     f"  {ticker:6s} Rank #{rank:2d} | {quality:10s} | {holding_period}d return: {perf.get(f'return_{holding_period}d', 0):+6.1f}%"
                 )
 
-        return pd.DataFrame(results)
+        return results
 
     def run_backtest(
-        self, category: str = None, max_reports: int = 10, holding_period: int = 30
+        self,
+        category: str = None,
+        max_reports: int = 10,
+        holding_period: int = 30,
+        max_workers: int = None,
+        report_timeout: float = REPORT_TIMEOUT,
     ) -> pd.DataFrame:
         """
         Run backtest across multiple reports
@@ -341,6 +648,10 @@ class WatchlistBacktest:
             category: Category to backtest (sp500, nasdaq100, portfolio) or None for all
             max_reports: Maximum number of reports to backtest
             holding_period: Primary holding period for analysis
+            max_workers: Processes used to backtest reports in parallel
+                         (default: CPU count, 1 = run sequentially)
+            report_timeout: Seconds allowed per report in parallel runs; reports
+                            unfinished by the batch deadline are reported and skipped
 
         Returns:
             Combined DataFrame with all backtest results
@@ -385,19 +696,114 @@ class WatchlistBacktest:
 
         files = valid_files
 
-        # Backtest each report
-        all_results = []
+        # Parse every report up front so overlapping tickers are downloaded once
+        reports = {}
         for file_path in files:
-            results_df = self.backtest_report(file_path, holding_period)
-            if not results_df.empty:
-                all_results.append(results_df)
+            df = self.parse_watchlist_excel(file_path)
+            if not df.empty:
+                reports[file_path] = df
+        files = list(reports)
 
-        if not all_results:
+        if not files:
             print("\n[ERROR] No backtest results generated!")
             return pd.DataFrame()
 
-        # Combine all results
-        combined = pd.concat(all_results, ignore_index=True)
+        windows = [
+            self._report_window(df["report_date"].iloc[0], holding_period)
+            for df in reports.values()
+        ]
+        tickers = sorted(
+            {
+                ticker
+                for df in reports.values()
+                for ticker in self._parse_report_columns(df)["Ticker"]
+            }
+        )
+
+        print(f"Downloading price history for {len(tickers)} unique tickers")
+        price_cache = self.fetch_price_histories(
+            tickers,
+            min(start for start, _ in windows),
+            max(end for _, end in windows),
+        )
+
+        # Backtest each report (reports are independent, so fan out across processes)
+        if max_workers is None:
+            max_workers = os.cpu_count() or 1
+        max_workers = max(1, min(max_workers, len(files)))
+
+        results_by_file = {}
+        if max_workers == 1:
+            for file_path in files:
+                results_by_file[file_path] = self.backtest_report_records(
+                    file_path, holding_period, reports[file_path], price_cache
+                )
+        else:
+            print(f"Running {len(files)} reports across {max_workers} processes")
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                future_to_file = {
+                    executor.submit(
+                        _backtest_one,
+                        self.results_dir,
+                        file_path,
+                        holding_period,
+                        reports[file_path],
+                        # Ship each worker only the histories its report needs
+                        {
+                            ticker: price_cache[ticker]
+                            for ticker in reports[file_path]["Ticker"]
+                            if ticker in price_cache
+                        },
+                    ): file_path
+                    for file_path in files
+                }
+
+                # Each wave of max_workers reports gets report_timeout seconds
+                waves = -(-len(files) // max_workers)
+                completed = 0
+                try:
+                    for future in as_completed(
+                        future_to_file, timeout=report_timeout * waves
+                    ):
+                        file_path = future_to_file[future]
+                        completed += 1
+                        try:
+                            results_by_file[file_path], lines = future.result()
+                            lines.append(
+                                f"  [{completed}/{len(files)}] Done: {file_path.name}"
+                            )
+                            sys.stdout.write("\n".join(lines) + "\n")
+                        except Exception as e:
+                            print(
+                                f"  [{completed}/{len(files)}] Error backtesting {file_path.name}: {e}"
+                            )
+                except TimeoutError:
+                    for future, file_path in future_to_file.items():
+                        if not future.done():
+                            completed += 1
+                            print(
+                                f"  [{completed}/{len(files)}] Error backtesting {file_path.name}: "
+                                f"timed out after {report_timeout * waves:.0f}s"
+                            )
+                    # Stop stuck workers so leaving the pool doesn't wait on them
+                    workers = list(executor._processes.values())
+                    executor.shutdown(wait=False, cancel_futures=True)
+                    for process in workers:
+                        process.terminate()
+
+        # Keep report order stable regardless of completion order
+        records = [
+            record
+            for file_path in files
+            for record in results_by_file.get(file_path, [])
+        ]
+
+        if not records:
+            print("\n[ERROR] No backtest results generated!")
+            return pd.DataFrame()
+
+        # Build the combined DataFrame once from all trade records
+        combined = pd.DataFrame.from_records(records)
 
         print(f"\n[OK] Backtest complete: {len(combined)} trades analyzed")
 
@@ -429,39 +835,79 @@ class WatchlistBacktest:
             "by_rank_tier": {},
         }
 
-        # By Quality
-        for quality in results_df["quality"].unique():
-            segment = results_df[results_df["quality"] == quality]
+        # By Quality (one groupby pass instead of a boolean mask per value)
+        for quality, segment in results_df.groupby("quality", sort=False):
             analysis["by_quality"][quality] = self._analyze_segment(segment, return_col)
 
         # By Quality Flag
-        for flag in results_df["quality_flag"].unique():
-            if pd.notna(flag) and flag:
-                segment = results_df[results_df["quality_flag"] == flag]
+        for flag, segment in results_df.groupby("quality_flag", sort=False):
+            if flag:
                 analysis["by_quality_flag"][flag] = self._analyze_segment(
                     segment, return_col
                 )
 
         # By Vol R:R tier
-        results_df["vol_rr_tier"] = pd.cut(
-            results_df["vol_rr"], bins=[0, 2, 3, 100], labels=["<2:1", "2-3:1", "3+:1"]
+        vol_rr_labels = ["<2:1", "2-3:1", "3+:1"]
+        vol_rr_codes = self._tier_codes(results_df["vol_rr"], [0, 2, 3, 100])
+        results_df["vol_rr_tier"] = pd.Categorical.from_codes(
+            vol_rr_codes, categories=vol_rr_labels, ordered=True
+        )
+        analysis["by_vol_rr_tier"] = self._analyze_tiers(
+            results_df, vol_rr_codes, vol_rr_labels, return_col
         )
-        for tier in ["<2:1", "2-3:1", "3+:1"]:
-            segment = results_df[results_df["vol_rr_tier"] == tier]
-            analysis["by_vol_rr_tier"][tier] = self._analyze_segment(
-                segment, return_col
-            )
 
         # By Rank tier
-        results_df["rank_tier"] = pd.cut(
-            results_df["rank"], bins=[0, 5, 10, 100], labels=["Top 5", "6-10", "11+"]
+        rank_labels = ["Top 5", "6-10", "11+"]
+        rank_codes = self._tier_codes(results_df["rank"], [0, 5, 10, 100])
+        results_df["rank_tier"] = pd.Categorical.from_codes(
+            rank_codes, categories=rank_labels, ordered=True
+        )
+        analysis["by_rank_tier"] = self._analyze_tiers(
+            results_df, rank_codes, rank_labels, return_col
         )
-        for tier in ["Top 5", "6-10", "11+"]:
-            segment = results_df[results_df["rank_tier"] == tier]
-            analysis["by_rank_tier"][tier] = self._analyze_segment(segment, return_col)
 
         return analysis
 
+    def _tier_codes(self, values: pd.Series, bins: List[float]) -> np.ndarray:
+        """
+        Bin values into tiers (right-inclusive, like pd.cut)
+
+        Args:
+            values: Values to bin
+            bins: Tier edges, e.g. [0, 2, 3, 100] -> (0, 2], (2, 3], (3, 100]
+
+        Returns:
+            Array of tier codes (0..len(bins)-2), -1 for values outside all tiers
+        """
+        codes = np.digitize(values.to_numpy(dtype=float), bins, right=True) - 1
+        codes[(codes < 0) | (codes >= len(bins) - 1)] = -1
+        return codes
+
+    def _analyze_tiers(
+        self,
+        df: pd.DataFrame,
+        codes: np.ndarray,
+        labels: List[str],
+        return_col: str,
+    ) -> Dict:
+        """
+        Analyze every tier from a single groupby pass
+
+        Args:
+            df: Backtest results DataFrame
+            codes: Tier code per row from _tier_codes
+            labels: Tier labels, indexed by code
+            return_col: Column name for returns
+
+        Returns:
+            Dictionary of tier label -> statistics (empty dict for empty tiers)
+        """
+        by_tier = {label: {} for label in labels}
+        for code, segment in df.groupby(codes, sort=False):
+            if code >= 0:
+                by_tier[labels[code]] = self._analyze_segment(segment, return_col)
+        return by_tier
+
     def _analyze_segment(self, df: pd.DataFrame, return_col: str) -> Dict:
         """
         Analyze a segment of trades
@@ -476,27 +922,28 @@ class WatchlistBacktest:
         if df.empty or return_col not in df.columns:
             return {}
 
-        returns = df[return_col].dropna()
+        # Work on one contiguous ndarray instead of repeated pandas reductions
+        returns = df[return_col].dropna().to_numpy(dtype=float)
 
-        if len(returns) == 0:
+        if returns.size == 0:
             return {}
 
         winners = returns[returns > 0]
         losers = returns[returns < 0]
+        avg_win = winners.mean() if winners.size > 0 else 0
+        avg_loss = losers.mean() if losers.size > 0 else 0
 
         return {
-            "count": len(returns),
-            "win_rate": len(winners) / len(returns) * 100 if len(returns) > 0 else 0,
+            "count": returns.size,
+            "win_rate": winners.size / returns.size * 100,
             "avg_return": returns.mean(),
-            "median_return": returns.median(),
-            "avg_win": winners.mean() if len(winners) > 0 else 0,
-            "avg_loss": losers.mean() if len(losers) > 0 else 0,
+            "median_return": np.median(returns),
+            "avg_win": avg_win,
+            "avg_loss": avg_loss,
             "best_trade": returns.max(),
             "worst_trade": returns.min(),
             "win_loss_ratio": (
-                abs(winners.mean() / losers.mean())
-                if len(losers) > 0 and len(winners) > 0
-                else 0
+                abs(avg_win / avg_loss) if losers.size > 0 and winners.size > 0 else 0
             ),
         }
 
@@ -572,6 +1019,34 @@ class WatchlistBacktest:
         print(f"{prefix}Worst Trade: {stats.get('worst_trade', 0):+.2f}%")
 
 
+def _backtest_one(
+    results_dir: Path,
+    file_path: Path,
+    holding_period: int,
+    report_df: pd.DataFrame,
+    price_cache: Dict[str, pd.DataFrame],
+) -> Tuple[List[Dict], List[str]]:
+    """
+    Backtest a single report in a worker process
+
+    Args:
+        results_dir: Path to scanner_results directory
+        file_path: Path to watchlist Excel file
+        holding_period: Days to hold for performance measurement
+        report_df: Already parsed report
+        price_cache: Prefetched ticker -> OHLCV data for this report
+
+    Returns:
+        (records, progress_lines) tuple; records are cheaper to pickle than a
+        DataFrame and progress is printed by the parent in one write
+    """
+    progress = []
+    records = WatchlistBacktest(results_dir).backtest_report_records(
+        file_path, holding_period, report_df, price_cache, progress
+    )
+    return records, progress
+
+
 if __name__ == "__main__":
     import argparse
 
@@ -591,6 +1066,18 @@ if __name__ == "__main__":
         default=10,
         help="Maximum reports to backtest (default: 10)",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Processes for parallel report backtests (default: CPU count)",
+    )
+    parser.add_argument(
+        "--report-timeout",
+        type=float,
+        default=REPORT_TIMEOUT,
+        help=f"Seconds allowed per report in parallel runs (default: {REPORT_TIMEOUT})",
+    )
     parser.add_argument(
         "--results-dir",
         type=str,
@@ -603,7 +1090,11 @@ if __name__ == "__main__":
     # Run backtest
     backtester = WatchlistBacktest(Path(args.results_dir))
     results = backtester.run_backtest(
-        category=args.category, max_reports=args.max_reports, holding_period=args.period
+        category=args.category,
+        max_reports=args.max_reports,
+        holding_period=args.period,
+        max_workers=args.workers,
+        report_timeout=args.report_timeout,
     )
 
     if not results.empty:
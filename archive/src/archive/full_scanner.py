@@ -5,15 +5,72 @@ Only outputs stocks with "FULL HOLD + ADD" signal
 """
 
 import pandas as pd
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from technical_analysis import analyze_ticker
-from datetime import datetime
+import numpy as np
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    as_completed,
+    wait,
+)
+from contextlib import ExitStack
+from functools import partial
+from itertools import islice
+from technical_analysis import (
+    CACHE_DIR,
+    analyze_ticker,
+    compute_universe_indicators,
+    fetch_price_histories,
+)
+from datetime import datetime, timedelta
+from time import perf_counter
+import io
+import json
+import os
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import yfinance as yf
 from pathlib import Path
 import logging
 
 # Configure logging
 logger = logging.getLogger(__name__)
+
+# Error text that means Yahoo throttled the request
+RATE_LIMIT_MARKERS = ("rate limit", "rate_limit", "429", "too many requests")
+
+# Index constituents change rarely, so Wikipedia lists are reused for a week
+TICKER_LIST_TTL_DAYS = 7
+
+# Scan worker threads unless --concurrency / concurrency= says otherwise. The
+# work is mostly waiting on Yahoo (requests are paced globally, so extra threads
+# wait rather than burst), hence the usual I/O-bound default; SCAN_CONCURRENCY
+# overrides it (go higher with a warm cache, keep to 4-8 when cold)
+DEFAULT_SCAN_CONCURRENCY = int(
+    os.environ.get("SCAN_CONCURRENCY", min(32, (os.cpu_count() or 1) + 4))
+)
+
+# Every signal analyze_ticker can return (weekly/daily Larsson state mapping)
+ALL_SIGNALS = [
+    "FULL HOLD + ADD",
+    "HOLD",
+    "HOLD MOST + REDUCE",
+    "SCALE IN",
+    "LIGHT / CASH",
+    "CASH",
+    "REDUCE",
+    "FULL CASH / DEFEND",
+    "UNKNOWN",
+]
+BEARISH_SIGNALS = [
+    "HOLD MOST + REDUCE",
+    "REDUCE",
+    "LIGHT / CASH",
+    "CASH",
+    "FULL CASH / DEFEND",
+]
+
 from reportlab.lib.pagesizes import letter
 from reportlab.lib import colors
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
@@ -28,6 +85,43 @@ from reportlab.platypus import (
     KeepTogether,
 )
 from reportlab.lib.enums import TA_CENTER, TA_LEFT
+from reportlab import rl_config
+
+# Skip reportlab's per-attribute shape validation and keep PDF output
+# reproducible (no embedded timestamps/random ids)
+rl_config.shapeChecking = 0
+rl_config.invariant = 1
+
+# Sample stylesheet shared by all PDF reports (styles are never mutated)
+PDF_STYLES = getSampleStyleSheet()
+
+# Custom report styles (matching portfolio_reports), built once and shared
+PDF_TITLE_STYLE = ParagraphStyle(
+    "CustomTitle",
+    parent=PDF_STYLES["Heading1"],
+    fontSize=24,
+    textColor=colors.HexColor("#2c3e50"),
+    spaceAfter=20,
+    alignment=TA_CENTER,
+)
+
+PDF_SECTION_STYLE = ParagraphStyle(
+    "Section",
+    parent=PDF_STYLES["Heading2"],
+    fontSize=16,
+    textColor=colors.HexColor("#2980b9"),
+    spaceAfter=12,
+    spaceBefore=20,
+)
+
+PDF_SUBSECTION_STYLE = ParagraphStyle(
+    "Subsection",
+    parent=PDF_STYLES["Heading3"],
+    fontSize=12,
+    textColor=colors.HexColor("#34495e"),
+    spaceAfter=6,
+    spaceBefore=10,
+)
 
 
 def safe_print(text):
@@ -150,8 +244,14 @@ def analyze_market_regime(daily_bars=60, weekly_bars=52, as_of_date=None, ticker
     print("=" * 80)
 
     try:
-        # Analyze ETF using same technical analysis
-        qqq_result = analyze_ticker(ticker, daily_bars, weekly_bars, as_of_date)
+        # Analyze ETF using same technical analysis (and the same batched,
+        # history-cached download as the scans instead of full per-ticker fetches)
+        etf_history = fetch_price_histories(
+            [ticker], daily_bars, weekly_bars, as_of_date
+        ).get(ticker, (None, None))
+        qqq_result = analyze_ticker(
+            ticker, daily_bars, weekly_bars, as_of_date, *etf_history
+        )
 
         if "error" in qqq_result:
             print(f"⚠️  WARNING: Could not analyze {ticker}: {qqq_result['error']}")
@@ -251,30 +351,111 @@ def get_score_grade(score):
         return "D"
 
 
+def _make_wiki_session():
+    """Pooled HTTP session for Wikipedia, retrying throttling and server errors"""
+    session = requests.Session()
+    retry = Retry(total=3, backoff_factor=1, status_forcelist=[429, 500, 502, 503, 504])
+    session.mount("https://", HTTPAdapter(max_retries=retry))
+    # Add user agent to avoid 403 Forbidden
+    session.headers["User-Agent"] = (
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
+    )
+    return session
+
+
+# Shared by the index list fetches so back-to-back cache misses reuse one connection
+_wiki_session = _make_wiki_session()
+
+
+def _ticker_list_path(name):
+    """Cache file for an index ticker list (e.g. sp500 -> sp500_tickers.json)"""
+    CACHE_DIR.mkdir(exist_ok=True)
+    return CACHE_DIR / f"{name}_tickers.json"
+
+
+def _load_ticker_list(name, max_age_days=TICKER_LIST_TTL_DAYS):
+    """Load a cached index ticker list, or None if missing or older than max_age_days"""
+    try:
+        with open(_ticker_list_path(name), "r") as f:
+            cached = json.load(f)
+        age = datetime.now() - datetime.fromisoformat(cached["cached_at"])
+        if max_age_days is not None and age > timedelta(days=max_age_days):
+            return None
+        return cached["tickers"]
+    except FileNotFoundError:
+        return None
+    except (IOError, json.JSONDecodeError, KeyError, ValueError) as e:
+        logger.warning(f"Ticker list cache read failed for {name}: {e}")
+        return None
+
+
+def _save_ticker_list(name, tickers):
+    """Save an index ticker list fetched from Wikipedia"""
+    try:
+        with open(_ticker_list_path(name), "w") as f:
+            json.dump({"cached_at": datetime.now().isoformat(), "tickers": tickers}, f)
+    except (IOError, OSError) as e:
+        logger.warning(f"Ticker list cache write failed for {name}: {e}")
+
+
+def _html_table_column(content, column_names):
+    """
+    Read one column from the first HTML table whose header has one of column_names
+
+    Walks the lxml tree directly instead of converting every table on the
+    page to a DataFrame.
+
+    Args:
+        content: HTML page source (bytes)
+        column_names: Header names to look for, in order of preference
+
+    Returns:
+        List of cell texts, or None if no table has a matching column
+    """
+    from lxml import html
+
+    tree = html.fromstring(content)
+    for table in tree.xpath("//table"):
+        header = [th.text_content().strip() for th in table.xpath(".//tr[th][1]/th")]
+        for name in column_names:
+            if name in header:
+                position = header.index(name) + 1
+                return [
+                    cell.text_content().strip()
+                    for cell in table.xpath(
+                        f".//tr[td]/*[self::td or self::th][{position}]"
+                    )
+                ]
+    return None
+
+
 def get_sp500_tickers():
-    """Fetch current S&P 500 ticker list from Wikipedia"""
-    import urllib.request
+    """Fetch current S&P 500 ticker list from Wikipedia (cached for a week)"""
+    cached = _load_ticker_list("sp500")
+    if cached:
+        print(f"[OK] Loaded {len(cached)} S&P 500 tickers (cached)\n")
+        return cached
 
     url = "https://en.wikipedia.org/wiki/List_of_S%26P_500_companies"
 
-    # Add user agent to avoid 403 Forbidden
-    req = urllib.request.Request(url)
-    req.add_header(
-        "User-Agent", "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
-    )
-
     try:
-        with urllib.request.urlopen(req) as response:
-            tables = pd.read_html(response)
-            sp500_table = tables[0]
-            tickers = sp500_table["Symbol"].tolist()
-
-            # Clean up tickers (some have special characters)
-            tickers = [t.replace(".", "-") for t in tickers]
-            print(f"[OK] Loaded {len(tickers)} S&P 500 tickers\n")
-            return tickers
+        response = _wiki_session.get(url, timeout=10)
+        response.raise_for_status()
+        tickers = _html_table_column(response.content, ["Symbol"])
+        if not tickers:
+            raise Exception("No table with 'Symbol' column found")
+
+        # Clean up tickers (some have special characters)
+        tickers = [t.replace(".", "-") for t in tickers]
+        print(f"[OK] Loaded {len(tickers)} S&P 500 tickers\n")
+        _save_ticker_list("sp500", tickers)
+        return tickers
     except Exception as e:
         print(f"[X] Error fetching S&P 500 list: {e}")
+        stale = _load_ticker_list("sp500", max_age_days=None)
+        if stale:
+            print(f"Using last cached list of {len(stale)} tickers...")
+            return stale
         print("Using fallback list of major stocks...")
         # Fallback to major stocks if Wikipedia fails
         return [
@@ -302,37 +483,33 @@ def get_sp500_tickers():
 
 
 def get_nasdaq100_tickers():
-    """Fetch current NASDAQ 100 ticker list from Wikipedia"""
-    import urllib.request
+    """Fetch current NASDAQ 100 ticker list from Wikipedia (cached for a week)"""
+    cached = _load_ticker_list("nasdaq100")
+    if cached:
+        print(f"[OK] Loaded {len(cached)} NASDAQ 100 tickers (cached)\n")
+        return cached
 
     url = "https://en.wikipedia.org/wiki/Nasdaq-100"
 
-    # Add user agent to avoid 403 Forbidden
-    req = urllib.request.Request(url)
-    req.add_header(
-        "User-Agent", "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
-    )
-
     try:
-        with urllib.request.urlopen(req) as response:
-            tables = pd.read_html(response)
-            # Try different table indices and column names
-            for table in tables:
-                if "Ticker" in table.columns:
-                    tickers = table["Ticker"].tolist()
-                    tickers = [t.replace(".", "-") for t in tickers]
-                    print(f"[OK] Loaded {len(tickers)} NASDAQ 100 tickers\n")
-                    return tickers
-                elif "Symbol" in table.columns:
-                    tickers = table["Symbol"].tolist()
-                    tickers = [t.replace(".", "-") for t in tickers]
-                    print(f"[OK] Loaded {len(tickers)} NASDAQ 100 tickers\n")
-                    return tickers
-
-            # If no matching table found
+        response = _wiki_session.get(url, timeout=10)
+        response.raise_for_status()
+        # First table with a ticker column, whichever header name it uses
+        tickers = _html_table_column(response.content, ["Ticker", "Symbol"])
+
+        if not tickers:
             raise Exception("No table with 'Ticker' or 'Symbol' column found")
+
+        tickers = [t.replace(".", "-") for t in tickers]
+        print(f"[OK] Loaded {len(tickers)} NASDAQ 100 tickers\n")
+        _save_ticker_list("nasdaq100", tickers)
+        return tickers
     except Exception as e:
         print(f"[X] Error fetching NASDAQ 100 list: {e}")
+        stale = _load_ticker_list("nasdaq100", max_age_days=None)
+        if stale:
+            print(f"Using last cached list of {len(stale)} tickers...")
+            return stale
         print("Using fallback list of major tech stocks...")
         # Fallback to major tech stocks if Wikipedia fails
         return [
@@ -457,14 +634,47 @@ def get_portfolio_tickers():
         return []
 
 
+def _run_windowed(*lanes):
+    """
+    Run (key, callable) jobs with at most `window` submitted at a time per lane
+
+    Args:
+        *lanes: (executor, jobs, window) tuples, where jobs is an iterable of
+                (key, zero-argument callable) consumed lazily and window is the
+                maximum number of submitted, unfinished jobs on that executor
+
+    Yields:
+        (key, future) pairs in completion order across all lanes
+    """
+    lanes = [(executor, iter(jobs), window) for executor, jobs, window in lanes]
+    pending = {}  # future -> (key, lane index)
+
+    def submit(lane, count):
+        executor, jobs, _ = lanes[lane]
+        for key, job in islice(jobs, count):
+            pending[executor.submit(job)] = (key, lane)
+
+    for lane, (_, _, window) in enumerate(lanes):
+        submit(lane, window)
+    while pending:
+        done, _ = wait(pending, return_when=FIRST_COMPLETED)
+        for future in done:
+            key, lane = pending.pop(future)
+            # Refill that lane's window before handing the result back
+            submit(lane, 1)
+            yield key, future
+
+
 def scan_stocks(
     tickers,
     category="stocks",
     daily_bars=60,
     weekly_bars=52,
-    concurrency=2,
+    concurrency=None,
     as_of_date=None,
     regime=None,
+    histories=None,
+    process_pool=None,
 ):
     """
     Scan a list of stocks for buy opportunities
@@ -474,16 +684,26 @@ def scan_stocks(
         category: Label for this scan (e.g., 'S&P 500', 'NASDAQ 100', 'Portfolio')
         daily_bars: Number of daily bars to analyze
         weekly_bars: Number of weekly bars to analyze
-        concurrency: Number of concurrent API requests (default 2 to avoid rate limits)
+        concurrency: Worker threads (default DEFAULT_SCAN_CONCURRENCY; Yahoo requests
+                     are paced globally, with backoff on 429s)
         as_of_date: Optional date string (YYYY-MM-DD) for historical simulation
         regime: Market regime dict from analyze_market_regime() (optional but recommended)
+        histories: Optional prefetched {ticker: (daily_df, weekly_df)} shared by
+                   several scans (see fetch_price_histories); downloaded here if None
+        process_pool: Optional ProcessPoolExecutor for historical analysis, shared
+                      by concurrent or repeated scans; a private one is started
+                      only when needed if None
 
     Returns:
-        DataFrame with results sorted by signal strength
+        DataFrame with results sorted by ticker
     """
-    results = []
-    buy_signals = []  # Track FULL HOLD + ADD signals
+    concurrency = concurrency or DEFAULT_SCAN_CONCURRENCY
     total = len(tickers)
+    # Per-field column buffers, one slot per ticker, filled as results arrive
+    # (missing fields stay NaN, as pd.DataFrame(list_of_dicts) would give)
+    columns = {}
+    analyzed = 0
+    buy_count = 0  # FULL HOLD + ADD signals
     completed = 0
     rate_limit_errors = 0  # Track rate limit hits
 
@@ -500,25 +720,82 @@ def scan_stocks(
     )
     print("=" * 80)
 
-    with ThreadPoolExecutor(max_workers=concurrency) as executor:
-        # Submit all jobs
-        future_to_ticker = {
-            executor.submit(
-                analyze_ticker, ticker, daily_bars, weekly_bars, as_of_date
-            ): ticker
-            for ticker in tickers
-        }
+    # Download price history in batches up front (cached tickers are skipped),
+    # unless the caller already fetched it for several scans at once
+    if histories is None:
+        histories = fetch_price_histories(tickers, daily_bars, weekly_bars, as_of_date)
+    else:
+        histories = {t: histories[t] for t in tickers if t in histories}
+    if histories:
+        print(f"[OK] Prefetched price history for {len(histories)} tickers")
+
+    # Indicators for all prefetched tickers in one vectorized pass
+    indicators = compute_universe_indicators(histories)
+
+    # Jobs are handed out through a bounded window instead of queueing every
+    # ticker at once; request pacing itself lives in technical_analysis
+    def jobs(selected):
+        return (
+            (
+                ticker,
+                partial(
+                    analyze_ticker,
+                    ticker,
+                    daily_bars,
+                    weekly_bars,
+                    as_of_date,
+                    *histories.get(ticker, (None, None)),
+                    indicators.get(ticker),
+                ),
+            )
+            for ticker in selected
+        )
 
-        # Process results as they complete
-        for future in as_completed(future_to_ticker):
-            ticker = future_to_ticker[future]
+    # Historical scans on prefetched history make no requests, so that
+    # analysis is pure CPU work and runs in worker processes (one per core)
+    # rather than in threads contending for the GIL
+    cpu_count = os.cpu_count() or 1
+    offline = set(histories) if as_of_date and cpu_count > 1 else set()
+    online_tickers = [t for t in tickers if t not in offline]
+    offline_tickers = [t for t in tickers if t in offline]
+
+    progress = []  # Console lines, flushed every 50 results
+
+    with ExitStack() as stack:
+        lanes = []
+        if offline_tickers:
+            if process_pool is None:
+                process_pool = stack.enter_context(
+                    ProcessPoolExecutor(
+                        max_workers=min(cpu_count, len(offline_tickers))
+                    )
+                )
+                # Start the workers now, before this scan's threads exist
+                process_pool.submit(int).result()
+            lanes.append((process_pool, jobs(offline_tickers), cpu_count * 2))
+        executor = stack.enter_context(ThreadPoolExecutor(max_workers=concurrency))
+        lanes.append((executor, jobs(online_tickers), concurrency * 2))
+
+        # Process results as they complete; network fallbacks on the threads
+        # and CPU work in the processes drain side by side
+        for ticker, future in _run_windowed(*lanes):
             completed += 1
 
             try:
                 result = future.result()
 
-                if "error" not in result:
-                    results.append(result)
+                if "error" in result:
+                    # Requests are retried with backoff inside analyze_ticker,
+                    # so anything left here was still throttled afterwards
+                    error_msg = str(result["error"]).lower()
+                    if any(marker in error_msg for marker in RATE_LIMIT_MARKERS):
+                        rate_limit_errors += 1
+                else:
+                    for field, value in result.items():
+                        if field not in columns:
+                            columns[field] = [np.nan] * total
+                        columns[field][analyzed] = value
+                    analyzed += 1
                     signal = result.get("signal", "N/A")
 
                     # Print FULL HOLD + ADD signals with entry quality
@@ -529,10 +806,10 @@ def scan_stocks(
                         entry_flag = result.get("entry_flag", "")
 
                         # Show entry quality (stop-aware) instead of just buy quality
-                        print(
+                        progress.append(
                             f"[OK] [{completed}/{total}] {ticker:6s} -> {signal:20s} ${price:,.2f} | Entry: {entry_quality:10s} {entry_flag}"
                         )
-                        buy_signals.append(result)
+                        buy_count += 1
                     # Print bearish signals with short entry quality
                     elif signal in [
                         "REDUCE",
@@ -544,47 +821,56 @@ def scan_stocks(
                         short_entry_quality = result.get("short_entry_quality", "N/A")
                         short_entry_flag = result.get("short_entry_flag", "")
 
-                        print(
+                        progress.append(
                             f"[SELL] [{completed}/{total}] {ticker:6s} -> {signal:20s} ${price:,.2f} | Entry: {short_entry_quality:10s} {short_entry_flag}"
                         )
                     elif completed % 50 == 0:  # Progress update
-                        print(f"  [{completed}/{total}] Scanning...")
+                        progress.append(f"  [{completed}/{total}] Scanning...")
 
             except Exception as e:
                 error_msg = str(e).lower()
-                if (
-                    "rate limit" in error_msg
-                    or "429" in error_msg
-                    or "too many requests" in error_msg
-                ):
+                if any(marker in error_msg for marker in RATE_LIMIT_MARKERS):
                     rate_limit_errors += 1
                 if completed % 50 == 0:
-                    print(f"  [{completed}/{total}] Scanning...")
+                    progress.append(f"  [{completed}/{total}] Scanning...")
+
+            # Write the buffered lines in blocks rather than one print per
+            # result while futures are still completing
+            if completed % 50 == 0 and progress:
+                print("\n".join(progress))
+                progress.clear()
+
+    if progress:
+        print("\n".join(progress))
 
     print("=" * 80)
     print(
-        f"\n[OK] Scan complete: {len(results)} analyzed, {len(buy_signals)} FULL HOLD + ADD signals found\n"
+        f"\n[OK] Scan complete: {analyzed} analyzed, {buy_count} FULL HOLD + ADD signals found\n"
     )
 
     # Rate limit warning
     if rate_limit_errors > 0:
-        print(f"[!] WARNING: {rate_limit_errors} rate limit errors detected!")
         print(
-            f"   Yahoo Finance may be blocking requests. Wait 5-10 minutes before next scan.\n"
+            f"[!] WARNING: {rate_limit_errors} tickers still rate limited after automatic retries"
         )
-    elif len(results) == 0 and total > 0:
+        print(f"   Re-run the scan to pick them up (cached tickers are skipped).\n")
+    elif analyzed == 0 and total > 0:
         print(f"[!] WARNING: No results returned from {total} tickers!")
-        print(f"   This usually indicates Yahoo Finance rate limiting.")
-        print(f"   Wait 5-10 minutes before retrying.\n")
+        print(f"   This usually indicates Yahoo Finance rate limiting.\n")
 
     # Convert to DataFrame
-    if not results:
+    if not analyzed:
         print("No results found.")
         return pd.DataFrame()
 
-    df = pd.DataFrame(results)
+    # Sort once here; filters and report writers keep this ticker order
+    df = pd.DataFrame(
+        {field: values[:analyzed] for field, values in columns.items()}
+    ).sort_values("ticker", kind="stable")
+    # Categorical signal: the ==/isin signal filters compare integer codes
+    df["signal"] = pd.Categorical(df["signal"], categories=ALL_SIGNALS)
 
-    return df
+    return df.reset_index(drop=True)
 
 
 def filter_buy_signals(
@@ -610,7 +896,7 @@ def filter_buy_signals(
         regime: Market regime dict from analyze_market_regime() (mandatory)
 
     Returns:
-        Filtered DataFrame sorted by ticker
+        Filtered DataFrame (in the ticker order from scan_stocks)
     """
     if df.empty:
         return df
@@ -629,62 +915,50 @@ def filter_buy_signals(
         print(f"   Market is in {regime['tier']} mode: {regime['message']}")
         return pd.DataFrame()  # Return empty DataFrame
 
-    # Filter by signal
-    filtered = df[df["signal"] == signal].copy()
+    # Build a single row mask and select with it once at the end
+    mask = df["signal"] == signal
 
     # Defensive validation: Ensure no bearish signals in buy results
-    if not filtered.empty:
-        bearish_signals = [
-            "HOLD MOST + REDUCE",
-            "REDUCE",
-            "LIGHT / CASH",
-            "CASH",
-            "FULL CASH / DEFEND",
-        ]
-        bearish_stocks = filtered[filtered["signal"].isin(bearish_signals)]
-        if not bearish_stocks.empty:
-            tickers = ", ".join(bearish_stocks["ticker"].tolist())
-            raise ValueError(
-                f"ERROR: Bearish signal stocks found in buy signals: {tickers}. "
-                "This should never happen - signal classification is broken!"
-            )
+    bearish = mask & df["signal"].isin(BEARISH_SIGNALS)
+    if bearish.any():
+        tickers = ", ".join(df.loc[bearish, "ticker"].tolist())
+        raise ValueError(
+            f"ERROR: Bearish signal stocks found in buy signals: {tickers}. "
+            "This should never happen - signal classification is broken!"
+        )
 
     # Apply regime-based filtering
-    if quality_filter and not filtered.empty:
+    if quality_filter:
         filter_mode = regime.get("filter_mode", "normal")
+        if use_entry_quality and "entry_quality" in df.columns:
+            quality = df["entry_quality"]
+        elif "buy_quality" in df.columns:
+            quality = df["buy_quality"]
+        else:
+            quality = None
 
         # GREEN: Normal filtering (EXCELLENT, GOOD, OK)
         if filter_mode == "normal":
-            if use_entry_quality and "entry_quality" in filtered.columns:
-                filtered = filtered[
-                    filtered["entry_quality"].isin(["EXCELLENT", "GOOD", "OK"])
-                ]
-            elif "buy_quality" in filtered.columns:
-                filtered = filtered[
-                    filtered["buy_quality"].isin(["EXCELLENT", "GOOD", "OK"])
-                ]
+            if quality is not None:
+                mask &= quality.isin(["EXCELLENT", "GOOD", "OK"])
 
         # YELLOW: Ultra-strict filtering (EXCELLENT + SAFE ENTRY + 3:1+ Vol R:R only)
         elif filter_mode == "strict":
             # Must have EXCELLENT entry quality
-            if use_entry_quality and "entry_quality" in filtered.columns:
-                filtered = filtered[filtered["entry_quality"] == "EXCELLENT"]
-            elif "buy_quality" in filtered.columns:
-                filtered = filtered[filtered["buy_quality"] == "EXCELLENT"]
+            if quality is not None:
+                mask &= quality == "EXCELLENT"
 
             # Must have SAFE ENTRY flag
-            if "entry_flag" in filtered.columns:
-                filtered = filtered[
-                    filtered["entry_flag"].str.contains(
-                        "SAFE ENTRY", case=False, na=False
-                    )
-                ]
+            if "entry_flag" in df.columns:
+                mask &= df["entry_flag"].str.contains(
+                    "SAFE ENTRY", case=False, na=False
+                )
 
             # Must have Vol R:R >= 3.0
-            if "vol_rr" in filtered.columns:
-                filtered = filtered[filtered["vol_rr"] >= 3.0]
+            if "vol_rr" in df.columns:
+                mask &= df["vol_rr"] >= 3.0
 
-    return filtered.sort_values("ticker")
+    return df.loc[mask].copy()
 
 
 def filter_sell_signals(df, quality_filter=False):
@@ -698,20 +972,13 @@ def filter_sell_signals(df, quality_filter=False):
                        Default False to match portfolio_analysis (all bearish signals)
 
     Returns:
-        Filtered DataFrame sorted by ticker
+        Filtered DataFrame (in the ticker order from scan_stocks)
     """
     if df.empty:
         return df
 
     # Filter for bearish signals (same as determine_portfolio_action in technical_analysis.py)
-    bearish_signals = [
-        "HOLD MOST + REDUCE",
-        "REDUCE",
-        "LIGHT / CASH",
-        "CASH",
-        "FULL CASH / DEFEND",
-    ]
-    filtered = df[df["signal"].isin(bearish_signals)].copy()
+    filtered = df[df["signal"].isin(BEARISH_SIGNALS)].copy()
 
     # Defensive validation: Ensure no FULL HOLD + ADD stocks in sell signals
     if not filtered.empty:
@@ -727,7 +994,7 @@ def filter_sell_signals(df, quality_filter=False):
     if quality_filter and "r1_quality" in filtered.columns:
         filtered = filtered[filtered["r1_quality"].isin(["STRONG", "MODERATE"])]
 
-    return filtered.sort_values("ticker")
+    return filtered
 
 
 def cleanup_old_scans(results_dir, max_files=1, archive_retention_days=60):
@@ -742,6 +1009,8 @@ def cleanup_old_scans(results_dir, max_files=1, archive_retention_days=60):
         archive_retention_days: Days to keep files in archive before deletion
     """
     from datetime import datetime, timedelta
+    import fnmatch
+    import os
     import time
     import re
 
@@ -757,18 +1026,21 @@ def cleanup_old_scans(results_dir, max_files=1, archive_retention_days=60):
             "sp500_playbook_*.pdf",
             "sp500_watchlist_*.xlsx",
             "sp500_watchlist_*.pdf",
+            "sp500_watchlist_*.parquet",
         ],
         "nasdaq100": [
             "nasdaq100_playbook_*.xlsx",
             "nasdaq100_playbook_*.pdf",
             "nasdaq100_watchlist_*.xlsx",
             "nasdaq100_watchlist_*.pdf",
+            "nasdaq100_watchlist_*.parquet",
         ],
         "portfolio": [
             "portfolio_playbook_*.xlsx",
             "portfolio_playbook_*.pdf",
             "portfolio_watchlist_*.xlsx",
             "portfolio_watchlist_*.pdf",
+            "portfolio_watchlist_*.parquet",
         ],
     }
 
@@ -781,18 +1053,20 @@ def cleanup_old_scans(results_dir, max_files=1, archive_retention_days=60):
         cat_archive_dir = archive_dir / cat_name
         cat_archive_dir.mkdir(parents=True, exist_ok=True)
 
-        # Group files by timestamp (YYYYMMDD_HHMM)
+        # Group files by timestamp (YYYYMMDD_HHMM), listing the folder once
         timestamp_groups = {}
 
-        for pattern in patterns:
-            for file_path in cat_dir.glob(pattern):
+        with os.scandir(cat_dir) as entries:
+            for entry in entries:
+                if not any(fnmatch.fnmatch(entry.name, p) for p in patterns):
+                    continue
                 # Extract timestamp from filename (e.g., 20260111_1844)
-                match = re.search(r"(\d{8}_\d{4})", file_path.name)
+                match = re.search(r"(\d{8}_\d{4})", entry.name)
                 if match:
                     timestamp = match.group(1)
                     if timestamp not in timestamp_groups:
                         timestamp_groups[timestamp] = []
-                    timestamp_groups[timestamp].append(file_path)
+                    timestamp_groups[timestamp].append(Path(entry.path))
 
         # Sort timestamps (newest first)
         sorted_timestamps = sorted(timestamp_groups.keys(), reverse=True)
@@ -821,19 +1095,32 @@ def cleanup_old_scans(results_dir, max_files=1, archive_retention_days=60):
     )  # 86400 seconds per day
     deleted_count = 0
 
-    # Check all category subfolders in archive
-    for cat_archive_dir in archive_dir.glob("*/"):
-        if cat_archive_dir.is_dir():
-            for archive_file in cat_archive_dir.glob("*"):
-                if (
-                    archive_file.is_file()
-                    and archive_file.stat().st_mtime < cutoff_time
-                ):
-                    try:
-                        archive_file.unlink()
-                        deleted_count += 1
-                    except Exception as e:
-                        print(f"  [WARNING] Could not delete {archive_file.name}: {e}")
+    # Check all category subfolders in archive (DirEntry caches file type/stat)
+    with os.scandir(archive_dir) as cat_entries:
+        cat_archive_dirs = [entry.path for entry in cat_entries if entry.is_dir()]
+    stale = []
+    for cat_archive_dir in cat_archive_dirs:
+        with os.scandir(cat_archive_dir) as entries:
+            stale.extend(
+                entry
+                for entry in entries
+                if entry.is_file() and entry.stat().st_mtime < cutoff_time
+            )
+
+    def delete(entry):
+        try:
+            os.unlink(entry.path)
+        except Exception as e:
+            return e
+
+    # unlink() releases the GIL, so a large backlog is deleted in parallel
+    if stale:
+        with ThreadPoolExecutor(max_workers=min(8, len(stale))) as pool:
+            for entry, error in zip(stale, pool.map(delete, stale)):
+                if error is None:
+                    deleted_count += 1
+                else:
+                    print(f"  [WARNING] Could not delete {entry.name}: {error}")
 
     if deleted_count > 0:
         print(
@@ -1070,7 +1357,9 @@ def create_best_trades_excel(buy_df, sell_df, output_file, category=""):
                     reward / suggested_stop if suggested_stop > 0 and reward > 0 else 0
                 )
 
-            buy_df["vol_rr"] = buy_df.apply(calc_vol_rr, axis=1)
+            buy_df["vol_rr"] = [
+                calc_vol_rr(row) for row in buy_df.to_dict(orient="records")
+            ]
 
             # Sort by Vol R:R (highest first), take top 20
             buy_df = buy_df.sort_values("vol_rr", ascending=False).head(20)
@@ -1117,8 +1406,9 @@ def create_best_trades_excel(buy_df, sell_df, output_file, category=""):
                 cell.alignment = center_align
 
             # Data rows
+            # Plain dicts (no per-row Series), converted in one call
             row = 5
-            for _, stock in buy_df.iterrows():
+            for stock in buy_df.to_dict(orient="records"):
                 price = stock.get("current_price", 0)
                 s1 = stock.get("s1", 0)
                 r1 = stock.get("r1", 0)
@@ -1170,15 +1460,8 @@ def create_best_trades_excel(buy_df, sell_df, output_file, category=""):
                 ws_buy.cell(row, 17, stock.get("volatility_class", ""))
                 row += 1
 
-            # Auto-size columns
-            for col in ws_buy.columns:
-                max_length = 12
-                for cell in col:
-                    if cell.value:
-                        max_length = max(max_length, len(str(cell.value)))
-                ws_buy.column_dimensions[col[0].column_letter].width = min(
-                    max_length + 2, 50
-                )
+            # Auto-size columns from the written values (no per-cell objects)
+            _set_column_widths(ws_buy, ws_buy.iter_cols(values_only=True), min_width=12)
 
     # === TAB 2: TOP SELL SETUPS ===
     if not sell_df.empty:
@@ -1207,7 +1490,9 @@ def create_best_trades_excel(buy_df, sell_df, output_file, category=""):
                     reward / suggested_stop if suggested_stop > 0 and reward > 0 else 0
                 )
 
-            sell_df["vol_rr"] = sell_df.apply(calc_vol_rr, axis=1)
+            sell_df["vol_rr"] = [
+                calc_vol_rr(row) for row in sell_df.to_dict(orient="records")
+            ]
 
             # Sort by Vol R:R (highest first), take top 20
             sell_df = sell_df.sort_values("vol_rr", ascending=False).head(20)
@@ -1252,8 +1537,9 @@ def create_best_trades_excel(buy_df, sell_df, output_file, category=""):
                 cell.alignment = center_align
 
             # Data rows
+            # Plain dicts (no per-row Series), converted in one call
             row = 5
-            for _, stock in sell_df.iterrows():
+            for stock in sell_df.to_dict(orient="records"):
                 price = stock.get("current_price", 0)
                 r1 = stock.get("r1", 0)
                 s1 = stock.get("s1", 0)
@@ -1306,15 +1592,10 @@ def create_best_trades_excel(buy_df, sell_df, output_file, category=""):
                 ws_sell.cell(row, 17, stock.get("volatility_class", ""))
                 row += 1
 
-            # Auto-size columns
-            for col in ws_sell.columns:
-                max_length = 12
-                for cell in col:
-                    if cell.value:
-                        max_length = max(max_length, len(str(cell.value)))
-                ws_sell.column_dimensions[col[0].column_letter].width = min(
-                    max_length + 2, 50
-                )
+            # Auto-size columns from the written values (no per-cell objects)
+            _set_column_widths(
+                ws_sell, ws_sell.iter_cols(values_only=True), min_width=12
+            )
 
     # === TAB 3: SUMMARY ===
     ws_summary = wb.create_sheet("Summary", 0)  # Insert at beginning
@@ -1351,6 +1632,65 @@ def create_best_trades_excel(buy_df, sell_df, output_file, category=""):
     print(f"[OK] Best Trades Excel created: {output_file}")
 
 
+def _sheet_columns(df, fields):
+    """
+    Collect worksheet columns so rows can be written without per-cell lookups
+
+    Args:
+        df: DataFrame to export (rows are written in DataFrame order)
+        fields: Column names in output order; a (column, default) tuple writes
+                default when the column is missing (plain names default to None)
+
+    Returns:
+        List of per-column value sequences (zip(*columns) gives the rows)
+    """
+    columns = []
+    for field in fields:
+        name, default = field if isinstance(field, tuple) else (field, None)
+        columns.append(df[name] if name in df.columns else [default] * len(df))
+    return columns
+
+
+def _set_column_widths(ws, columns, min_width=0, max_width=50):
+    """
+    Size worksheet columns from the values written to them, one pass per column
+
+    Args:
+        ws: openpyxl worksheet
+        columns: Per-column value sequences (titles, header and data)
+        min_width: Smallest content width before padding
+        max_width: Largest column width
+    """
+    from openpyxl.utils import get_column_letter
+
+    for col_num, values in enumerate(columns, 1):
+        lengths = pd.Series(values, dtype=object).dropna().astype(str).str.len()
+        width = max(min_width, lengths.max() if len(lengths) else 0)
+        ws.column_dimensions[get_column_letter(col_num)].width = min(
+            width + 2, max_width
+        )
+
+
+def _styled_cell(ws, value, **styles):
+    """
+    Build a write-only worksheet cell with styles applied inline
+
+    Args:
+        ws: Write-only openpyxl worksheet
+        value: Cell value
+        **styles: Cell style attributes (font, fill, border, alignment)
+
+    Returns:
+        WriteOnlyCell ready for ws.append()
+    """
+    from openpyxl.cell import WriteOnlyCell
+
+    cell = WriteOnlyCell(ws, value=value)
+    for name, style in styles.items():
+        setattr(cell, name, style)
+    return cell
+
+
 def create_excel_output(buy_df, sell_df, output_file, category=""):
     """
     Create Excel workbook with tabs for buy and sell opportunities.
@@ -1365,9 +1705,8 @@ def create_excel_output(buy_df, sell_df, output_file, category=""):
     from openpyxl import Workbook
     from openpyxl.styles import Font, PatternFill, Alignment
 
-    wb = Workbook()
-    if "Sheet" in wb.sheetnames:
-        del wb["Sheet"]
+    # Write-only workbook: rows stream to disk, so widths are set before rows
+    wb = Workbook(write_only=True)
 
     # Define styles (matching portfolio_reports)
     header_fill = PatternFill(
@@ -1381,10 +1720,8 @@ def create_excel_output(buy_df, sell_df, output_file, category=""):
         ws_buy = wb.create_sheet("Buy Setups")
 
         # Title
-        ws_buy.cell(1, 1, f"{category} - BUY SETUPS").font = Font(bold=True, size=14)
-        ws_buy.cell(
-            2, 1, f"FULL HOLD + ADD signals with EXCELLENT/GOOD/OK quality"
-        ).font = Font(italic=True, color="666666")
+        buy_title = f"{category} - BUY SETUPS"
+        buy_subtitle = f"FULL HOLD + ADD signals with EXCELLENT/GOOD/OK quality"
 
         # Headers at row 4
         buy_headers = [
@@ -1410,57 +1747,66 @@ def create_excel_output(buy_df, sell_df, output_file, category=""):
             "Accessible Supports",
         ]
 
-        for col_num, header in enumerate(buy_headers, 1):
-            cell = ws_buy.cell(4, col_num)
-            cell.value = header
-            cell.fill = header_fill
-            cell.font = header_font
-            cell.alignment = center_align
-
-        # Data rows
-        row = 5
-        for _, stock in buy_df.sort_values("ticker").iterrows():
-            ws_buy.cell(row, 1, stock["ticker"])
-            ws_buy.cell(row, 2, stock.get("current_price"))
-            ws_buy.cell(row, 3, stock["signal"])
-            ws_buy.cell(row, 4, stock.get("entry_quality", stock.get("buy_quality")))
-            ws_buy.cell(row, 5, stock.get("entry_flag", ""))
-            ws_buy.cell(row, 6, stock.get("rsi"))
-            ws_buy.cell(row, 7, stock.get("bb_upper"))
-            ws_buy.cell(row, 8, stock.get("bb_middle"))
-            ws_buy.cell(row, 9, stock.get("bb_lower"))
-            ws_buy.cell(row, 10, stock.get("s1"))
-            ws_buy.cell(row, 11, stock.get("s2"))
-            ws_buy.cell(row, 12, stock.get("s3"))
-            ws_buy.cell(row, 13, stock.get("r1"))
-            ws_buy.cell(row, 14, stock.get("r2"))
-            ws_buy.cell(row, 15, stock.get("r3"))
-            ws_buy.cell(row, 16, stock.get("d50"))
-            ws_buy.cell(row, 17, stock.get("d100"))
-            ws_buy.cell(row, 18, stock.get("d200"))
-            ws_buy.cell(row, 19, stock.get("stop_level"))
-            ws_buy.cell(row, 20, stock.get("accessible_supports_count"))
-            row += 1
-
-        # Auto-size columns
-        for col in ws_buy.columns:
-            max_length = 12
-            for cell in col:
-                if cell.value:
-                    max_length = max(max_length, len(str(cell.value)))
-            ws_buy.column_dimensions[col[0].column_letter].width = min(
-                max_length + 2, 50
-            )
+        # Data rows (from row 5, straight from the columns)
+        quality_col = (
+            "entry_quality" if "entry_quality" in buy_df.columns else "buy_quality"
+        )
+        buy_fields = [
+            "ticker",
+            "current_price",
+            "signal",
+            quality_col,
+            ("entry_flag", ""),
+            "rsi",
+            "bb_upper",
+            "bb_middle",
+            "bb_lower",
+            "s1",
+            "s2",
+            "s3",
+            "r1",
+            "r2",
+            "r3",
+            "d50",
+            "d100",
+            "d200",
+            "stop_level",
+            "accessible_supports_count",
+        ]
+        buy_columns = _sheet_columns(buy_df, buy_fields)
+
+        # Auto-size columns from the values to be written (title is in column A)
+        buy_widths = [[header, *col] for header, col in zip(buy_headers, buy_columns)]
+        buy_widths[0] += [buy_title, buy_subtitle]
+        _set_column_widths(ws_buy, buy_widths, min_width=12)
+
+        ws_buy.append([_styled_cell(ws_buy, buy_title, font=Font(bold=True, size=14))])
+        ws_buy.append(
+            [_styled_cell(ws_buy, buy_subtitle, font=Font(italic=True, color="666666"))]
+        )
+        ws_buy.append([])
+        ws_buy.append(
+            [
+                _styled_cell(
+                    ws_buy,
+                    header,
+                    fill=header_fill,
+                    font=header_font,
+                    alignment=center_align,
+                )
+                for header in buy_headers
+            ]
+        )
+        for row in zip(*buy_columns):
+            ws_buy.append(row)
 
     # === TAB 2: SELL SETUPS ===
     if not sell_df.empty:
         ws_sell = wb.create_sheet("Sell Setups")
 
         # Title
-        ws_sell.cell(1, 1, f"{category} - SELL SETUPS").font = Font(bold=True, size=14)
-        ws_sell.cell(2, 1, f"Bearish signals - reduce exposure").font = Font(
-            italic=True, color="666666"
-        )
+        sell_title = f"{category} - SELL SETUPS"
+        sell_subtitle = f"Bearish signals - reduce exposure"
 
         # Headers at row 4
         sell_headers = [
@@ -1482,43 +1828,59 @@ def create_excel_output(buy_df, sell_df, output_file, category=""):
             "D200 MA",
         ]
 
-        for col_num, header in enumerate(sell_headers, 1):
-            cell = ws_sell.cell(4, col_num)
-            cell.value = header
-            cell.fill = header_fill
-            cell.font = header_font
-            cell.alignment = center_align
-
-        # Data rows
-        row = 5
-        for _, stock in sell_df.sort_values("ticker").iterrows():
-            ws_sell.cell(row, 1, stock["ticker"])
-            ws_sell.cell(row, 2, stock.get("current_price"))
-            ws_sell.cell(row, 3, stock["signal"])
-            ws_sell.cell(row, 4, stock.get("short_entry_quality", "N/A"))
-            ws_sell.cell(row, 5, stock.get("short_entry_flag", ""))
-            ws_sell.cell(row, 6, stock.get("rsi"))
-            ws_sell.cell(row, 7, stock.get("bb_upper"))
-            ws_sell.cell(row, 8, stock.get("bb_middle"))
-            ws_sell.cell(row, 9, stock.get("bb_lower"))
-            ws_sell.cell(row, 10, stock.get("r1_quality"))
-            ws_sell.cell(row, 11, stock.get("r1"))
-            ws_sell.cell(row, 12, stock.get("r2"))
-            ws_sell.cell(row, 13, stock.get("r3"))
-            ws_sell.cell(row, 14, stock.get("d50"))
-            ws_sell.cell(row, 15, stock.get("d100"))
-            ws_sell.cell(row, 16, stock.get("d200"))
-            row += 1
-
-        # Auto-size columns
-        for col in ws_sell.columns:
-            max_length = 12
-            for cell in col:
-                if cell.value:
-                    max_length = max(max_length, len(str(cell.value)))
-            ws_sell.column_dimensions[col[0].column_letter].width = min(
-                max_length + 2, 50
-            )
+        # Data rows (from row 5, straight from the columns)
+        sell_fields = [
+            "ticker",
+            "current_price",
+            "signal",
+            ("short_entry_quality", "N/A"),
+            ("short_entry_flag", ""),
+            "rsi",
+            "bb_upper",
+            "bb_middle",
+            "bb_lower",
+            "r1_quality",
+            "r1",
+            "r2",
+            "r3",
+            "d50",
+            "d100",
+            "d200",
+        ]
+        sell_columns = _sheet_columns(sell_df, sell_fields)
+
+        # Auto-size columns from the values to be written (title is in column A)
+        sell_widths = [
+            [header, *col] for header, col in zip(sell_headers, sell_columns)
+        ]
+        sell_widths[0] += [sell_title, sell_subtitle]
+        _set_column_widths(ws_sell, sell_widths, min_width=12)
+
+        ws_sell.append(
+            [_styled_cell(ws_sell, sell_title, font=Font(bold=True, size=14))]
+        )
+        ws_sell.append(
+            [
+                _styled_cell(
+                    ws_sell, sell_subtitle, font=Font(italic=True, color="666666")
+                )
+            ]
+        )
+        ws_sell.append([])
+        ws_sell.append(
+            [
+                _styled_cell(
+                    ws_sell,
+                    header,
+                    fill=header_fill,
+                    font=header_font,
+                    alignment=center_align,
+                )
+                for header in sell_headers
+            ]
+        )
+        for row in zip(*sell_columns):
+            ws_sell.append(row)
 
     # Save workbook
     wb.save(output_file)
@@ -1530,6 +1892,20 @@ def create_excel_output(buy_df, sell_df, output_file, category=""):
         print(f"  - Sell Setups: {len(sell_df)} stocks")
 
 
+# Portfolio workbook column order (only columns used in portfolio PDF report)
+PORTFOLIO_EXCEL_COLUMNS = (
+    "ticker",
+    "signal",
+    "current_price",
+    "s1",
+    "s2",
+    "s3",  # Support levels (Zones)
+    "r1",
+    "r2",
+    "r3",  # Resistance levels (Targets)
+)
+
+
 def create_portfolio_excel(all_df, output_file, category="Portfolio"):
     """
     Create Excel workbook for portfolio with ALL stocks organized by signal
@@ -1543,74 +1919,68 @@ def create_portfolio_excel(all_df, output_file, category="Portfolio"):
         print(f"No data to export to Excel for {category}")
         return
 
-    # Define column order (only columns used in portfolio PDF report)
-    columns = [
-        "ticker",
-        "signal",
-        "current_price",
-        "s1",
-        "s2",
-        "s3",  # Support levels (Zones)
-        "r1",
-        "r2",
-        "r3",  # Resistance levels (Targets)
-    ]
-
     # Keep only columns that exist in the dataframe
-    available_cols = [col for col in columns if col in all_df.columns]
-
-    # Sort alphabetically by ticker
-    all_df = all_df.sort_values("ticker")
-
-    # Filter by signal (matching portfolio PDF format exactly)
-    df_full_hold_add = all_df[all_df["signal"] == "FULL HOLD + ADD"][
-        available_cols
-    ].copy()
-    df_hold_reduce = all_df[all_df["signal"] == "HOLD MOST + REDUCE"][
-        available_cols
-    ].copy()
-    df_hold = all_df[all_df["signal"] == "HOLD"][available_cols].copy()
-    df_cash = all_df[all_df["signal"] == "CASH"][available_cols].copy()
-    df_all = all_df[available_cols].copy()
-
-    # Create Excel writer
-    with pd.ExcelWriter(output_file, engine="openpyxl") as writer:
-        # Sheet 1: All stocks
-        df_all.to_excel(writer, sheet_name="All", index=False)
-
-        # Sheet 2: FULL HOLD + ADD (detailed in PDF)
-        df_full_hold_add.to_excel(writer, sheet_name="FULL HOLD + ADD", index=False)
-
-        # Sheet 3: HOLD MOST + REDUCE (summary in PDF)
-        df_hold_reduce.to_excel(writer, sheet_name="HOLD + REDUCE", index=False)
-
-        # Sheet 4: HOLD (summary in PDF)
-        df_hold.to_excel(writer, sheet_name="HOLD", index=False)
-
-        # Sheet 5: CASH (summary in PDF)
-        df_cash.to_excel(writer, sheet_name="CASH", index=False)
-
-        # Auto-adjust column widths for all sheets
-        for sheet_name in writer.sheets:
-            if sheet_name in writer.sheets:
-                worksheet = writer.sheets[sheet_name]
-                for column in worksheet.columns:
-                    max_length = 0
-                    column_letter = column[0].column_letter
-                    for cell in column:
-                        try:
-                            if len(str(cell.value)) > max_length:
-                                max_length = len(str(cell.value))
-                        except (AttributeError, TypeError) as e:
-                            logger.debug(
-                                f"Skipping cell value for width calculation: {e}"
-                            )
-                        except Exception as e:
-                            logger.warning(
-                                f"Unexpected error calculating column width: {e}"
-                            )
-                    adjusted_width = min(max_length + 2, 50)
-                    worksheet.column_dimensions[column_letter].width = adjusted_width
+    available_cols = [col for col in PORTFOLIO_EXCEL_COLUMNS if col in all_df]
+
+    df_all = all_df[available_cols]
+
+    # Split by signal in one pass (matching portfolio PDF format exactly);
+    # scan results are already in ticker order and groups keep that order
+    by_signal = dict(list(df_all.groupby("signal", sort=False, observed=True)))
+    no_rows = df_all.iloc[:0]
+    df_full_hold_add = by_signal.get("FULL HOLD + ADD", no_rows)
+    df_hold_reduce = by_signal.get("HOLD MOST + REDUCE", no_rows)
+    df_hold = by_signal.get("HOLD", no_rows)
+    df_cash = by_signal.get("CASH", no_rows)
+
+    # Sheets in workbook order
+    sheets = {
+        "All": df_all,
+        "FULL HOLD + ADD": df_full_hold_add,  # detailed in PDF
+        "HOLD + REDUCE": df_hold_reduce,  # HOLD MOST + REDUCE, summary in PDF
+        "HOLD": df_hold,  # summary in PDF
+        "CASH": df_cash,  # summary in PDF
+    }
+
+    from openpyxl import Workbook
+    from openpyxl.styles import Alignment, Border, Font, Side
+
+    # Write-only workbook: each sheet streams its rows in order instead of
+    # holding every cell in memory until save
+    wb = Workbook(write_only=True)
+
+    # Header style pandas' to_excel used (bold, thin border, centered)
+    header_font = Font(bold=True)
+    thin = Side(style="thin")
+    header_border = Border(left=thin, right=thin, top=thin, bottom=thin)
+    header_align = Alignment(horizontal="center", vertical="top")
+
+    for sheet_name, sheet_df in sheets.items():
+        ws = wb.create_sheet(sheet_name)
+
+        # Auto-adjust column widths from the DataFrame, before any rows
+        _set_column_widths(ws, [[col, *sheet_df[col]] for col in sheet_df.columns])
+
+        ws.append(
+            [
+                _styled_cell(
+                    ws,
+                    col,
+                    font=header_font,
+                    border=header_border,
+                    alignment=header_align,
+                )
+                for col in sheet_df.columns
+            ]
+        )
+        for row in (
+            sheet_df.astype(object)
+            .where(sheet_df.notna(), None)
+            .itertuples(index=False, name=None)
+        ):
+            ws.append(row)
+
+    wb.save(output_file)
 
     print(f"âœ“ Excel file created: {output_file}")
     print(f"  - All: {len(df_all)} stocks")
@@ -1620,6 +1990,589 @@ def create_portfolio_excel(all_df, output_file, category="Portfolio"):
     print(f"  - CASH: {len(df_cash)} stocks")
 
 
+def _with_defaults(df, defaults):
+    """
+    Add any missing report columns so rows can be read without per-row .get()
+
+    Args:
+        df: DataFrame of scan results
+        defaults: {column: value} used when the column is absent
+
+    Returns:
+        DataFrame with every column in defaults present
+    """
+    missing = {col: val for col, val in defaults.items() if col not in df.columns}
+    return df.assign(**missing) if missing else df
+
+
+def _level_gains(df, levels, short=False):
+    """
+    Percent gain from current price to each price level, computed per column
+
+    Args:
+        df: DataFrame with current_price and the level columns
+        levels: Level column names (e.g. r1, r2, r3)
+        short: Measure downside gains (level below price) instead of upside
+
+    Returns:
+        Dict of {f"gain_{level}": Series}; 0 where price is not positive
+        (or, for shorts, where the level is not below price)
+    """
+    price = df["current_price"].astype(float)
+    gains = {}
+    for level in levels:
+        target = df[level].astype(float)
+        if short:
+            gain = ((price - target) / price * 100).where(target < price, 0)
+        else:
+            gain = (target / price - 1) * 100
+        gains[f"gain_{level}"] = gain.where(price > 0, 0)
+    return gains
+
+
+def _fmt(values, spec):
+    """Format every value of a numeric column with a str.format spec"""
+    return values.astype(float).map(spec.format)
+
+
+def _text(values):
+    """Column as display strings (f-string style: NaN -> 'nan', None -> 'None')"""
+    return values.astype(object).map(str)
+
+
+def _present(values):
+    """Mask of values a report should show (not missing, zero or empty)"""
+    return values.notna() & values.astype(bool)
+
+
+def _join_present(parts, sep=""):
+    """Row-wise join of text columns, skipping missing (NaN) entries"""
+    joined = parts[0]
+    for part in parts[1:]:
+        both = joined.notna() & part.notna()
+        joined = joined.fillna(part).where(~both, joined + sep + part)
+    return joined
+
+
+def _rr_color(vol_rr):
+    """Vol R:R badge colors: green 3+, blue 2+, orange 1+, red below"""
+    return pd.Series(
+        np.select(
+            [vol_rr >= 3, vol_rr >= 2, vol_rr >= 1],
+            ["#27ae60", "#3498db", "#f39c12"],  # Green, blue, orange
+            "#e74c3c",  # Red
+        ),
+        index=vol_rr.index,
+    )
+
+
+def _pdf_header_text(rows, quality_col, flag_col):
+    """'#1. TICKER - $price | QUALITY FLAG | Vol R:R: x:1' card headers"""
+    vol_rr = rows["vol_rr"].astype(float)
+    rank = pd.Series(range(1, len(rows) + 1), index=rows.index).map(str)
+    flag_text = (" " + _text(rows[flag_col])).where(_present(rows[flag_col]), "")
+    rr_color = _rr_color(vol_rr)
+    return (
+        "<b>#"
+        + rank
+        + ". "
+        + _text(rows["ticker"])
+        + " - $"
+        + _fmt(rows["current_price"], "{:,.2f}")
+        + "</b> | <font color='#2980b9'><b>"
+        + _text(rows[quality_col])
+        + flag_text
+        + "</b></font> | Vol R:R: <font color='"
+        + rr_color
+        + "'><b>"
+        + _fmt(vol_rr, "{:.1f}")
+        + ":1</b></font>"
+    )
+
+
+def _pdf_signal_line(rows):
+    """'RSI: x | Signal: y' lines (RSI shown as N/A when missing)"""
+    rsi_text = _fmt(rows["rsi"], "{:.1f}").where(_present(rows["rsi"]), "N/A")
+    return "<b>RSI:</b> " + rsi_text + " | <b>Signal:</b> " + _text(rows["signal"])
+
+
+def _pdf_levels_text(rows, title, levels, with_gain=False):
+    """Title followed by '- S1: $x' lines for the levels present in each row"""
+    lines = []
+    for level in levels:
+        line = f"- {level.upper()}: $" + _fmt(rows[level], "{:,.2f}")
+        if with_gain:
+            line += " (" + _fmt(rows[f"gain_{level}"], "{:.1f}") + "% gain)"
+        lines.append((line + "<br/>").where(_present(rows[level])))
+    return title + _join_present(lines).fillna("")
+
+
+def _pdf_quality_text(rows, label, levels):
+    """'Buy Quality S1: GOOD - note' block, one line per rated level ('' if none)"""
+    lines = []
+    for level in levels:
+        quality = rows[f"{level}_quality"]
+        note = rows[f"{level}_quality_note"]
+        note_text = (" - " + _text(note)).where(_present(note), "")
+        rated = (_present(quality) & (quality != "N/A")) | _present(note)
+        lines.append(
+            (
+                f"<b>{label} {level.upper()}:</b> "
+                + _text(quality).where(_present(quality), "N/A")
+                + note_text
+            ).where(rated)
+        )
+    return _join_present(lines, sep="<br/>").fillna("")
+
+
+def _pdf_ma_text(rows):
+    """'Moving Averages: D50 $x | ...' line, or '' when no average is present"""
+    averages = _join_present(
+        [
+            (f"D{days} $" + _fmt(rows[f"d{days}"], "{:,.2f}")).where(
+                _present(rows[f"d{days}"])
+            )
+            for days in (50, 100, 200)
+        ],
+        sep=" | ",
+    )
+    return ("<b>Moving Averages:</b> " + averages).fillna("")
+
+
+def _pdf_distance_text(rows, label, level):
+    """'Support S1: $x (y% away) | Volatility: ...' line for one level"""
+    price = rows["current_price"].astype(float)
+    distance = ((rows[level].astype(float) - price) / price * 100).abs()
+    return (
+        f"<b>{label}:</b> $"
+        + _fmt(rows[level], "{:.2f}")
+        + " ("
+        + _fmt(distance, "{:.1f}")
+        + "% away) | <b>Volatility:</b> "
+        + _text(rows["volatility_class"])
+        + " (~"
+        + _fmt(rows["avg_daily_range_pct"], "{:.2f}")
+        + "% daily range)"
+    )
+
+
+def _pdf_note_text(rows, note_col):
+    """Italic entry notes, '' when there is no note"""
+    note = rows[note_col]
+    return ("<i>" + _text(note) + "</i>").where(_present(note), "")
+
+
+def _buy_pdf_text(rows):
+    """
+    Paragraph markup for every buy card, built column-wise
+
+    Args:
+        rows: Buy rows in display order with PDF_BUY_DEFAULTS and gain_r* columns
+
+    Returns:
+        DataFrame with one column per card paragraph in display order
+        ('' where an optional paragraph is skipped)
+    """
+    price = rows["current_price"].astype(float)
+    r1 = rows["r1"].astype(float)
+    suggested_stop = rows["suggested_stop_pct"].astype(float)
+    stop_pct = _fmt(suggested_stop, "{:.1f}")
+
+    stop_info = (
+        "<b>Volatility Stop ("
+        + stop_pct
+        + "%):</b> $"
+        + _fmt(price * (1 - suggested_stop / 100), "{:.2f}")
+        + ' loss = <font color="#e74c3c">-'
+        + stop_pct
+        + "%</font><br/><br/><b>"
+        + _fmt(rows["stop_tolerance_pct"], "{:.0f}")
+        + "% Stop Tolerance:</b> $"
+        + _fmt(rows["stop_level"], "{:.2f}")
+        + " | <b>Accessible Supports:</b> "
+        + _text(rows["accessible_supports_count"])
+        + " within range<br/>"
+    )
+
+    reward_pct = ((r1 - price) / price * 100).where(r1 > price, 0)
+    target_text = (
+        "<b>Target R1:</b> $"
+        + _fmt(r1, "{:.2f}")
+        + " gain = <font color='#27ae60'>+"
+        + _fmt(reward_pct, "{:.1f}")
+        + "%</font>"
+    ).where(_present(r1) & (price > 0), "")
+
+    s1_text = _pdf_distance_text(rows, "Support S1", "s1").where(
+        _present(rows["s1"]) & (price > 0), ""
+    )
+
+    poc, val, vah = (rows[col] for col in ("poc_60d", "val_60d", "vah_60d"))
+    volume_text = (
+        "<b>Volume Profile (60d):</b> POC $"
+        + _fmt(poc, "{:,.2f}")
+        + " | VAL $"
+        + _fmt(val, "{:,.2f}")
+        + " - VAH $"
+        + _fmt(vah, "{:,.2f}")
+    ).where(_present(poc) | _present(val) | _present(vah), "")
+
+    return pd.DataFrame(
+        {
+            "header_text": _pdf_header_text(rows, "entry_quality", "entry_flag"),
+            "signal_line": _pdf_signal_line(rows),
+            "stop_info": stop_info,
+            "target_text": target_text,
+            "s1_text": s1_text,
+            "entry_note": _pdf_note_text(rows, "entry_note"),
+            "support_text": _pdf_levels_text(
+                rows, "<b>Entry Zones (Support Levels):</b><br/>", ("s1", "s2", "s3")
+            ),
+            "quality_text": _pdf_quality_text(rows, "Buy Quality", ("s1", "s2", "s3")),
+            "targets_text": _pdf_levels_text(
+                rows,
+                "<b>Upside Targets (Resistance Levels):</b><br/>",
+                ("r1", "r2", "r3"),
+                with_gain=True,
+            ),
+            "sell_quality_text": _pdf_quality_text(
+                rows, "Sell Quality", ("r1", "r2", "r3")
+            ),
+            "ma_text": _pdf_ma_text(rows),
+            "volume_text": volume_text,
+        }
+    )
+
+
+def _sell_pdf_text(rows):
+    """
+    Paragraph markup for every sell (short) card, built column-wise
+
+    Args:
+        rows: Sell rows in display order with PDF_SELL_DEFAULTS and gain_s* columns
+
+    Returns:
+        DataFrame with one column per card paragraph in display order
+        ('' where an optional paragraph is skipped)
+    """
+    price = rows["current_price"].astype(float)
+    s1 = rows["s1"].astype(float)
+    suggested_stop = rows["suggested_stop_pct"].astype(float)
+    stop_pct = _fmt(suggested_stop, "{:.1f}")
+
+    # For shorts, the stop is above price
+    stop_info = (
+        "<b>Volatility Stop ("
+        + stop_pct
+        + "%):</b> $"
+        + _fmt(price * (1 + suggested_stop / 100), "{:.2f}")
+        + " loss = <font color='#e74c3c'>-"
+        + stop_pct
+        + "%</font>"
+    )
+
+    target_text = (
+        "<b>Target S1:</b> $"
+        + _fmt(s1, "{:.2f}")
+        + " gain = <font color='#27ae60'>+"
+        + _fmt((price - s1) / price * 100, "{:.1f}")
+        + "%</font>"
+    ).where(_present(s1) & (price > 0) & (s1 < price), "")
+
+    r1_text = _pdf_distance_text(rows, "Resistance R1", "r1").where(
+        _present(rows["r1"]) & (price > 0), ""
+    )
+
+    return pd.DataFrame(
+        {
+            "header_text": _pdf_header_text(
+                rows, "short_entry_quality", "short_entry_flag"
+            ),
+            "signal_line": _pdf_signal_line(rows),
+            "stop_info": stop_info,
+            "target_text": target_text,
+            "r1_text": r1_text,
+            "entry_note": _pdf_note_text(rows, "short_entry_note"),
+            "exit_text": _pdf_levels_text(
+                rows,
+                "<b>Downside Targets (Support Levels):</b><br/>",
+                ("s1", "s2", "s3"),
+                with_gain=True,
+            ),
+            "quality_text": _pdf_quality_text(
+                rows, "Cover Quality", ("s1", "s2", "s3")
+            ),
+            "ma_text": _pdf_ma_text(rows),
+        }
+    )
+
+
+# Column defaults for the PDF report loops (mirror the former stock.get() calls)
+PDF_REPORT_DEFAULTS = {
+    "rsi": None,
+    "vol_rr": 0,
+    "suggested_stop_pct": 5.0,
+    "volatility_class": "",
+    "avg_daily_range_pct": 0,
+    "r1": None,
+    "r2": None,
+    "r3": None,
+    "s1": None,
+    "s2": None,
+    "s3": None,
+    "s1_quality": "N/A",
+    "s1_quality_note": "",
+    "s2_quality": "N/A",
+    "s2_quality_note": "",
+    "s3_quality": "N/A",
+    "s3_quality_note": "",
+    "d50": None,
+    "d100": None,
+    "d200": None,
+}
+PDF_BUY_DEFAULTS = {
+    **PDF_REPORT_DEFAULTS,
+    "entry_flag": "",
+    "entry_note": "",
+    "stop_tolerance_pct": 8.0,
+    "stop_level": 0,
+    "accessible_supports_count": 0,
+    "r1_quality": "N/A",
+    "r1_quality_note": "",
+    "r2_quality": "N/A",
+    "r2_quality_note": "",
+    "r3_quality": "N/A",
+    "r3_quality_note": "",
+    "poc_60d": None,
+    "val_60d": None,
+    "vah_60d": None,
+}
+PDF_SELL_DEFAULTS = {
+    **PDF_REPORT_DEFAULTS,
+    "short_entry_quality": "N/A",
+    "short_entry_flag": "",
+    "short_entry_note": "",
+}
+
+
+# Card layouts: text columns in display order, None marks a small gap.
+# Empty optional paragraphs are skipped; the first column is the card header.
+PDF_BUY_LAYOUT = (
+    "header_text",
+    "signal_line",
+    None,
+    "stop_info",
+    "target_text",
+    None,
+    "s1_text",
+    None,
+    "entry_note",
+    None,
+    "support_text",
+    None,
+    "quality_text",
+    None,
+    "targets_text",
+    None,
+    "sell_quality_text",
+    None,
+    "ma_text",
+    "volume_text",
+)
+PDF_SELL_LAYOUT = (
+    "header_text",
+    "signal_line",
+    None,
+    "stop_info",
+    None,
+    "target_text",
+    None,
+    "r1_text",
+    None,
+    "entry_note",
+    None,
+    "exit_text",
+    None,
+    "quality_text",
+    None,
+    "ma_text",
+)
+
+
+# Static glossary text (terms are built once per process, not per report).
+# Flowables themselves are not shared: reportlab keeps layout state on them.
+PDF_GLOSSARY_ITEMS = (
+    (
+        "<b>Support Levels (S1, S2, S3):</b>",
+        "Price levels where buying pressure may prevent further decline. S1 is the nearest support.",
+    ),
+    (
+        "<b>Resistance Levels (R1, R2, R3):</b>",
+        "Price levels where selling pressure may prevent further advance. R1 is the nearest resistance.",
+    ),
+    (
+        "<b>RSI (Relative Strength Index):</b>",
+        "Momentum indicator (0-100). Below 30 = oversold, above 70 = overbought.",
+    ),
+    (
+        "<b>Volatility Stop:</b>",
+        "Dynamic stop-loss based on stock's volatility (typically 5-8% below entry for buys).",
+    ),
+    (
+        "<b>Vol R:R (Volatility Risk-Reward):</b>",
+        "Ratio of potential reward to volatility stop risk. Higher is better (3+ is excellent).",
+    ),
+    (
+        "<b>D50/D100/D200:</b>",
+        "50/100/200-day moving averages. Key trend indicators and support/resistance levels.",
+    ),
+    (
+        "<b>POC (Point of Control):</b>",
+        "Price level with highest trading volume. Strong support/resistance.",
+    ),
+    (
+        "<b>VAH/VAL (Value Area High/Low):</b>",
+        "Price range containing 70% of volume. Defines fair value zone.",
+    ),
+    (
+        "<b>HVN (High Volume Node):</b>",
+        "Price level with significant trading activity. Acts as support/resistance.",
+    ),
+    (
+        "<b>FULL HOLD + ADD:</b>",
+        "Strong bullish signal. Stock is in uptrend with multiple support levels.",
+    ),
+    (
+        "<b>FULL SELL + SHORT:</b>",
+        "Strong bearish signal. Stock is in downtrend with multiple resistance levels.",
+    ),
+)
+
+BEST_TRADES_GLOSSARY_ITEMS = (
+    ("<b>Quality Ratings:</b>", ""),
+    (
+        "  • <b>EXCELLENT:</b>",
+        "2+ strong supports accessible within stop tolerance. Safest entries.",
+    ),
+    (
+        "  • <b>GOOD:</b>",
+        "1+ good support accessible within stop tolerance. Solid risk management.",
+    ),
+    (
+        "  • <b>OK:</b>",
+        "Moderate supports available. Acceptable but watch closely.",
+    ),
+    (
+        "  • <b>CAUTION:</b>",
+        "Thin or extended. Limited protection within stop range.",
+    ),
+    ("", ""),
+    ("<b>Quality Flags:</b>", ""),
+    (
+        "  • <b>SAFE ENTRY:</b>",
+        "Multiple excellent supports protect your stop level.",
+    ),
+    ("  • <b>IDEAL:</b>", "Near major support with good upside potential."),
+    ("  • <b>ACCEPTABLE:</b>", "Reasonable entry but monitor risk carefully."),
+    ("  • <b>THIN:</b>", "Limited support structure. Higher risk."),
+    ("  • <b>EXTENDED:</b>", "Far from supports. Consider waiting for pullback."),
+    ("  • <b>WAIT:</b>", "No accessible supports within 8% stop. Do not enter."),
+    ("", ""),
+    (
+        "<b>Vol R:R (Volatility Risk-Reward):</b>",
+        "Ratio of potential gain to volatility stop risk. 3+ = excellent, 2+ = good, 1+ = acceptable.",
+    ),
+    (
+        "<b>Volatility Stop:</b>",
+        "Stop-loss based on stock's price movement (typically 5-8%). Limits maximum loss.",
+    ),
+    (
+        "<b>Stop Tolerance:</b>",
+        "Maximum acceptable stop distance (8%). Entries are rated based on supports within this range.",
+    ),
+    (
+        "<b>RSI:</b>",
+        "Relative Strength Index (0-100). <30 oversold, >70 overbought.",
+    ),
+    ("<b>S1/R1:</b>", "Primary support and resistance levels. Key price targets."),
+    (
+        "<b>D50/D100/D200:</b>",
+        "50/100/200-day moving averages. Trend and support indicators.",
+    ),
+)
+
+
+def _signal_card_flowables(text_df, layout, subsection_style, normal_style):
+    """
+    Yield the flowables for every card of a buy/sell section, in order
+
+    Args:
+        text_df: Card markup from _buy_pdf_text() / _sell_pdf_text()
+        layout: PDF_BUY_LAYOUT or PDF_SELL_LAYOUT
+        subsection_style: ParagraphStyle for each card header
+        normal_style: ParagraphStyle for card body text
+    """
+    # Flowables carry layout state, so every gap needs its own Spacer
+    small_gap = 0.05 * inch
+    card_gap = 0.15 * inch
+
+    cards = text_df[[col for col in layout if col]]
+    for values in cards.itertuples(index=False, name=None):
+        values = iter(values)
+        yield Paragraph(next(values), subsection_style)
+        for col in layout[1:]:
+            if col is None:
+                yield Spacer(1, small_gap)
+                continue
+            text = next(values)
+            if text:
+                yield Paragraph(text, normal_style)
+        yield Spacer(1, card_gap)
+
+
+def _render_signal_section(
+    elements,
+    text_df,
+    section_title,
+    layout,
+    section_style,
+    subsection_style,
+    normal_style,
+):
+    """
+    Append one buy/sell section (title plus one card per stock) to elements
+
+    Args:
+        elements: Flowable list being built for the PDF
+        text_df: Card markup from _buy_pdf_text() / _sell_pdf_text()
+        section_title: Section heading text
+        layout: PDF_BUY_LAYOUT or PDF_SELL_LAYOUT
+        section_style: ParagraphStyle for the section heading
+        subsection_style: ParagraphStyle for each card header
+        normal_style: ParagraphStyle for card body text
+    """
+    elements.append(Paragraph(section_title, section_style))
+    elements.append(Spacer(1, 0.1 * inch))
+    elements.extend(
+        _signal_card_flowables(text_df, layout, subsection_style, normal_style)
+    )
+
+
+def _write_file_atomic(output_file, data):
+    """
+    Write bytes to a temp file next to output_file, then rename it into place
+
+    Args:
+        output_file: Destination path
+        data: File contents (bytes)
+    """
+    output_file = Path(output_file)
+    temp_file = output_file.with_name(output_file.name + ".tmp")
+    temp_file.write_bytes(data)
+    # Atomic on the same filesystem, so a partial report never appears
+    os.replace(temp_file, output_file)
+
+
 def create_pdf_report(
     buy_df, sell_df, output_file, timestamp_str, category="", regime=None
 ):
@@ -1636,8 +2589,6 @@ def create_pdf_report(
         regime: Market regime dict from analyze_market_regime() (optional, for display)
     """
     from reportlab.lib.pagesizes import letter
-    from reportlab.lib import colors
-    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
     from reportlab.lib.units import inch
     from reportlab.platypus import (
         SimpleDocTemplate,
@@ -1645,14 +2596,15 @@ def create_pdf_report(
         Spacer,
         PageBreak,
     )
-    from reportlab.lib.enums import TA_CENTER
 
     if buy_df.empty and sell_df.empty:
         print(f"No data to create PDF report for {category}")
         return
 
+    # Render in memory; the file is written in one go once the build succeeds
+    pdf_buffer = io.BytesIO()
     doc = SimpleDocTemplate(
-        str(output_file),
+        pdf_buffer,
         pagesize=letter,
         rightMargin=30,
         leftMargin=30,
@@ -1661,35 +2613,12 @@ def create_pdf_report(
     )
 
     elements = []
-    styles = getSampleStyleSheet()
-
-    # Custom styles (matching portfolio_reports)
-    title_style = ParagraphStyle(
-        "CustomTitle",
-        parent=styles["Heading1"],
-        fontSize=24,
-        textColor=colors.HexColor("#2c3e50"),
-        spaceAfter=20,
-        alignment=TA_CENTER,
-    )
+    styles = PDF_STYLES
+    normal_style = styles["Normal"]
 
-    section_style = ParagraphStyle(
-        "Section",
-        parent=styles["Heading2"],
-        fontSize=16,
-        textColor=colors.HexColor("#2980b9"),
-        spaceAfter=12,
-        spaceBefore=20,
-    )
-
-    subsection_style = ParagraphStyle(
-        "Subsection",
-        parent=styles["Heading3"],
-        fontSize=12,
-        textColor=colors.HexColor("#34495e"),
-        spaceAfter=6,
-        spaceBefore=10,
-    )
+    title_style = PDF_TITLE_STYLE
+    section_style = PDF_SECTION_STYLE
+    subsection_style = PDF_SUBSECTION_STYLE
 
     # === PAGE 1: DASHBOARD ===
     report_title = category.replace("&", "&amp;")
@@ -1742,7 +2671,7 @@ def create_pdf_report(
         <font size=10>Buys allowed: {allow_buys}</font>
         </para>
         """
-        elements.append(Paragraph(regime_info, styles["Normal"]))
+        elements.append(Paragraph(regime_info, normal_style))
         elements.append(Spacer(1, 0.3 * inch))
 
     # Scanner summary
@@ -1758,392 +2687,272 @@ def create_pdf_report(
     <br/>
     <i>Generated: {datetime.now().strftime('%Y-%m-%d %I:%M %p')}</i>
     """
-    elements.append(Paragraph(summary_text, styles["Normal"]))
+    elements.append(Paragraph(summary_text, normal_style))
     elements.append(PageBreak())
 
     # === SECTION 1: BUY SETUPS ===
     if not buy_df.empty:
-        elements.append(Paragraph(f"BUY SETUPS ({len(buy_df)} stocks)", section_style))
-        elements.append(Spacer(1, 0.1 * inch))
-
         # Sort by vol_rr if available, otherwise by ticker
         sort_col = "vol_rr" if "vol_rr" in buy_df.columns else "ticker"
         sort_asc = False if sort_col == "vol_rr" else True
 
-        for rank, (_, stock) in enumerate(
-            buy_df.sort_values(sort_col, ascending=sort_asc).iterrows(), 1
-        ):
-            ticker = stock["ticker"]
-            price = stock["current_price"]
-            signal = stock["signal"]
-            buy_quality = stock.get("buy_quality", "N/A")
-            rsi = stock.get("rsi")
-
-            # Get stop-aware entry quality
-            entry_quality = stock.get("entry_quality", buy_quality)
-            entry_flag = stock.get("entry_flag", "")
-            entry_note = stock.get("entry_note", "")
-            stop_tolerance = stock.get("stop_tolerance_pct", 8.0)
-            stop_level = stock.get("stop_level", 0)
-            vol_rr = stock.get("vol_rr", 0)
-
-            # Color code the R:R ratio
-            if vol_rr >= 3:
-                rr_color = "#27ae60"  # Green
-            elif vol_rr >= 2:
-                rr_color = "#3498db"  # Blue
-            elif vol_rr >= 1:
-                rr_color = "#f39c12"  # Orange
-            else:
-                rr_color = "#e74c3c"  # Red
-
-            # Stock header with ranking, entry quality and flag
-            entry_flag_text = f" {entry_flag}" if entry_flag else ""
-            header_text = f"<b>#{rank}. {ticker} - ${price:,.2f}</b> | <font color='#2980b9'><b>{entry_quality}{entry_flag_text}</b></font> | Vol R:R: <font color='{rr_color}'><b>{vol_rr:.1f}:1</b></font>"
-            elements.append(Paragraph(header_text, subsection_style))
-
-            # RSI and Signal line
-            rsi_text = f"{rsi:.1f}" if rsi else "N/A"
-            signal_line = f"<b>RSI:</b> {rsi_text} | <b>Signal:</b> {signal}"
-            elements.append(Paragraph(signal_line, styles["Normal"]))
-            elements.append(Spacer(1, 0.05 * inch))
-
-            # Volatility Stop and Support Info
-            suggested_stop = stock.get("suggested_stop_pct", 5.0)
-            vol_stop_price = price * (1 - suggested_stop / 100)
-            accessible_supports = stock.get("accessible_supports_count", 0)
-
-            stop_info = f"""
-            <b>Volatility Stop ({suggested_stop:.1f}%):</b> ${vol_stop_price:.2f} loss = <font color="#e74c3c">-{suggested_stop:.1f}%</font><br/>
-            <br/>
-            <b>{stop_tolerance:.0f}% Stop Tolerance:</b> ${stop_level:.2f} | <b>Accessible Supports:</b> {accessible_supports} within range<br/>
-            """
-            elements.append(Paragraph(stop_info, styles["Normal"]))
-
-            # Target R1
-            r1 = stock.get("r1", 0)
-            if r1 and price > 0:
-                reward_pct = ((r1 - price) / price * 100) if r1 > price else 0
-                target_text = f"<b>Target R1:</b> ${r1:.2f} gain = <font color='#27ae60'>+{reward_pct:.1f}%</font>"
-                elements.append(Paragraph(target_text, styles["Normal"]))
-            elements.append(Spacer(1, 0.05 * inch))
-
-            # Support S1 and Volatility info
-            s1 = stock.get("s1", 0)
-            volatility_class = stock.get("volatility_class", "")
-            daily_range = stock.get("avg_daily_range_pct", 0)
-            if s1 and price > 0:
-                distance_to_s1 = abs((price - s1) / price * 100)
-                s1_text = f"<b>Support S1:</b> ${s1:.2f} ({distance_to_s1:.1f}% away) | <b>Volatility:</b> {volatility_class} (~{daily_range:.2f}% daily range)"
-                elements.append(Paragraph(s1_text, styles["Normal"]))
-            elements.append(Spacer(1, 0.05 * inch))
-
-            # Entry note
-            if entry_note:
-                elements.append(Paragraph(f"<i>{entry_note}</i>", styles["Normal"]))
-            elements.append(Spacer(1, 0.05 * inch))
-
-            # Support levels (entry zones)
-            s1 = stock.get("s1")
-            s2 = stock.get("s2")
-            s3 = stock.get("s3")
-
-            support_text = "<b>Entry Zones (Support Levels):</b><br/>"
-            if s1:
-                support_text += f"- S1: ${s1:,.2f}<br/>"
-            if s2:
-                support_text += f"- S2: ${s2:,.2f}<br/>"
-            if s3:
-                support_text += f"- S3: ${s3:,.2f}<br/>"
-            elements.append(Paragraph(support_text, styles["Normal"]))
-            elements.append(Spacer(1, 0.05 * inch))
-
-            # Buy quality for each support level (matching portfolio format)
-            s1_quality = stock.get("s1_quality", "N/A")
-            s1_quality_note = stock.get("s1_quality_note", "")
-            s2_quality = stock.get("s2_quality", "N/A")
-            s2_quality_note = stock.get("s2_quality_note", "")
-            s3_quality = stock.get("s3_quality", "N/A")
-            s3_quality_note = stock.get("s3_quality_note", "")
-
-            quality_text = f"""
-            <b>Buy Quality S1:</b> {s1_quality} - {s1_quality_note}<br/>
-            <b>Buy Quality S2:</b> {s2_quality} - {s2_quality_note}<br/>
-            <b>Buy Quality S3:</b> {s3_quality} - {s3_quality_note}
-            """
-            elements.append(Paragraph(quality_text, styles["Normal"]))
-            elements.append(Spacer(1, 0.05 * inch))
-
-            # Resistance levels (targets)
-            r1 = stock.get("r1")
-            r2 = stock.get("r2")
-            r3 = stock.get("r3")
-
-            target_text = "<b>Upside Targets (Resistance Levels):</b><br/>"
-            if r1:
-                gain1 = (r1 / price - 1) * 100 if price > 0 else 0
-                target_text += f"- R1: ${r1:,.2f} ({gain1:.1f}% gain)<br/>"
-            if r2:
-                gain2 = (r2 / price - 1) * 100 if price > 0 else 0
-                target_text += f"- R2: ${r2:,.2f} ({gain2:.1f}% gain)<br/>"
-            if r3:
-                gain3 = (r3 / price - 1) * 100 if price > 0 else 0
-                target_text += f"- R3: ${r3:,.2f} ({gain3:.1f}% gain)<br/>"
-            elements.append(Paragraph(target_text, styles["Normal"]))
-            elements.append(Spacer(1, 0.05 * inch))
-
-            # Sell quality for resistance levels (exit quality assessment)
-            r1_quality = stock.get("r1_quality", "N/A")
-            r1_quality_note = stock.get("r1_quality_note", "")
-            r2_quality = stock.get("r2_quality", "N/A")
-            r2_quality_note = stock.get("r2_quality_note", "")
-            r3_quality = stock.get("r3_quality", "N/A")
-            r3_quality_note = stock.get("r3_quality_note", "")
-
-            sell_quality_text = f"""
-            <b>Sell Quality R1:</b> {r1_quality} - {r1_quality_note}<br/>
-            <b>Sell Quality R2:</b> {r2_quality} - {r2_quality_note}<br/>
-            <b>Sell Quality R3:</b> {r3_quality} - {r3_quality_note}
-            """
-            elements.append(Paragraph(sell_quality_text, styles["Normal"]))
-            elements.append(Spacer(1, 0.05 * inch))
-
-            # Moving averages
-            d50 = stock.get("d50")
-            d100 = stock.get("d100")
-            d200 = stock.get("d200")
-            if d50 or d100 or d200:
-                ma_text = "<b>Moving Averages:</b> "
-                ma_parts = []
-                if d50:
-                    ma_parts.append(f"D50 ${d50:,.2f}")
-                if d100:
-                    ma_parts.append(f"D100 ${d100:,.2f}")
-                if d200:
-                    ma_parts.append(f"D200 ${d200:,.2f}")
-                ma_text += " | ".join(ma_parts)
-                elements.append(Paragraph(ma_text, styles["Normal"]))
-
-            # Volume Profile (matching portfolio format)
-            poc = stock.get("poc_60d")
-            val = stock.get("val_60d")
-            vah = stock.get("vah_60d")
-            if poc or val or vah:
-                volume_text = f"""
-                <b>Volume Profile (60d):</b> POC ${poc:,.2f} | VAL ${val:,.2f} - VAH ${vah:,.2f}
-                """
-                elements.append(Paragraph(volume_text, styles["Normal"]))
-
-            elements.append(Spacer(1, 0.15 * inch))
+        buy_rows = buy_df.sort_values(sort_col, ascending=sort_asc)
+        if "entry_quality" not in buy_rows.columns:
+            buy_rows = buy_rows.assign(entry_quality=buy_rows.get("buy_quality", "N/A"))
+        buy_rows = _with_defaults(buy_rows, PDF_BUY_DEFAULTS)
+        # Target gains are computed per column once rather than per stock
+        buy_rows = buy_rows.assign(**_level_gains(buy_rows, ("r1", "r2", "r3")))
+
+        _render_signal_section(
+            elements,
+            _buy_pdf_text(buy_rows),
+            f"BUY SETUPS ({len(buy_df)} stocks)",
+            PDF_BUY_LAYOUT,
+            section_style,
+            subsection_style,
+            normal_style,
+        )
     else:
         elements.append(Paragraph("BUY SETUPS (0 stocks)", section_style))
-        elements.append(
-            Paragraph("No quality buy signals at this time.", styles["Normal"])
-        )
+        elements.append(Paragraph("No quality buy signals at this time.", normal_style))
         elements.append(PageBreak())
 
     # === SECTION 2: SELL SETUPS ===
     if not sell_df.empty:
         elements.append(PageBreak())
-        elements.append(
-            Paragraph(f"SELL SETUPS ({len(sell_df)} stocks)", section_style)
-        )
-        elements.append(Spacer(1, 0.1 * inch))
-
         # Sort by vol_rr if available, otherwise by ticker
         sort_col = "vol_rr" if "vol_rr" in sell_df.columns else "ticker"
         sort_asc = False if sort_col == "vol_rr" else True
 
-        for rank, (_, stock) in enumerate(
-            sell_df.sort_values(sort_col, ascending=sort_asc).iterrows(), 1
-        ):
-            ticker = stock["ticker"]
-            price = stock["current_price"]
-            signal = stock["signal"]
-            r1_quality = stock.get("r1_quality", "N/A")
-            r2_quality = stock.get("r2_quality", "N/A")
-            r3_quality = stock.get("r3_quality", "N/A")
-            rsi = stock.get("rsi")
-
-            # Short entry quality assessment
-            short_entry_quality = stock.get("short_entry_quality", "N/A")
-            short_entry_flag = stock.get("short_entry_flag", "")
-            short_entry_note = stock.get("short_entry_note", "")
-            vol_rr = stock.get("vol_rr", 0)
-
-            # Color code the R:R ratio
-            if vol_rr >= 3:
-                rr_color = "#27ae60"  # Green
-            elif vol_rr >= 2:
-                rr_color = "#3498db"  # Blue
-            elif vol_rr >= 1:
-                rr_color = "#f39c12"  # Orange
-            else:
-                rr_color = "#e74c3c"  # Red
-
-            # Stock header with ranking, short entry quality and flag
-            short_flag_text = f" {short_entry_flag}" if short_entry_flag else ""
-            header_text = f"<b>#{rank}. {ticker} - ${price:,.2f}</b> | <font color='#2980b9'><b>{short_entry_quality}{short_flag_text}</b></font> | Vol R:R: <font color='{rr_color}'><b>{vol_rr:.1f}:1</b></font>"
-            elements.append(Paragraph(header_text, subsection_style))
-
-            # RSI and Signal line
-            rsi_text = f"{rsi:.1f}" if rsi else "N/A"
-            signal_line = f"<b>RSI:</b> {rsi_text} | <b>Signal:</b> {signal}"
-            elements.append(Paragraph(signal_line, styles["Normal"]))
-            elements.append(Spacer(1, 0.05 * inch))
-
-            # Volatility Stop
-            suggested_stop = stock.get("suggested_stop_pct", 5.0)
-            vol_stop_price = price * (
-                1 + suggested_stop / 100
-            )  # For shorts, stop is above
-
-            stop_info = f"<b>Volatility Stop ({suggested_stop:.1f}%):</b> ${vol_stop_price:.2f} loss = <font color='#e74c3c'>-{suggested_stop:.1f}%</font>"
-            elements.append(Paragraph(stop_info, styles["Normal"]))
-            elements.append(Spacer(1, 0.05 * inch))
-
-            # Target S1
-            s1 = stock.get("s1", 0)
-            if s1 and price > 0 and s1 < price:
-                reward_pct = (price - s1) / price * 100
-                target_text = f"<b>Target S1:</b> ${s1:.2f} gain = <font color='#27ae60'>+{reward_pct:.1f}%</font>"
-                elements.append(Paragraph(target_text, styles["Normal"]))
-            elements.append(Spacer(1, 0.05 * inch))
-
-            # Resistance R1 and Volatility info
-            r1 = stock.get("r1", 0)
-            volatility_class = stock.get("volatility_class", "")
-            daily_range = stock.get("avg_daily_range_pct", 0)
-            if r1 and price > 0:
-                distance_to_r1 = abs((r1 - price) / price * 100)
-                r1_text = f"<b>Resistance R1:</b> ${r1:.2f} ({distance_to_r1:.1f}% away) | <b>Volatility:</b> {volatility_class} (~{daily_range:.2f}% daily range)"
-                elements.append(Paragraph(r1_text, styles["Normal"]))
-            elements.append(Spacer(1, 0.05 * inch))
-
-            # Entry note
-            if short_entry_note:
-                elements.append(
-                    Paragraph(f"<i>{short_entry_note}</i>", styles["Normal"])
-                )
-            elements.append(Spacer(1, 0.05 * inch))
-
-            # Support levels (downside targets for shorts)
-            s1 = stock.get("s1")
-            s2 = stock.get("s2")
-            s3 = stock.get("s3")
-
-            exit_text = "<b>Downside Targets (Support Levels):</b><br/>"
-            if s1:
-                gain1 = (price - s1) / price * 100 if price > 0 and s1 < price else 0
-                exit_text += f"- S1: ${s1:,.2f} ({gain1:.1f}% gain)<br/>"
-            if s2:
-                gain2 = (price - s2) / price * 100 if price > 0 and s2 < price else 0
-                exit_text += f"- S2: ${s2:,.2f} ({gain2:.1f}% gain)<br/>"
-            if s3:
-                gain3 = (price - s3) / price * 100 if price > 0 and s3 < price else 0
-                exit_text += f"- S3: ${s3:,.2f} ({gain3:.1f}% gain)<br/>"
-            elements.append(Paragraph(exit_text, styles["Normal"]))
-            elements.append(Spacer(1, 0.05 * inch))
-
-            # S1/S2/S3 quality assessments (matching portfolio format)
-            s1_quality = stock.get("s1_quality", "N/A")
-            s1_quality_note = stock.get("s1_quality_note", "")
-            s2_quality = stock.get("s2_quality", "N/A")
-            s2_quality_note = stock.get("s2_quality_note", "")
-            s3_quality = stock.get("s3_quality", "N/A")
-            s3_quality_note = stock.get("s3_quality_note", "")
-
-            quality_text = f"""
-            <b>Cover Quality S1:</b> {s1_quality} - {s1_quality_note}<br/>
-            <b>Cover Quality S2:</b> {s2_quality} - {s2_quality_note}<br/>
-            <b>Cover Quality S3:</b> {s3_quality} - {s3_quality_note}
-            """
-            elements.append(Paragraph(quality_text, styles["Normal"]))
-            elements.append(Spacer(1, 0.05 * inch))
-
-            # Moving averages
-            d50 = stock.get("d50")
-            d100 = stock.get("d100")
-            d200 = stock.get("d200")
-            if d50 or d100 or d200:
-                ma_text = "<b>Moving Averages:</b> "
-                ma_parts = []
-                if d50:
-                    ma_parts.append(f"D50 ${d50:,.2f}")
-                if d100:
-                    ma_parts.append(f"D100 ${d100:,.2f}")
-                if d200:
-                    ma_parts.append(f"D200 ${d200:,.2f}")
-                ma_text += " | ".join(ma_parts)
-                elements.append(Paragraph(ma_text, styles["Normal"]))
+        sell_rows = _with_defaults(
+            sell_df.sort_values(sort_col, ascending=sort_asc), PDF_SELL_DEFAULTS
+        )
+        sell_rows = sell_rows.assign(
+            **_level_gains(sell_rows, ("s1", "s2", "s3"), short=True)
+        )
 
-            elements.append(Spacer(1, 0.15 * inch))
+        _render_signal_section(
+            elements,
+            _sell_pdf_text(sell_rows),
+            f"SELL SETUPS ({len(sell_df)} stocks)",
+            PDF_SELL_LAYOUT,
+            section_style,
+            subsection_style,
+            normal_style,
+        )
     else:
         elements.append(PageBreak())
         elements.append(Paragraph("SELL SETUPS (0 stocks)", section_style))
-        elements.append(Paragraph("No bearish signals at this time.", styles["Normal"]))
+        elements.append(Paragraph("No bearish signals at this time.", normal_style))
 
     # Glossary Section
     elements.append(PageBreak())
     elements.append(Paragraph("GLOSSARY OF TERMS", section_style))
     elements.append(Spacer(1, 0.1 * inch))
 
-    glossary_items = [
-        (
-            "<b>Support Levels (S1, S2, S3):</b>",
-            "Price levels where buying pressure may prevent further decline. S1 is the nearest support.",
-        ),
-        (
-            "<b>Resistance Levels (R1, R2, R3):</b>",
-            "Price levels where selling pressure may prevent further advance. R1 is the nearest resistance.",
-        ),
-        (
-            "<b>RSI (Relative Strength Index):</b>",
-            "Momentum indicator (0-100). Below 30 = oversold, above 70 = overbought.",
-        ),
-        (
-            "<b>Volatility Stop:</b>",
-            "Dynamic stop-loss based on stock's volatility (typically 5-8% below entry for buys).",
-        ),
-        (
-            "<b>Vol R:R (Volatility Risk-Reward):</b>",
-            "Ratio of potential reward to volatility stop risk. Higher is better (3+ is excellent).",
-        ),
-        (
-            "<b>D50/D100/D200:</b>",
-            "50/100/200-day moving averages. Key trend indicators and support/resistance levels.",
-        ),
-        (
-            "<b>POC (Point of Control):</b>",
-            "Price level with highest trading volume. Strong support/resistance.",
-        ),
-        (
-            "<b>VAH/VAL (Value Area High/Low):</b>",
-            "Price range containing 70% of volume. Defines fair value zone.",
-        ),
-        (
-            "<b>HVN (High Volume Node):</b>",
-            "Price level with significant trading activity. Acts as support/resistance.",
-        ),
-        (
-            "<b>FULL HOLD + ADD:</b>",
-            "Strong bullish signal. Stock is in uptrend with multiple support levels.",
-        ),
-        (
-            "<b>FULL SELL + SHORT:</b>",
-            "Strong bearish signal. Stock is in downtrend with multiple resistance levels.",
-        ),
-    ]
-
-    for term, definition in glossary_items:
-        elements.append(Paragraph(f"{term} {definition}", styles["Normal"]))
+    for term, definition in PDF_GLOSSARY_ITEMS:
+        elements.append(Paragraph(f"{term} {definition}", normal_style))
         elements.append(Spacer(1, 0.08 * inch))
 
     # Build PDF
     doc.build(elements)
+    _write_file_atomic(output_file, pdf_buffer.getvalue())
     print(f"[OK] PDF report created: {output_file}")
 
 
+def _best_trade_card_common(rows, quality_col, flag_col):
+    """
+    Header, RSI/signal and volatility-stop markup shared by buy and sell cards
+
+    Args:
+        rows: Ranked rows (vol_rr computed), best first
+        quality_col: Entry quality column shown on the badge
+        flag_col: Entry flag column appended to the badge
+
+    Returns:
+        Dict of text Series (header, signal_line, stop_pct, volatility)
+    """
+    vol_rr = rows["vol_rr"].astype(float)
+    quality = rows[quality_col]
+    flag = rows[flag_col] if flag_col in rows.columns else pd.Series("", rows.index)
+    signal = rows["signal"] if "signal" in rows.columns else pd.Series("", rows.index)
+    rsi = rows["rsi"] if "rsi" in rows.columns else pd.Series(None, rows.index)
+
+    rank = pd.Series(range(1, len(rows) + 1), index=rows.index).map(str)
+    quality_color = pd.Series(
+        np.where(quality == "EXCELLENT", "#27ae60", "#3498db"),  # Green / blue
+        index=rows.index,
+    )
+    header = (
+        "<font size=12><b>#"
+        + rank
+        + ". "
+        + _text(rows["ticker"])
+        + " - $"
+        + _fmt(rows["current_price"], "{:.2f}")
+        + '</b> | <font color="'
+        + quality_color
+        + '"><b>'
+        + _text(quality)
+    )
+    flag_text = (" " + _text(flag)).where(_present(flag), "")
+    badge_end = (
+        '</font> | Vol R:R: <font color="'
+        + _rr_color(vol_rr)
+        + '"><b>'
+        + _fmt(vol_rr, "{:.1f}")
+        + ":1</b></font></font><br/>"
+    )
+    signal_line = (
+        "<b>RSI:</b> "
+        + _fmt(rsi, "{:.1f}").where(_present(rsi), "N/A")
+        + " | <b>Signal:</b> "
+        + _text(signal).where(_present(signal), "N/A")
+        + "<br/>"
+    )
+    volatility = (
+        " | <b>Volatility:</b> "
+        + _text(rows["volatility_class"])
+        + " (~"
+        + _fmt(rows["avg_daily_range_pct"], "{:.2f}")
+        + "% daily range)"
+    )
+    return {
+        "header": header,
+        "flag_text": flag_text,
+        "badge_end": badge_end,
+        "signal_line": signal_line,
+        "stop_pct": _fmt(rows["suggested_stop_pct"], "{:.1f}"),
+        "volatility": volatility,
+    }
+
+
+def _best_buy_card_text(rows, quality_col):
+    """
+    Card markup for the ranked buy setups, built column-wise
+
+    Args:
+        rows: Ranked buy rows (vol_rr computed), best first
+        quality_col: entry_quality, or buy_quality when it is absent
+
+    Returns:
+        Series of card markup in rank order
+    """
+    rows = _with_defaults(rows, BEST_TRADES_BUY_DEFAULTS)
+    price = rows["current_price"].astype(float)
+    s1 = rows["s1"].astype(float)
+    r1 = rows["r1"].astype(float)
+    suggested_stop = rows["suggested_stop_pct"].astype(float)
+    if "stop_level" in rows.columns:
+        stop_level = rows["stop_level"]
+    else:
+        stop_level = price * 0.92
+    common = _best_trade_card_common(rows, quality_col, "entry_flag")
+
+    reward_pct = ((r1 - price) / price * 100).where(
+        (price > 0) & (r1 > 0) & (r1 > price), 0
+    )
+    distance_to_s1 = ((price - s1) / price * 100).abs().where((price > 0) & (s1 > 0), 0)
+    note = rows["entry_note"]
+
+    return (
+        common["header"]
+        + "</b>"
+        + common["flag_text"]
+        + common["badge_end"]
+        + common["signal_line"]
+        + "<br/><b>Volatility Stop ("
+        + common["stop_pct"]
+        + "%):</b> $"
+        + _fmt(price * (1 - suggested_stop / 100), "{:.2f}")
+        + ' loss = <font color="#e74c3c">-'
+        + common["stop_pct"]
+        + "%</font><br/><b>8% Stop Tolerance:</b> $"
+        + _fmt(stop_level, "{:.2f}")
+        + " | <b>Accessible Supports:</b> "
+        + _text(rows["accessible_supports_count"])
+        + " within range<br/><b>Target R1:</b> $"
+        + _fmt(r1, "{:.2f}")
+        + ' gain = <font color="#27ae60">+'
+        + _fmt(reward_pct, "{:.1f}")
+        + "%</font><br/><br/><b>Support S1:</b> $"
+        + _fmt(s1, "{:.2f}")
+        + " ("
+        + _fmt(distance_to_s1, "{:.1f}")
+        + "% away)"
+        + common["volatility"]
+        + "<br/><i>"
+        + _text(note).where(_present(note), "")
+        + "</i>"
+    )
+
+
+def _best_sell_card_text(rows, quality_col):
+    """
+    Card markup for the ranked sell (short) setups, built column-wise
+
+    Args:
+        rows: Ranked sell rows (vol_rr computed), best first
+        quality_col: short_entry_quality, or r1_quality when it is absent
+
+    Returns:
+        Series of card markup in rank order
+    """
+    rows = _with_defaults(rows, BEST_TRADES_SELL_DEFAULTS)
+    price = rows["current_price"].astype(float)
+    s1 = rows["s1"].astype(float)
+    r1 = rows["r1"].astype(float)
+    suggested_stop = rows["suggested_stop_pct"].astype(float)
+    common = _best_trade_card_common(rows, quality_col, "short_entry_flag")
+
+    reward_pct = ((price - s1) / price * 100).where(
+        (price > 0) & (s1 > 0) & (price > s1), 0
+    )
+    distance_to_r1 = ((r1 - price) / price * 100).abs().where((price > 0) & (r1 > 0), 0)
+
+    # For sells the flag sits inside the bold quality badge and the stop is above price
+    return (
+        common["header"]
+        + common["flag_text"]
+        + "</b>"
+        + common["badge_end"]
+        + common["signal_line"]
+        + "<br/><b>Volatility Stop ("
+        + common["stop_pct"]
+        + "%):</b> $"
+        + _fmt(price * (1 + suggested_stop / 100), "{:.2f}")
+        + ' loss = <font color="#e74c3c">-'
+        + common["stop_pct"]
+        + "%</font><br/><b>Target S1:</b> $"
+        + _fmt(s1, "{:.2f}")
+        + ' gain = <font color="#27ae60">+'
+        + _fmt(reward_pct, "{:.1f}")
+        + "%</font><br/><br/><b>Resistance R1:</b> $"
+        + _fmt(r1, "{:.2f}")
+        + " ("
+        + _fmt(distance_to_r1, "{:.1f}")
+        + "% away)"
+        + common["volatility"]
+    )
+
+
+# Column defaults for the best-trades cards (mirror the former stock.get() calls)
+BEST_TRADES_DEFAULTS = {
+    "current_price": 0,
+    "s1": 0,
+    "r1": 0,
+    "suggested_stop_pct": 5.0,
+    "volatility_class": "",
+    "avg_daily_range_pct": 0,
+}
+BEST_TRADES_BUY_DEFAULTS = {
+    **BEST_TRADES_DEFAULTS,
+    "accessible_supports_count": 0,
+    "entry_note": "",
+}
+BEST_TRADES_SELL_DEFAULTS = BEST_TRADES_DEFAULTS
+
+
 def create_best_trades_pdf(
     buy_df, sell_df, output_file, category="", regime=None, as_of_date=None
 ):
@@ -2159,8 +2968,6 @@ def create_best_trades_pdf(
         as_of_date: Optional date string (YYYY-MM-DD) or datetime for historical reports
     """
     from reportlab.lib.pagesizes import letter
-    from reportlab.lib import colors
-    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
     from reportlab.lib.units import inch
     from reportlab.platypus import (
         SimpleDocTemplate,
@@ -2169,10 +2976,11 @@ def create_best_trades_pdf(
         Table,
         TableStyle,
     )
-    from reportlab.lib.enums import TA_CENTER, TA_LEFT
 
+    # Render in memory; the file is written in one go once the build succeeds
+    pdf_buffer = io.BytesIO()
     doc = SimpleDocTemplate(
-        str(output_file),
+        pdf_buffer,
         pagesize=letter,
         rightMargin=30,
         leftMargin=30,
@@ -2181,26 +2989,11 @@ def create_best_trades_pdf(
     )
 
     elements = []
-    styles = getSampleStyleSheet()
-
-    # Custom styles
-    title_style = ParagraphStyle(
-        "CustomTitle",
-        parent=styles["Heading1"],
-        fontSize=24,
-        textColor=colors.HexColor("#2c3e50"),
-        spaceAfter=20,
-        alignment=TA_CENTER,
-    )
+    styles = PDF_STYLES
+    normal_style = styles["Normal"]
 
-    section_style = ParagraphStyle(
-        "Section",
-        parent=styles["Heading2"],
-        fontSize=16,
-        textColor=colors.HexColor("#2980b9"),
-        spaceAfter=12,
-        spaceBefore=20,
-    )
+    title_style = PDF_TITLE_STYLE
+    section_style = PDF_SECTION_STYLE
 
     # === TITLE PAGE ===
     report_title = category.replace("&", "&amp;")
@@ -2264,7 +3057,7 @@ def create_best_trades_pdf(
         <font size=10>Buys allowed: {allow_buys}</font>
         </para>
         """
-        elements.append(Paragraph(regime_info, styles["Normal"]))
+        elements.append(Paragraph(regime_info, normal_style))
         elements.append(Spacer(1, 0.3 * inch))
 
     # === PAGE 2: GLOSSARY OF TERMS ===
@@ -2274,65 +3067,12 @@ def create_best_trades_pdf(
 
     elements.append(Paragraph("GLOSSARY OF TERMS", section_style))
 
-    glossary_items = [
-        ("<b>Quality Ratings:</b>", ""),
-        (
-            "  • <b>EXCELLENT:</b>",
-            "2+ strong supports accessible within stop tolerance. Safest entries.",
-        ),
-        (
-            "  • <b>GOOD:</b>",
-            "1+ good support accessible within stop tolerance. Solid risk management.",
-        ),
-        (
-            "  • <b>OK:</b>",
-            "Moderate supports available. Acceptable but watch closely.",
-        ),
-        (
-            "  • <b>CAUTION:</b>",
-            "Thin or extended. Limited protection within stop range.",
-        ),
-        ("", ""),
-        ("<b>Quality Flags:</b>", ""),
-        (
-            "  • <b>SAFE ENTRY:</b>",
-            "Multiple excellent supports protect your stop level.",
-        ),
-        ("  • <b>IDEAL:</b>", "Near major support with good upside potential."),
-        ("  • <b>ACCEPTABLE:</b>", "Reasonable entry but monitor risk carefully."),
-        ("  • <b>THIN:</b>", "Limited support structure. Higher risk."),
-        ("  • <b>EXTENDED:</b>", "Far from supports. Consider waiting for pullback."),
-        ("  • <b>WAIT:</b>", "No accessible supports within 8% stop. Do not enter."),
-        ("", ""),
-        (
-            "<b>Vol R:R (Volatility Risk-Reward):</b>",
-            "Ratio of potential gain to volatility stop risk. 3+ = excellent, 2+ = good, 1+ = acceptable.",
-        ),
-        (
-            "<b>Volatility Stop:</b>",
-            "Stop-loss based on stock's price movement (typically 5-8%). Limits maximum loss.",
-        ),
-        (
-            "<b>Stop Tolerance:</b>",
-            "Maximum acceptable stop distance (8%). Entries are rated based on supports within this range.",
-        ),
-        (
-            "<b>RSI:</b>",
-            "Relative Strength Index (0-100). <30 oversold, >70 overbought.",
-        ),
-        ("<b>S1/R1:</b>", "Primary support and resistance levels. Key price targets."),
-        (
-            "<b>D50/D100/D200:</b>",
-            "50/100/200-day moving averages. Trend and support indicators.",
-        ),
-    ]
-
-    for term, definition in glossary_items:
+    for term, definition in BEST_TRADES_GLOSSARY_ITEMS:
         if term and definition:
-            elements.append(Paragraph(f"{term} {definition}", styles["Normal"]))
+            elements.append(Paragraph(f"{term} {definition}", normal_style))
             elements.append(Spacer(1, 0.04 * inch))
         elif term and not definition:
-            elements.append(Paragraph(term, styles["Normal"]))
+            elements.append(Paragraph(term, normal_style))
             elements.append(Spacer(1, 0.03 * inch))
         else:
             elements.append(Spacer(1, 0.06 * inch))
@@ -2346,11 +3086,11 @@ def create_best_trades_pdf(
 
     if not buy_scored.empty:
         # Filter for EXCELLENT and GOOD entry quality only (stop-aware)
-        quality_col = (
+        buy_quality_col = (
             "entry_quality" if "entry_quality" in buy_scored.columns else "buy_quality"
         )
         buy_scored = buy_scored[
-            buy_scored[quality_col].isin(["EXCELLENT", "GOOD"])
+            buy_scored[buy_quality_col].isin(["EXCELLENT", "GOOD"])
         ].copy()
 
         if not buy_scored.empty:
@@ -2369,20 +3109,22 @@ def create_best_trades_pdf(
                     reward / suggested_stop if suggested_stop > 0 and reward > 0 else 0
                 )
 
-            buy_scored["vol_rr"] = buy_scored.apply(calc_vol_rr, axis=1)
+            buy_scored["vol_rr"] = [
+                calc_vol_rr(row) for row in buy_scored.to_dict(orient="records")
+            ]
 
             # Sort by Vol R:R (highest first), take top 15
             buy_scored = buy_scored.sort_values("vol_rr", ascending=False).head(15)
 
     if not sell_scored.empty:
         # Filter for EXCELLENT and GOOD short entry quality
-        quality_col = (
+        sell_quality_col = (
             "short_entry_quality"
             if "short_entry_quality" in sell_scored.columns
             else "r1_quality"
         )
         sell_scored = sell_scored[
-            sell_scored[quality_col].isin(["EXCELLENT", "GOOD"])
+            sell_scored[sell_quality_col].isin(["EXCELLENT", "GOOD"])
         ].copy()
 
         if not sell_scored.empty:
@@ -2401,7 +3143,9 @@ def create_best_trades_pdf(
                     reward / suggested_stop if suggested_stop > 0 and reward > 0 else 0
                 )
 
-            sell_scored["vol_rr"] = sell_scored.apply(calc_vol_rr, axis=1)
+            sell_scored["vol_rr"] = [
+                calc_vol_rr(row) for row in sell_scored.to_dict(orient="records")
+            ]
 
             # Sort by Vol R:R (highest first), take top 15
             sell_scored = sell_scored.sort_values("vol_rr", ascending=False).head(15)
@@ -2429,7 +3173,7 @@ def create_best_trades_pdf(
     <br/>
     <i>Focus on higher Vol R:R setups (2:1 or better) for optimal risk-adjusted returns.</i>
     """
-    elements.append(Paragraph(summary_text, styles["Normal"]))
+    elements.append(Paragraph(summary_text, normal_style))
 
     # Page break after page 2 content
     elements.append(PageBreak())
@@ -2439,80 +3183,15 @@ def create_best_trades_pdf(
         elements.append(Paragraph(f"TOP {len(buy_scored)} BUY SETUPS", section_style))
         elements.append(Spacer(1, 0.1 * inch))
 
-        for rank, (_, stock) in enumerate(buy_scored.iterrows(), 1):
-            ticker = stock["ticker"]
-            price = stock.get("current_price", 0)
-            # Use entry_quality (stop-aware) if available
-            quality = stock.get("entry_quality", stock.get("buy_quality", ""))
-            entry_flag = stock.get("entry_flag", "")
-            signal = stock.get("signal", "")
-            s1 = stock.get("s1", 0)
-            r1 = stock.get("r1", 0)
-            rsi = stock.get("rsi")
-            vol_rr = stock.get("vol_rr", 0)
-
-            # Calculate reward potential
-            reward_pct = (
-                ((r1 - price) / price * 100)
-                if price > 0 and r1 > 0 and r1 > price
-                else 0
-            )
-            distance_to_s1 = (
-                abs((price - s1) / price * 100) if price > 0 and s1 > 0 else 0
-            )
-
-            # Volatility-based stop
-            suggested_stop = stock.get("suggested_stop_pct", 5.0)
-            vol_stop_price = price * (1 - suggested_stop / 100)
-
-            # Quality badge color
-            if quality == "EXCELLENT":
-                quality_color = "#27ae60"  # Green
-            else:  # GOOD
-                quality_color = "#3498db"  # Blue
-
-            # Vol R:R color
-            if vol_rr >= 3:
-                rr_color = "#27ae60"  # Green
-            elif vol_rr >= 2:
-                rr_color = "#3498db"  # Blue
-            elif vol_rr >= 1:
-                rr_color = "#f39c12"  # Orange
-            else:
-                rr_color = "#e74c3c"  # Red
-
-            # Volatility class display
-            volatility_class = stock.get("volatility_class", "")
-            daily_range = stock.get("avg_daily_range_pct", 0)
-
-            # Stop-aware details
-            stop_tolerance = stock.get("stop_tolerance_pct", 8.0)
-            stop_level = stock.get("stop_level", price * 0.92)
-            accessible_supports = stock.get("accessible_supports_count", 0)
-            entry_note = stock.get("entry_note", "")
-
-            # Format entry flag for display
-            entry_flag_display = f" {entry_flag}" if entry_flag else ""
-
-            card_text = f"""
-            <font size=12><b>#{rank}. {ticker} - ${price:.2f}</b> | <font color="{quality_color}"><b>{quality}</b>{entry_flag_display}</font> | Vol R:R: <font color="{rr_color}"><b>{vol_rr:.1f}:1</b></font></font><br/>
-            <b>RSI:</b> {f'{rsi:.1f}' if rsi else 'N/A'} | <b>Signal:</b> {signal or 'N/A'}<br/>
-            <br/>
-            <b>Volatility Stop ({suggested_stop:.1f}%):</b> ${vol_stop_price:.2f} loss = <font color="#e74c3c">-{suggested_stop:.1f}%</font><br/>
-            <b>8% Stop Tolerance:</b> ${stop_level:.2f} | <b>Accessible Supports:</b> {accessible_supports} within range<br/>
-            <b>Target R1:</b> ${r1:.2f} gain = <font color="#27ae60">+{reward_pct:.1f}%</font><br/>
-            <br/>
-            <b>Support S1:</b> ${s1:.2f} ({distance_to_s1:.1f}% away) | <b>Volatility:</b> {volatility_class} (~{daily_range:.2f}% daily range)<br/>
-            <i>{entry_note}</i>
-            """
-            elements.append(Paragraph(card_text, styles["Normal"]))
+        for card_text in _best_buy_card_text(buy_scored, buy_quality_col):
+            elements.append(Paragraph(card_text, normal_style))
             elements.append(Spacer(1, 0.15 * inch))
     else:
         elements.append(Paragraph("TOP BUY SETUPS", section_style))
         elements.append(
             Paragraph(
                 "No EXCELLENT/GOOD entry quality (stop-aware) buy opportunities found. Good supports may exist but are beyond 8% stop tolerance.",
-                styles["Normal"],
+                normal_style,
             )
         )
         elements.append(Spacer(1, 0.2 * inch))
@@ -2522,79 +3201,25 @@ def create_best_trades_pdf(
         elements.append(Paragraph(f"TOP {len(sell_scored)} SELL SETUPS", section_style))
         elements.append(Spacer(1, 0.1 * inch))
 
-        for rank, (_, stock) in enumerate(sell_scored.iterrows(), 1):
-            ticker = stock["ticker"]
-            price = stock.get("current_price", 0)
-            quality = stock.get("short_entry_quality", stock.get("r1_quality", ""))
-            short_entry_flag = stock.get("short_entry_flag", "")
-            signal = stock.get("signal", "")
-            r1 = stock.get("r1", 0)
-            s1 = stock.get("s1", 0)
-            rsi = stock.get("rsi")
-            vol_rr = stock.get("vol_rr", 0)
-
-            # Calculate reward potential
-            reward_pct = (
-                ((price - s1) / price * 100)
-                if price > 0 and s1 > 0 and price > s1
-                else 0
-            )
-            distance_to_r1 = (
-                abs((r1 - price) / price * 100) if price > 0 and r1 > 0 else 0
-            )
-
-            # Volatility-based stop (for sell: stop is above price)
-            suggested_stop = stock.get("suggested_stop_pct", 5.0)
-            vol_stop_price = price * (1 + suggested_stop / 100)
-
-            # Quality badge color
-            if quality == "EXCELLENT":
-                quality_color = "#27ae60"  # Green
-            else:  # GOOD
-                quality_color = "#3498db"  # Blue
-
-            # Vol R:R color
-            if vol_rr >= 3:
-                rr_color = "#27ae60"  # Green
-            elif vol_rr >= 2:
-                rr_color = "#3498db"  # Blue
-            elif vol_rr >= 1:
-                rr_color = "#f39c12"  # Orange
-            else:
-                rr_color = "#e74c3c"  # Red
-
-            # Volatility class display
-            volatility_class = stock.get("volatility_class", "")
-            daily_range = stock.get("avg_daily_range_pct", 0)
-
-            # Format short entry flag for display
-            short_flag_text = f" {short_entry_flag}" if short_entry_flag else ""
-
-            card_text = f"""
-            <font size=12><b>#{rank}. {ticker} - ${price:.2f}</b> | <font color="{quality_color}"><b>{quality}{short_flag_text}</b></font> | Vol R:R: <font color="{rr_color}"><b>{vol_rr:.1f}:1</b></font></font><br/>
-            <b>RSI:</b> {f'{rsi:.1f}' if rsi else 'N/A'} | <b>Signal:</b> {signal or 'N/A'}<br/>
-            <br/>
-            <b>Volatility Stop ({suggested_stop:.1f}%):</b> ${vol_stop_price:.2f} loss = <font color="#e74c3c">-{suggested_stop:.1f}%</font><br/>
-            <b>Target S1:</b> ${s1:.2f} gain = <font color="#27ae60">+{reward_pct:.1f}%</font><br/>
-            <br/>
-            <b>Resistance R1:</b> ${r1:.2f} ({distance_to_r1:.1f}% away) | <b>Volatility:</b> {volatility_class} (~{daily_range:.2f}% daily range)
-            """
-            elements.append(Paragraph(card_text, styles["Normal"]))
+        for card_text in _best_sell_card_text(sell_scored, sell_quality_col):
+            elements.append(Paragraph(card_text, normal_style))
             elements.append(Spacer(1, 0.15 * inch))
     else:
         elements.append(Paragraph("TOP SELL SETUPS", section_style))
         elements.append(
             Paragraph(
-                "No EXCELLENT/GOOD quality sell opportunities found.", styles["Normal"]
+                "No EXCELLENT/GOOD quality sell opportunities found.", normal_style
             )
         )
 
     # Build PDF
     doc.build(elements)
+    _write_file_atomic(output_file, pdf_buffer.getvalue())
     print(f"[OK] Best Trades PDF created: {output_file}")
 
 
-if __name__ == "__main__":
+def main():
+    """Scan S&P 500, NASDAQ 100 and portfolio stocks and write the reports"""
     import argparse
     from pathlib import Path
     import sys
@@ -2618,8 +3243,11 @@ if __name__ == "__main__":
     parser.add_argument(
         "--concurrency",
         type=int,
-        default=2,
-        help="Threads (default: 2, higher values risk rate limiting)",
+        default=DEFAULT_SCAN_CONCURRENCY,
+        help=(
+            f"Threads per scan (default: {DEFAULT_SCAN_CONCURRENCY}, from $SCAN_CONCURRENCY"
+            " or the CPU count; Yahoo requests are paced and backed off on 429s)"
+        ),
     )
     parser.add_argument(
         "--as-of-date",
@@ -2635,35 +3263,103 @@ if __name__ == "__main__":
     results_dir.mkdir(exist_ok=True)
 
     timestamp = datetime.now().strftime("%Y%m%d_%H%M")
-    overall_start = datetime.now()
+    overall_start = perf_counter()
+    timings = {}  # phase -> seconds, printed with the summary
+
+    # Excel/PDF writers are CPU-bound, so each category's reports are built in
+    # separate worker processes and overlap with one another
+    report_pool = ProcessPoolExecutor(max_workers=min(4, os.cpu_count() or 1))
+    report_jobs = []
+
+    # Historical runs analyze prefetched bars in worker processes; the three
+    # scans share one pool instead of each starting one per core
+    analysis_pool = None
+    if args.as_of_date and (os.cpu_count() or 1) > 1:
+        analysis_pool = ProcessPoolExecutor(max_workers=os.cpu_count() or 1)
+        # Start the workers now, before any download or scan threads exist
+        analysis_pool.submit(int).result()
 
     # === REGIME ANALYSIS (MANDATORY) ===
+    phase_start = perf_counter()
     regime = analyze_market_regime(
         daily_bars=args.daily_bars,
         weekly_bars=args.weekly_bars,
         as_of_date=args.as_of_date,
     )
+    timings["Regime analysis"] = perf_counter() - phase_start
 
-    # === SCAN 1: S&P 500 ===
-    print("\n" + "=" * 80)
-    print("SCAN 1 of 3: S&P 500")
-    print("=" * 80 + "\n")
-
+    # === TICKER LISTS ===
     print("Fetching S&P 500 ticker list...")
     sp500_tickers = get_sp500_tickers()
-    print(f"Found {len(sp500_tickers)} S&P 500 stocks\n")
+    print(f"Found {len(sp500_tickers)} S&P 500 stocks")
 
-    start_time = datetime.now()
-    sp500_results = scan_stocks(
-        sp500_tickers,
-        category="S&P 500",
-        daily_bars=args.daily_bars,
-        weekly_bars=args.weekly_bars,
-        concurrency=args.concurrency,
-        as_of_date=args.as_of_date,
-        regime=regime,
+    print("Fetching NASDAQ 100 ticker list...")
+    nasdaq100_tickers = get_nasdaq100_tickers()
+    print(f"Found {len(nasdaq100_tickers)} NASDAQ 100 stocks")
+
+    print("Loading portfolio tickers from stocks.txt...")
+    portfolio_tickers = get_portfolio_tickers()
+
+    # === PRICE HISTORY ===
+    # Most of the NASDAQ 100 is also in the S&P 500 (and portfolio stocks often
+    # are too), so history for the union is downloaded once and shared
+    phase_start = perf_counter()
+    all_tickers = list(
+        dict.fromkeys(sp500_tickers + nasdaq100_tickers + portfolio_tickers)
+    )
+    histories = fetch_price_histories(
+        all_tickers, args.daily_bars, args.weekly_bars, args.as_of_date
     )
-    sp500_elapsed = (datetime.now() - start_time).total_seconds()
+    timings["Price download"] = perf_counter() - phase_start
+
+    # === SCANS (run concurrently) ===
+    # The three scans cover separate ticker lists and mostly wait on yfinance,
+    # so they overlap; each still uses --concurrency threads of its own
+    def run_scan(tickers, category):
+        start_time = perf_counter()
+        results = scan_stocks(
+            tickers,
+            category=category,
+            daily_bars=args.daily_bars,
+            weekly_bars=args.weekly_bars,
+            concurrency=args.concurrency,
+            as_of_date=args.as_of_date,
+            regime=regime,
+            histories=histories,
+            process_pool=analysis_pool,
+        )
+        return results, perf_counter() - start_time
+
+    scan_inputs = {"S&P 500": sp500_tickers, "NASDAQ 100": nasdaq100_tickers}
+    if portfolio_tickers:
+        scan_inputs["Portfolio"] = portfolio_tickers
+
+    scans = {}
+    phase_start = perf_counter()
+    with ThreadPoolExecutor(max_workers=3) as scan_pool:
+        scan_futures = {
+            scan_pool.submit(run_scan, tickers, category): category
+            for category, tickers in scan_inputs.items()
+        }
+        for future in as_completed(scan_futures):
+            category = scan_futures[future]
+            try:
+                scans[category] = future.result()
+            except Exception as e:
+                # One failed index shouldn't cost the others their reports
+                print(f"[ERROR] {category} scan failed: {e}")
+                scans[category] = (pd.DataFrame(), 0.0)
+    if analysis_pool:
+        analysis_pool.shutdown()
+    timings["Scans"] = perf_counter() - phase_start
+
+    sp500_results, sp500_elapsed = scans["S&P 500"]
+    nasdaq100_results, nasdaq100_elapsed = scans["NASDAQ 100"]
+
+    # === RESULTS 1: S&P 500 ===
+    print("\n" + "=" * 80)
+    print("RESULTS 1 of 3: S&P 500")
+    print("=" * 80 + "\n")
 
     if not sp500_results.empty:
         sp500_buy = filter_buy_signals(sp500_results, "FULL HOLD + ADD", regime=regime)
@@ -2676,9 +3372,24 @@ if __name__ == "__main__":
             xlsx_path = results_dir / f"sp500_playbook_{timestamp}.xlsx"
             pdf_path = results_dir / f"sp500_playbook_{timestamp}.pdf"
 
-            create_excel_output(sp500_buy, sp500_sell, xlsx_path, category="S&P 500")
-            create_pdf_report(
-                sp500_buy, sp500_results, pdf_path, timestamp, category="S&P 500"
+            report_jobs.append(
+                report_pool.submit(
+                    create_excel_output,
+                    sp500_buy,
+                    sp500_sell,
+                    xlsx_path,
+                    category="S&P 500",
+                )
+            )
+            report_jobs.append(
+                report_pool.submit(
+                    create_pdf_report,
+                    sp500_buy,
+                    sp500_results,
+                    pdf_path,
+                    timestamp,
+                    category="S&P 500",
+                )
             )
 
             print(f"  âœ“ Excel: {xlsx_path.name}")
@@ -2690,35 +3401,31 @@ if __name__ == "__main__":
             )
             best_trades_pdf = results_dir / "sp500" / f"sp500_watchlist_{timestamp}.pdf"
             (results_dir / "sp500").mkdir(exist_ok=True)
-            create_best_trades_excel(
-                sp500_buy, sp500_sell, best_trades_xlsx, category="S&P 500"
+            report_jobs.append(
+                report_pool.submit(
+                    create_best_trades_excel,
+                    sp500_buy,
+                    sp500_sell,
+                    best_trades_xlsx,
+                    category="S&P 500",
+                )
             )
-            create_best_trades_pdf(
-                sp500_buy, sp500_sell, best_trades_pdf, category="S&P 500"
+            report_jobs.append(
+                report_pool.submit(
+                    create_best_trades_pdf,
+                    sp500_buy,
+                    sp500_sell,
+                    best_trades_pdf,
+                    category="S&P 500",
+                )
             )
             print(f"  Best Trades: {best_trades_xlsx.name}, {best_trades_pdf.name}")
 
-    # === SCAN 2: NASDAQ 100 ===
+    # === RESULTS 2: NASDAQ 100 ===
     print("\n" + "=" * 80)
-    print("SCAN 2 of 3: NASDAQ 100")
+    print("RESULTS 2 of 3: NASDAQ 100")
     print("=" * 80 + "\n")
 
-    print("Fetching NASDAQ 100 ticker list...")
-    nasdaq100_tickers = get_nasdaq100_tickers()
-    print(f"Found {len(nasdaq100_tickers)} NASDAQ 100 stocks\n")
-
-    start_time = datetime.now()
-    nasdaq100_results = scan_stocks(
-        nasdaq100_tickers,
-        category="NASDAQ 100",
-        daily_bars=args.daily_bars,
-        weekly_bars=args.weekly_bars,
-        concurrency=args.concurrency,
-        as_of_date=args.as_of_date,
-        regime=regime,
-    )
-    nasdaq100_elapsed = (datetime.now() - start_time).total_seconds()
-
     if not nasdaq100_results.empty:
         nasdaq100_buy = filter_buy_signals(
             nasdaq100_results, "FULL HOLD + ADD", regime=regime
@@ -2732,16 +3439,25 @@ if __name__ == "__main__":
             xlsx_path = results_dir / f"nasdaq100_playbook_{timestamp}.xlsx"
             pdf_path = results_dir / f"nasdaq100_playbook_{timestamp}.pdf"
 
-            create_excel_output(
-                nasdaq100_buy, nasdaq100_sell, xlsx_path, category="NASDAQ 100"
+            report_jobs.append(
+                report_pool.submit(
+                    create_excel_output,
+                    nasdaq100_buy,
+                    nasdaq100_sell,
+                    xlsx_path,
+                    category="NASDAQ 100",
+                )
             )
-            create_pdf_report(
-                nasdaq100_buy,
-                nasdaq100_results,
-                pdf_path,
-                timestamp,
-                category="NASDAQ 100",
-                regime=regime,
+            report_jobs.append(
+                report_pool.submit(
+                    create_pdf_report,
+                    nasdaq100_buy,
+                    nasdaq100_results,
+                    pdf_path,
+                    timestamp,
+                    category="NASDAQ 100",
+                    regime=regime,
+                )
             )
 
             print(f"  âœ“ Excel: {xlsx_path.name}")
@@ -2752,42 +3468,38 @@ if __name__ == "__main__":
                 results_dir / "nasdaq100" / f"nasdaq100_best_trades_{timestamp}.pdf"
             )
             (results_dir / "nasdaq100").mkdir(exist_ok=True)
-            create_best_trades_excel(
-                nasdaq100_buy, nasdaq100_sell, best_trades_xlsx, category="NASDAQ 100"
+            report_jobs.append(
+                report_pool.submit(
+                    create_best_trades_excel,
+                    nasdaq100_buy,
+                    nasdaq100_sell,
+                    best_trades_xlsx,
+                    category="NASDAQ 100",
+                )
             )
-            create_best_trades_pdf(
-                nasdaq100_buy,
-                nasdaq100_sell,
-                best_trades_pdf,
-                category="NASDAQ 100",
-                regime=regime,
+            report_jobs.append(
+                report_pool.submit(
+                    create_best_trades_pdf,
+                    nasdaq100_buy,
+                    nasdaq100_sell,
+                    best_trades_pdf,
+                    category="NASDAQ 100",
+                    regime=regime,
+                )
             )
 
             print(f"  âœ“ PDF: {pdf_path.name}")
 
             print(f"  Best Trades: {best_trades_xlsx.name}, {best_trades_pdf.name}")
-    # === SCAN 3: PORTFOLIO STOCKS ===
+    # === RESULTS 3: PORTFOLIO STOCKS ===
     print("\n" + "=" * 80)
-    print("SCAN 3 of 3: PORTFOLIO STOCKS")
+    print("RESULTS 3 of 3: PORTFOLIO STOCKS")
     print("=" * 80 + "\n")
 
-    print("Loading portfolio tickers from stocks.txt...")
-    portfolio_tickers = get_portfolio_tickers()
-
     if portfolio_tickers:
         print(f"Found {len(portfolio_tickers)} portfolio stocks\n")
 
-        start_time = datetime.now()
-        portfolio_results = scan_stocks(
-            portfolio_tickers,
-            category="Portfolio",
-            daily_bars=args.daily_bars,
-            weekly_bars=args.weekly_bars,
-            concurrency=args.concurrency,
-            as_of_date=args.as_of_date,
-            regime=regime,
-        )
-        portfolio_elapsed = (datetime.now() - start_time).total_seconds()
+        portfolio_results, portfolio_elapsed = scans["Portfolio"]
 
         if not portfolio_results.empty:
             # For portfolio, include ALL stocks (not just FULL HOLD + ADD)
@@ -2807,53 +3519,69 @@ if __name__ == "__main__":
             pdf_path = results_dir / f"portfolio_playbook_{timestamp}.pdf"
 
             # Pass ALL results for portfolio
-            create_portfolio_excel(portfolio_results, xlsx_path, category="Portfolio")
+            report_jobs.append(
+                report_pool.submit(
+                    create_portfolio_excel,
+                    portfolio_results,
+                    xlsx_path,
+                    category="Portfolio",
+                )
+            )
 
             # For PDF, still show FULL HOLD + ADD in detail (with all stocks in summary)
             if not portfolio_buy.empty:
-                create_pdf_report(
-                    portfolio_buy,
-                    portfolio_results,
-                    pdf_path,
-                    timestamp,
-                    category="Portfolio",
-                    regime=regime,
+                report_jobs.append(
+                    report_pool.submit(
+                        create_pdf_report,
+                        portfolio_buy,
+                        portfolio_results,
+                        pdf_path,
+                        timestamp,
+                        category="Portfolio",
+                        regime=regime,
+                    )
                 )
 
             print(f"  âœ“ Excel: {xlsx_path.name}")
-            print(f"  âœ“ PDF: {pdf_path.name}")
+            if not portfolio_buy.empty:
+                print(f"  âœ“ PDF: {pdf_path.name}")
+            else:
+                print("  - PDF skipped (no FULL HOLD + ADD signals)")
     else:
         print("âš ï¸  No portfolio tickers found in stocks.txt")
 
+    # Wait for the background report writers (re-raises any failure)
+    phase_start = perf_counter()
+    for job in report_jobs:
+        job.result()
+    report_pool.shutdown()
+    timings["Report writing (wait)"] = perf_counter() - phase_start
+
     # === FINAL SUMMARY ===
-    total_elapsed = (datetime.now() - overall_start).total_seconds()
+    total_elapsed = perf_counter() - overall_start
 
     print("\n" + "=" * 80)
     print("SCAN COMPLETE - SUMMARY")
     print("=" * 80)
     print(f"[TIME] Total time: {total_elapsed:.1f}s")
+    for phase, seconds in timings.items():
+        print(f"  {phase}: {seconds:.1f}s")
     print(f"\nðŸ“Š Results by Category:")
 
     if not sp500_results.empty:
-        sp500_buy_count = len(
-            filter_buy_signals(sp500_results, "FULL HOLD + ADD", regime=regime)
-        )
+        sp500_buy_count = len(sp500_buy)
         print(
             f"  S&P 500:     {sp500_buy_count:3d} FULL HOLD + ADD signals ({sp500_elapsed:.1f}s)"
         )
 
     if not nasdaq100_results.empty:
-        nasdaq100_buy_count = len(
-            filter_buy_signals(nasdaq100_results, "FULL HOLD + ADD", regime=regime)
-        )
+        nasdaq100_buy_count = len(nasdaq100_buy)
         print(
             f"  NASDAQ 100:  {nasdaq100_buy_count:3d} FULL HOLD + ADD signals ({nasdaq100_elapsed:.1f}s)"
         )
 
     if portfolio_tickers and not portfolio_results.empty:
-        portfolio_buy_count = len(
-            filter_buy_signals(portfolio_results, "FULL HOLD + ADD", regime=regime)
-        )
+        portfolio_buy_count = len(portfolio_buy)
         print(
             f"  Portfolio:   {portfolio_buy_count:3d} FULL HOLD + ADD signals ({portfolio_elapsed:.1f}s)"
         )
@@ -2861,3 +3589,7 @@ if __name__ == "__main__":
     # Cleanup old scans (keep 1 most recent per category)
     print("\nðŸ“ Managing scan history...")
     cleanup_old_scans(results_dir, max_files=1)
+
+
+if __name__ == "__main__":
+    main()
@@ -6,7 +6,7 @@ Uses only data available as-of each historical date (no look-ahead bias).
 
 RATE LIMITING WARNING:
 - Historical scans bypass cache (need fresh data for each date)
-- Default concurrency=1 with 1-2s delays is safe (increase to 2 if no rate limits)
+- Default concurrency=1 is safe (increase to 2 if no rate limits); requests are paced globally
 - NASDAQ 100 (~100 stocks) recommended for testing vs S&P 500 (~500 stocks)
 - 5 years = ~260 reports = ~26,000 API calls (100 tickers × 260 reports × 1 call each)
 - If rate limited, wait 1 hour and resume with later --start date
@@ -30,8 +30,10 @@ Note: End date defaults to today if not specified
 """
 
 import argparse
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timedelta
 from pathlib import Path
+import os
 import sys
 
 # Add src to path
@@ -60,6 +62,7 @@ def generate_historical_report(
     weekly_bars=52,
     concurrency=2,
     use_cache=False,
+    process_pool=None,
 ):
     """
     Generate a scanner report as-of a historical date
@@ -73,12 +76,14 @@ def generate_historical_report(
         weekly_bars: Number of weekly bars
         concurrency: Parallel workers (default 2, reduce to 1 if rate limited)
         use_cache: If True, uses cached data (for regenerating reports with new format)
+        process_pool: Optional ProcessPoolExecutor reused across reports for the
+                      CPU-bound analysis of prefetched history
 
     Rate Limiting:
         - Cache doesn't help (need fresh data per date) unless use_cache=True
         - Each ticker = 2-3 API calls (daily + weekly data)
         - 100 tickers × 3 calls = 300 API calls per report
-        - With 1-2s delays and concurrency=2, expect ~2-5 min per report
+        - With shared request pacing and concurrency=2, expect ~2-5 min per report
     """
     print(f"\n{'='*80}")
     print(f"Generating Historical Report: {category}")
@@ -112,6 +117,7 @@ def generate_historical_report(
         concurrency=concurrency,
         as_of_date=as_of_date.strftime("%Y-%m-%d") if not use_cache else None,
         regime=regime,
+        process_pool=process_pool,
     )
 
     if results.empty:
@@ -275,7 +281,7 @@ def main():
         )
         print(f"Estimated time: ~{len(dates) * 2}-{len(dates) * 5} minutes")
         print(
-            f"Rate limit strategy: {args.concurrency} concurrent workers + 1-2s random delays"
+            f"Rate limit strategy: {args.concurrency} concurrent workers + shared request pacing"
         )
         print(f"\nIf rate limited:")
         print(f"  1. Wait 1 hour")
@@ -299,6 +305,14 @@ def main():
     else:
         categories = [args.category]
 
+    # One analysis pool for the whole run, so worker processes (and their
+    # imports) start once rather than for every report date
+    process_pool = None
+    if not args.use_cache and (os.cpu_count() or 1) > 1:
+        process_pool = ProcessPoolExecutor(max_workers=os.cpu_count())
+        # Start the workers now, before any download or scan threads exist
+        process_pool.submit(int).result()
+
     # Generate reports for each date
     for i, report_date in enumerate(dates, 1):
         print(f"\n{'='*80}")
@@ -331,11 +345,15 @@ def main():
                     args.weekly_bars,
                     args.concurrency,
                     args.use_cache,
+                    process_pool=process_pool,
                 )
             except Exception as e:
                 print(f"[ERROR] Failed to generate {category_name} report: {e}")
                 continue
 
+    if process_pool:
+        process_pool.shutdown()
+
     print(f"\n{'='*80}")
     print(f"HISTORICAL GENERATION COMPLETE")
     print(f"{'='*80}")
@@ -7,9 +7,16 @@ Validates input CSV files and configuration data for portfolio analysis.
 import pandas as pd
 from pathlib import Path
 import logging
+import re
 
 logger = logging.getLogger(__name__)
 
+# Valid ticker symbol: uppercase letters, digits, dots and dashes
+TICKER_PATTERN = re.compile(r"^[A-Z0-9\.\-]+$")
+
+# Strips the separators allowed in stocks.txt tickers before the isalnum() check
+TICKER_SEPARATORS = str.maketrans("", "", "-.")
+
 
 def validate_holdings_csv(filepath):
     """
@@ -24,10 +31,16 @@ def validate_holdings_csv(filepath):
         if not Path(filepath).exists():
             return False, f"File not found: {filepath}"
 
-        df = pd.read_csv(filepath)
-
         # Check required columns
         required_columns = ["ticker", "quantity", "avg_cost"]
+
+        # Only parse the columns we validate
+        df = pd.read_csv(
+            filepath,
+            usecols=lambda col: col in required_columns,
+            dtype={"ticker": "string"},
+        )
+
         missing_columns = [col for col in required_columns if col not in df.columns]
 
         if missing_columns:
@@ -51,10 +64,9 @@ def validate_holdings_csv(filepath):
         if df["ticker"].isnull().any():
             return False, "Column 'ticker' contains null values"
 
-        if not df["ticker"].astype(str).str.match(r"^[A-Z0-9\.\-]+$").all():
-            invalid_tickers = df[
-                ~df["ticker"].astype(str).str.match(r"^[A-Z0-9\.\-]+$")
-            ]["ticker"].tolist()
+        valid_mask = df["ticker"].astype(str).str.match(TICKER_PATTERN)
+        if not valid_mask.all():
+            invalid_tickers = df.loc[~valid_mask, "ticker"].tolist()
             return (
                 False,
                 f"Invalid ticker symbols: {', '.join(map(str, invalid_tickers))}",
@@ -142,58 +154,62 @@ def validate_stocks_txt(filepath):
         if not Path(filepath).exists():
             return False, f"File not found: {filepath}", 0
 
-        with open(filepath, "r", encoding="utf-8") as f:
-            lines = f.readlines()
-
-        if not lines:
-            return False, "File is empty", 0
-
         ticker_count = 0
         line_num = 0
 
-        for line in lines:
-            line_num += 1
-            line = line.strip()
-
-            # Skip empty lines and comments
-            if not line or line.startswith("#"):
-                continue
-
-            # Check basket format: [Basket Name] TICK1, TICK2
-            if line.startswith("["):
-                if "]" not in line:
-                    return (
-                        False,
-                        f"Line {line_num}: Invalid basket format (missing closing bracket)",
-                        ticker_count,
-                    )
-
-                bracket_end = line.index("]")
-                basket_name = line[1:bracket_end].strip()
-
-                if not basket_name:
-                    return False, f"Line {line_num}: Empty basket name", ticker_count
-
-                tickers_str = line[bracket_end + 1 :].strip()
-                if not tickers_str:
-                    return (
-                        False,
-                        f"Line {line_num}: No tickers in basket '{basket_name}'",
-                        ticker_count,
-                    )
-
-                tickers = [t.strip().upper() for t in tickers_str.split(",")]
-                ticker_count += len(tickers)
-            else:
-                # Individual ticker - basic validation
-                ticker = line.upper()
-                if not ticker.replace("-", "").replace(".", "").isalnum():
-                    return (
-                        False,
-                        f"Line {line_num}: Invalid ticker symbol '{ticker}'",
-                        ticker_count,
+        # Stream the file line by line instead of loading it with readlines()
+        with open(filepath, "r", encoding="utf-8") as f:
+            for line_num, line in enumerate(f, 1):
+                line = line.strip()
+
+                # Skip empty lines and comments
+                if not line or line.startswith("#"):
+                    continue
+
+                # Check basket format: [Basket Name] TICK1, TICK2
+                if line.startswith("["):
+                    if "]" not in line:
+                        return (
+                            False,
+                            f"Line {line_num}: Invalid basket format (missing closing bracket)",
+                            ticker_count,
+                        )
+
+                    bracket_end = line.index("]")
+                    basket_name = line[1:bracket_end].strip()
+
+                    if not basket_name:
+                        return (
+                            False,
+                            f"Line {line_num}: Empty basket name",
+                            ticker_count,
+                        )
+
+                    tickers_str = line[bracket_end + 1 :].strip()
+                    if not tickers_str:
+                        return (
+                            False,
+                            f"Line {line_num}: No tickers in basket '{basket_name}'",
+                            ticker_count,
+                        )
+
+                    tickers = list(
+                        map(str.upper, map(str.strip, tickers_str.split(",")))
                     )
-                ticker_count += 1
+                    ticker_count += len(tickers)
+                else:
+                    # Individual ticker - basic validation
+                    ticker = line.upper()
+                    if not ticker.translate(TICKER_SEPARATORS).isalnum():
+                        return (
+                            False,
+                            f"Line {line_num}: Invalid ticker symbol '{ticker}'",
+                            ticker_count,
+                        )
+                    ticker_count += 1
+
+        if line_num == 0:
+            return False, "File is empty", 0
 
         if ticker_count == 0:
             return False, "No valid tickers found in file", 0
@@ -12,6 +12,9 @@ Saves reports to scanner_results/weekly_larsson/
 import yfinance as yf
 import pandas as pd
 import numpy as np
+from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Alignment, Border, Font, Side
 from pathlib import Path
 from datetime import datetime, timedelta
 import warnings
@@ -147,6 +150,36 @@ def scan_nasdaq100_weekly(
     return pd.DataFrame(results)
 
 
+# Header style pandas' to_excel used (bold, thin border, centered)
+_HEADER_FONT = Font(bold=True)
+_HEADER_BORDER = Border(
+    left=Side(style="thin"),
+    right=Side(style="thin"),
+    top=Side(style="thin"),
+    bottom=Side(style="thin"),
+)
+_HEADER_ALIGN = Alignment(horizontal="center", vertical="top")
+
+
+def _header_cell(ws, value):
+    """Build a styled write-only header cell"""
+    cell = WriteOnlyCell(ws, value=value)
+    cell.font = _HEADER_FONT
+    cell.border = _HEADER_BORDER
+    cell.alignment = _HEADER_ALIGN
+    return cell
+
+
+def _append_sheet(wb, sheet_name: str, df: pd.DataFrame):
+    """Stream a DataFrame into a new write-only sheet (header row, then values)"""
+    ws = wb.create_sheet(sheet_name)
+    ws.append([_header_cell(ws, col) for col in df.columns])
+    for row in (
+        df.astype(object).where(df.notna(), None).itertuples(index=False, name=None)
+    ):
+        ws.append(row)
+
+
 def save_weekly_report(df: pd.DataFrame, output_dir: Path, report_date: datetime):
     """Save weekly report to Excel"""
     output_dir.mkdir(parents=True, exist_ok=True)
@@ -162,41 +195,48 @@ def save_weekly_report(df: pd.DataFrame, output_dir: Path, report_date: datetime
     df = df.sort_values(["_sort", "Distance_D200_Pct"], ascending=[True, False])
     df = df.drop(columns=["_sort"])
 
-    # Create Excel writer
-    with pd.ExcelWriter(filepath, engine="openpyxl") as writer:
-        # Summary sheet
-        summary_df = pd.DataFrame(
-            {
-                "Metric": [
-                    "Report Date",
-                    "Total Tickers",
-                    "P1 (Strong Bull)",
-                    "P2 (Consolidation)",
-                    "N1 (Weak Bear)",
-                    "N2 (Strong Bear)",
-                    "Avg Distance D200 (%)",
-                ],
-                "Value": [
-                    report_date.strftime("%Y-%m-%d"),
-                    len(df),
-                    len(df[df["Weekly_Larsson"] == "P1"]),
-                    len(df[df["Weekly_Larsson"] == "P2"]),
-                    len(df[df["Weekly_Larsson"] == "N1"]),
-                    len(df[df["Weekly_Larsson"] == "N2"]),
-                    f"{df['Distance_D200_Pct'].mean():.2f}",
-                ],
-            }
-        )
-        summary_df.to_excel(writer, sheet_name="Summary", index=False)
+    # Rows per weekly state, split once for the summary counts and state sheets
+    state_dfs = {
+        state: df[df["Weekly_Larsson"] == state] for state in ["P1", "P2", "N1", "N2"]
+    }
+
+    # Summary sheet
+    summary_df = pd.DataFrame(
+        {
+            "Metric": [
+                "Report Date",
+                "Total Tickers",
+                "P1 (Strong Bull)",
+                "P2 (Consolidation)",
+                "N1 (Weak Bear)",
+                "N2 (Strong Bear)",
+                "Avg Distance D200 (%)",
+            ],
+            "Value": [
+                report_date.strftime("%Y-%m-%d"),
+                len(df),
+                len(state_dfs["P1"]),
+                len(state_dfs["P2"]),
+                len(state_dfs["N1"]),
+                len(state_dfs["N2"]),
+                f"{df['Distance_D200_Pct'].mean():.2f}",
+            ],
+        }
+    )
+
+    # Write-only workbook: each sheet streams its rows straight to the file
+    wb = Workbook(write_only=True)
+    _append_sheet(wb, "Summary", summary_df)
+
+    # Full data sheet
+    _append_sheet(wb, "Weekly Data", df)
 
-        # Full data sheet
-        df.to_excel(writer, sheet_name="Weekly Data", index=False)
+    # Separate sheets by state
+    for state, state_df in state_dfs.items():
+        if len(state_df) > 0:
+            _append_sheet(wb, f"State_{state}", state_df)
 
-        # Separate sheets by state
-        for state in ["P1", "P2", "N1", "N2"]:
-            state_df = df[df["Weekly_Larsson"] == state]
-            if len(state_df) > 0:
-                state_df.to_excel(writer, sheet_name=f"State_{state}", index=False)
+    wb.save(filepath)
 
     print(f"Saved report: {filepath}")
     return filepath
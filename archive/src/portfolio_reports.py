@@ -27,6 +27,37 @@ from openpyxl import Workbook
 from openpyxl.styles import Font, PatternFill, Alignment
 from openpyxl.utils.dataframe import dataframe_to_rows
 
+# Sample stylesheet shared by all PDF reports (styles are never mutated)
+PDF_STYLES = getSampleStyleSheet()
+
+# Custom report styles, built once and shared
+PDF_TITLE_STYLE = ParagraphStyle(
+    "CustomTitle",
+    parent=PDF_STYLES["Heading1"],
+    fontSize=24,
+    textColor=colors.HexColor("#2c3e50"),
+    spaceAfter=20,
+    alignment=TA_CENTER,
+)
+
+PDF_SECTION_STYLE = ParagraphStyle(
+    "Section",
+    parent=PDF_STYLES["Heading2"],
+    fontSize=16,
+    textColor=colors.HexColor("#2980b9"),
+    spaceAfter=12,
+    spaceBefore=20,
+)
+
+PDF_SUBSECTION_STYLE = ParagraphStyle(
+    "Subsection",
+    parent=PDF_STYLES["Heading3"],
+    fontSize=12,
+    textColor=colors.HexColor("#34495e"),
+    spaceAfter=6,
+    spaceBefore=10,
+)
+
 
 def create_trading_playbook_pdf(portfolio_data, output_path, timestamp_str):
     """
@@ -58,35 +89,10 @@ def create_trading_playbook_pdf(portfolio_data, output_path, timestamp_str):
     )
 
     elements = []
-    styles = getSampleStyleSheet()
-
-    # Custom styles
-    title_style = ParagraphStyle(
-        "CustomTitle",
-        parent=styles["Heading1"],
-        fontSize=24,
-        textColor=colors.HexColor("#2c3e50"),
-        spaceAfter=20,
-        alignment=TA_CENTER,
-    )
-
-    section_style = ParagraphStyle(
-        "Section",
-        parent=styles["Heading2"],
-        fontSize=16,
-        textColor=colors.HexColor("#2980b9"),
-        spaceAfter=12,
-        spaceBefore=20,
-    )
-
-    subsection_style = ParagraphStyle(
-        "Subsection",
-        parent=styles["Heading3"],
-        fontSize=12,
-        textColor=colors.HexColor("#34495e"),
-        spaceAfter=6,
-        spaceBefore=10,
-    )
+    styles = PDF_STYLES
+    title_style = PDF_TITLE_STYLE
+    section_style = PDF_SECTION_STYLE
+    subsection_style = PDF_SUBSECTION_STYLE
 
     # === PAGE 1: DASHBOARD ===
     cover_title = f"Portfolio Playbook<br/><font size=14>{datetime.now().strftime('%B %d, %Y')}</font>"
@@ -374,6 +380,24 @@ def create_trading_playbook_pdf(portfolio_data, output_path, timestamp_str):
     return output_path
 
 
+def _autosize_columns(ws, min_width=0):
+    """
+    Size each column to its longest non-empty value plus padding
+
+    Args:
+        ws: openpyxl worksheet
+        min_width: Smallest column width
+    """
+    from openpyxl.utils import get_column_letter
+
+    # Read plain values column by column instead of touching each cell object
+    for col_num, values in enumerate(ws.iter_cols(values_only=True), ws.min_column):
+        max_length = max((len(str(value)) for value in values if value), default=0)
+        ws.column_dimensions[get_column_letter(col_num)].width = max(
+            max_length + 2, min_width
+        )
+
+
 def create_portfolio_tracker_excel(portfolio_data, output_path):
     """
     Create Portfolio Tracker Excel with 3 tabs:
@@ -457,63 +481,57 @@ def create_portfolio_tracker_excel(portfolio_data, output_path):
                 )
                 transactions_df = transactions_df.sort_values("date", ascending=False)
 
+                # Missing optional columns get the defaults the trade log shows
+                txn_defaults = {
+                    "ticker": "",
+                    "type": "",
+                    "price": None,
+                    "quantity": None,
+                    "total_value": None,
+                    "notes": "",
+                }
+                transactions_df = transactions_df.assign(
+                    **{
+                        col: value
+                        for col, value in txn_defaults.items()
+                        if col not in transactions_df.columns
+                    }
+                )
+
                 # Populate trade log
-                row = 5
-                for _, txn in transactions_df.iterrows():
+                for row, txn in enumerate(
+                    transactions_df.itertuples(index=False, name="Txn"), start=5
+                ):
                     ws_trade_log.cell(
                         row,
                         1,
-                        (
-                            txn.get("date").strftime("%Y-%m-%d")
-                            if pd.notna(txn.get("date"))
-                            else ""
-                        ),
+                        txn.date.strftime("%Y-%m-%d") if pd.notna(txn.date) else "",
                     )
-                    ws_trade_log.cell(row, 2, txn.get("ticker", ""))
-                    ws_trade_log.cell(
-                        row, 3, str(txn.get("type", "")).upper()
-                    )  # BUY/SELL
+                    ws_trade_log.cell(row, 2, txn.ticker)
+                    ws_trade_log.cell(row, 3, str(txn.type).upper())  # BUY/SELL
                     ws_trade_log.cell(
-                        row,
-                        4,
-                        (
-                            f"${txn.get('price', 0):,.2f}"
-                            if pd.notna(txn.get("price"))
-                            else ""
-                        ),
+                        row, 4, f"${txn.price:,.2f}" if pd.notna(txn.price) else ""
                     )
                     ws_trade_log.cell(
                         row,
                         5,
-                        (
-                            f"{txn.get('quantity', 0):,.4f}"
-                            if pd.notna(txn.get("quantity"))
-                            else ""
-                        ),
+                        f"{txn.quantity:,.4f}" if pd.notna(txn.quantity) else "",
                     )
                     ws_trade_log.cell(
                         row,
                         6,
                         (
-                            f"${txn.get('total_value', 0):,.2f}"
-                            if pd.notna(txn.get("total_value"))
+                            f"${txn.total_value:,.2f}"
+                            if pd.notna(txn.total_value)
                             else ""
                         ),
                     )
-                    ws_trade_log.cell(row, 7, txn.get("notes", ""))
-                    row += 1
+                    ws_trade_log.cell(row, 7, txn.notes)
         except Exception as e:
             logger.warning(f"Could not load transactions.csv: {e}")
 
     # Auto-size columns
-    for col in ws_trade_log.columns:
-        max_length = 0
-        for cell in col:
-            if cell.value:
-                max_length = max(max_length, len(str(cell.value)))
-        ws_trade_log.column_dimensions[col[0].column_letter].width = max(
-            max_length + 2, 12
-        )
+    _autosize_columns(ws_trade_log, min_width=12)
 
     # === TAB 2: ACTION PLAN ===
     ws_actions = wb.create_sheet("Action Plan")
@@ -631,12 +649,7 @@ def create_portfolio_tracker_excel(portfolio_data, output_path):
                 row += 1
 
     # Auto-size columns
-    for col in ws_actions.columns:
-        max_length = 0
-        for cell in col:
-            if cell.value:
-                max_length = max(max_length, len(str(cell.value)))
-        ws_actions.column_dimensions[col[0].column_letter].width = max_length + 2
+    _autosize_columns(ws_actions)
 
     # === TAB 3: CURRENT POSITIONS ===
     ws_positions = wb.create_sheet("Current Positions")
@@ -692,12 +705,7 @@ def create_portfolio_tracker_excel(portfolio_data, output_path):
         row += 1
 
     # Auto-size columns
-    for col in ws_positions.columns:
-        max_length = 0
-        for cell in col:
-            if cell.value:
-                max_length = max(max_length, len(str(cell.value)))
-        ws_positions.column_dimensions[col[0].column_letter].width = max_length + 2
+    _autosize_columns(ws_positions)
 
     # === TAB 4: TECHNICAL LEVELS ===
     ws_tech = wb.create_sheet("Technical Levels")
@@ -767,12 +775,7 @@ def create_portfolio_tracker_excel(portfolio_data, output_path):
         row += 1
 
     # Auto-size columns
-    for col in ws_tech.columns:
-        max_length = 0
-        for cell in col:
-            if cell.value:
-                max_length = max(max_length, len(str(cell.value)))
-        ws_tech.column_dimensions[col[0].column_letter].width = max_length + 2
+    _autosize_columns(ws_tech)
 
     # Save workbook
     wb.save(output_path)
@@ -790,6 +793,8 @@ def cleanup_old_reports(results_dir, max_files=3, archive_retention_days=90):
         archive_retention_days: Days to keep files in archive before deletion
     """
     from datetime import datetime, timedelta
+    import fnmatch
+    import os
     import time
 
     archive_dir = results_dir / "archive"
@@ -797,16 +802,16 @@ def cleanup_old_reports(results_dir, max_files=3, archive_retention_days=90):
 
     total_archived = 0
 
-    # Get all PDF and Excel files
-    pdf_files = sorted(
-        results_dir.glob("portfolio_playbook_*.pdf"),
-        key=lambda p: p.stat().st_mtime,
-        reverse=True,
-    )
-    xlsx_files = sorted(
-        results_dir.glob("portfolio_tracker_*.xlsx"),
-        key=lambda p: p.stat().st_mtime,
-        reverse=True,
+    # Get all PDF and Excel files from one listing, each stat()ed once
+    report_mtimes = {"portfolio_playbook_*.pdf": [], "portfolio_tracker_*.xlsx": []}
+    with os.scandir(results_dir) as entries:
+        for entry in entries:
+            for pattern, found in report_mtimes.items():
+                if fnmatch.fnmatch(entry.name, pattern):
+                    found.append((entry.stat().st_mtime, Path(entry.path)))
+    pdf_files, xlsx_files = (
+        [path for _, path in sorted(found, key=lambda f: f[0], reverse=True)]
+        for found in report_mtimes.values()
     )
 
     # Move files beyond max_files to archive
@@ -852,16 +857,16 @@ def cleanup_old_reports(results_dir, max_files=3, archive_retention_days=90):
     cutoff_time = time.time() - (archive_retention_days * 86400)
     deleted_count = 0
 
-    for archive_file in archive_dir.glob("*"):
-        if archive_file.is_file() and archive_file.stat().st_mtime < cutoff_time:
-            try:
-                archive_file.unlink()
-                deleted_count += 1
-            except Exception as e:
-                logger.warning(
-                    f"Could not delete archive file {archive_file.name}: {e}"
-                )
-                print(f"  ⚠️  Could not delete {archive_file.name}: {e}")
+    # DirEntry caches the file type, so only the stat() is a syscall
+    with os.scandir(archive_dir) as entries:
+        for entry in entries:
+            if entry.is_file() and entry.stat().st_mtime < cutoff_time:
+                try:
+                    os.unlink(entry.path)
+                    deleted_count += 1
+                except Exception as e:
+                    logger.warning(f"Could not delete archive file {entry.name}: {e}")
+                    print(f"  ⚠️  Could not delete {entry.name}: {e}")
 
     if deleted_count > 0:
         print(
@@ -533,12 +533,12 @@ with tab4:
             # Get current prices
             price_errors = []
             with st.spinner("Fetching current prices..."):
-                for idx, row in active_holdings.iterrows():
-                    price = get_current_price(row["ticker"])
+                for idx, ticker in active_holdings["ticker"].items():
+                    price = get_current_price(ticker)
                     if price and price > 0:
                         active_holdings.loc[idx, "current_price"] = price
                     else:
-                        price_errors.append(row["ticker"])
+                        price_errors.append(ticker)
                         active_holdings.loc[idx, "current_price"] = 0
 
             if price_errors:
@@ -918,9 +918,9 @@ with tab6:
 
                 # Transaction details in expander
                 with st.expander("📋 Detailed Transaction View"):
-                    for idx, row in filtered_df.sort_values(
+                    for row in filtered_df.sort_values(
                         "date", ascending=False
-                    ).iterrows():
+                    ).to_dict(orient="records"):
                         trans_type_color = "🟢" if row["type"] == "BUY" else "🔴"
                         st.markdown(
                             f"""
@@ -116,8 +116,11 @@ def update_returns(history_file: Path = None, lookback_days: int = 120):
 
     today = datetime.now()
     updated_count = 0
+    # One yf.Ticker per symbol: repeat signals reuse its timezone/metadata lookups
+    stocks = {}
 
-    for idx, row in recent_signals.iterrows():
+    # Plain dicts per row: cheaper lookups than a pandas Series per signal
+    for idx, row in zip(recent_signals.index, recent_signals.to_dict(orient="records")):
         signal_date = row["date"]
         ticker = row["ticker"]
         trigger_price = row["trigger_price"]
@@ -141,7 +144,9 @@ def update_returns(history_file: Path = None, lookback_days: int = 120):
 
         try:
             # Fetch historical data
-            stock = yf.Ticker(ticker)
+            stock = stocks.get(ticker)
+            if stock is None:
+                stock = stocks[ticker] = yf.Ticker(ticker)
             start_date = signal_date.strftime("%Y-%m-%d")
             end_date = (today + timedelta(days=1)).strftime("%Y-%m-%d")
             hist = stock.history(start=start_date, end=end_date)
@@ -9,6 +9,24 @@ import json
 from pathlib import Path
 import hashlib
 import logging
+import threading
+
+# Compile the indicator loops with numba when it is installed
+try:
+    from numba import njit
+
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit (kernels run as plain Python)"""
+
+        def decorator(func):
+            return func
+
+        return decorator
+
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -31,8 +49,30 @@ def _get_cache_path(ticker, daily_bars, weekly_bars):
     return CACHE_DIR / f"{cache_key}.json"
 
 
+# Per-process copy of the result cache, keyed by (ticker, daily_bars, weekly_bars)
+_result_memo = {}
+# One lock per cache key so concurrent scans analyze a shared ticker only once
+_result_locks = {}
+_result_locks_guard = threading.Lock()
+
+
+def _result_lock(ticker, daily_bars, weekly_bars):
+    """Get the lock guarding the analysis of one ticker/parameter combination"""
+    with _result_locks_guard:
+        return _result_locks.setdefault(
+            (ticker, daily_bars, weekly_bars), threading.Lock()
+        )
+
+
 def _load_from_cache(ticker, daily_bars, weekly_bars):
-    """Load cached result if it exists and is not expired"""
+    """Load cached result (memory first, then disk) if it is not expired"""
+    cached = _result_memo.get((ticker, daily_bars, weekly_bars))
+    if cached is not None:
+        cached_time, data = cached
+        if (datetime.now() - cached_time).total_seconds() / 3600 <= CACHE_TTL_HOURS:
+            return data
+        del _result_memo[(ticker, daily_bars, weekly_bars)]
+
     cache_path = _get_cache_path(ticker, daily_bars, weekly_bars)
 
     if not cache_path.exists():
@@ -50,6 +90,7 @@ def _load_from_cache(ticker, daily_bars, weekly_bars):
             cache_path.unlink()  # Delete expired cache
             return None
 
+        _result_memo[(ticker, daily_bars, weekly_bars)] = (cached_time, cached["data"])
         return cached["data"]
     except (IOError, json.JSONDecodeError, KeyError) as e:
         logger.warning(f"Cache read failed for {ticker}: {e}")
@@ -63,8 +104,10 @@ def _save_to_cache(ticker, daily_bars, weekly_bars, data):
     """Save analysis result to cache"""
     cache_path = _get_cache_path(ticker, daily_bars, weekly_bars)
 
+    cached_time = datetime.now()
+    _result_memo[(ticker, daily_bars, weekly_bars)] = (cached_time, data)
     try:
-        cached = {"cached_at": datetime.now().isoformat(), "data": data}
+        cached = {"cached_at": cached_time.isoformat(), "data": data}
         with open(cache_path, "w") as f:
             json.dump(cached, f)
     except (IOError, OSError) as e:
@@ -73,9 +116,300 @@ def _save_to_cache(ticker, daily_bars, weekly_bars, data):
         logger.error(f"Unexpected cache write error for {ticker}: {e}")
 
 
+def _is_cached(ticker, daily_bars, weekly_bars):
+    """Check for an unexpired cache entry without reading it"""
+    cache_path = _get_cache_path(ticker.upper(), daily_bars, weekly_bars)
+    try:
+        age_hours = (time.time() - cache_path.stat().st_mtime) / 3600
+    except OSError:
+        return False
+    return age_hours <= CACHE_TTL_HOURS
+
+
 def _smart_delay():
-    """Add random delay between 1-2 seconds to avoid rate limiting"""
-    time.sleep(random.uniform(1.0, 2.0))
+    """Short random jitter so worker threads don't reach the shared pacer in lockstep"""
+    time.sleep(random.uniform(0, RATE_LIMIT_MIN_GAP))
+
+
+# ============================================================================
+# RATE LIMITING - Shared request pacing with retry/backoff on HTTP 429
+# ============================================================================
+
+RATE_LIMIT_MIN_GAP = 0.25  # Seconds between Yahoo requests across all threads
+RATE_LIMIT_MAX_GAP = 5.0  # Upper bound for the widened gap under throttling
+RATE_LIMIT_RETRIES = 3  # Attempts per request before giving up
+RATE_LIMIT_MAX_BACKOFF = 60  # Seconds
+
+_rate_lock = threading.Lock()
+_rate_state = {"gap": RATE_LIMIT_MIN_GAP, "next_request": 0.0}
+
+
+def _is_rate_limit_error(error):
+    """Check whether an exception/message looks like Yahoo throttling"""
+    message = str(error).lower()
+    return "rate limit" in message or "429" in message or "too many requests" in message
+
+
+def _throttle():
+    """Block until this thread may send the next request"""
+    with _rate_lock:
+        now = time.monotonic()
+        wait = _rate_state["next_request"] - now
+        _rate_state["next_request"] = max(now, _rate_state["next_request"])
+        _rate_state["next_request"] += _rate_state["gap"]
+    if wait > 0:
+        time.sleep(wait)
+
+
+def _adjust_rate(rate_limited):
+    """AIMD pacing: double the gap when throttled, shrink it slowly on success"""
+    with _rate_lock:
+        if rate_limited:
+            _rate_state["gap"] = min(RATE_LIMIT_MAX_GAP, _rate_state["gap"] * 2)
+        else:
+            _rate_state["gap"] = max(RATE_LIMIT_MIN_GAP, _rate_state["gap"] - 0.05)
+
+
+def _with_backoff(request, *args, **kwargs):
+    """Call a Yahoo request, retrying with exponential backoff when rate limited"""
+    for attempt in range(RATE_LIMIT_RETRIES):
+        _throttle()
+        try:
+            result = request(*args, **kwargs)
+        except Exception as e:
+            if not _is_rate_limit_error(e) or attempt == RATE_LIMIT_RETRIES - 1:
+                raise
+            _adjust_rate(rate_limited=True)
+            delay = min(RATE_LIMIT_MAX_BACKOFF, 2**attempt + random.random())
+            logger.warning(f"Rate limited, retrying in {delay:.1f}s: {e}")
+            time.sleep(delay)
+        else:
+            _adjust_rate(rate_limited=False)
+            return result
+
+
+# ============================================================================
+# TICKER REUSE - One yf.Ticker per symbol for the life of the process
+# ============================================================================
+
+# yfinance already pools keep-alive connections in one process-wide session
+# (passing session= to yf.Ticker/yf.download replaces that shared session, so
+# none is passed here); reusing the Ticker objects also keeps their per-symbol
+# state (timezone, quote metadata)
+_ticker_cache = {}
+
+
+def get_ticker(ticker):
+    """Return the cached yf.Ticker for a symbol, creating it on first use"""
+    stock = _ticker_cache.get(ticker)
+    if stock is None:
+        stock = _ticker_cache.setdefault(ticker, yf.Ticker(ticker))
+    return stock
+
+
+# ============================================================================
+# BATCHED PRICE HISTORY - One yf.download per batch instead of per ticker
+# ============================================================================
+
+HISTORY_BATCH_SIZE = 20
+
+# Incremental OHLCV cache: only bars after the last cached one are downloaded
+HISTORY_CACHE_DIR = CACHE_DIR / "history"
+HISTORY_PERIODS = {"1d": ("3y", 3 * 365), "1wk": ("10y", 10 * 365)}
+# Full re-download after this long so dividend/split adjustments catch up
+HISTORY_FULL_REFRESH_DAYS = 7
+
+# Per-process copy of the on-disk cache, keyed by (ticker, interval)
+_history_memo = {}
+
+
+class _DownloadErrorLog(logging.Handler):
+    """Collect the per-ticker errors yf.download logs from the calling thread"""
+
+    def __init__(self):
+        super().__init__(level=logging.ERROR)
+        self.thread = threading.get_ident()
+        self.messages = []
+
+    def emit(self, record):
+        # Concurrent scans download at the same time; keep only our own errors
+        if record.thread == self.thread:
+            self.messages.append(record.getMessage())
+
+
+def _download_batch(tickers, **kwargs):
+    """Download one batch of tickers and split it into per-ticker DataFrames
+
+    yf.download never raises for a single failed ticker: it logs the error and
+    leaves the ticker out. Tickers dropped because of throttling are therefore
+    re-downloaded here (slowing the shared pacer first), rather than each
+    falling back to its own request while Yahoo is rate limiting.
+    """
+    yf_logger = logging.getLogger("yfinance")
+    histories = {}
+    missing = list(tickers)
+    for attempt in range(RATE_LIMIT_RETRIES):
+        if attempt:
+            delay = min(RATE_LIMIT_MAX_BACKOFF, 2**attempt + random.random())
+            logger.warning(
+                f"Rate limited on {len(missing)} tickers, retrying in {delay:.1f}s"
+            )
+            time.sleep(delay)
+
+        errors = _DownloadErrorLog()
+        yf_logger.addHandler(errors)
+        try:
+            data = _with_backoff(
+                yf.download,
+                " ".join(missing),
+                group_by="ticker",
+                threads=True,
+                auto_adjust=True,
+                progress=False,
+                **kwargs,
+            )
+        except Exception as e:
+            logger.warning(f"Batch download failed for {len(missing)} tickers: {e}")
+            break
+        finally:
+            yf_logger.removeHandler(errors)
+
+        if (
+            data is not None
+            and not data.empty
+            and isinstance(data.columns, pd.MultiIndex)
+        ):
+            downloaded = set(data.columns.get_level_values(0))
+            for ticker in missing:
+                if ticker in downloaded:
+                    df = data.xs(ticker, level=0, axis=1).dropna(how="all")
+                    if not df.empty:
+                        histories[ticker] = df
+
+        missing = [ticker for ticker in missing if ticker not in histories]
+        if not missing or not any(_is_rate_limit_error(m) for m in errors.messages):
+            break
+        _adjust_rate(rate_limited=True)
+    return histories
+
+
+def _history_cache_path(ticker, interval):
+    """Generate history cache file path for a ticker and bar interval"""
+    HISTORY_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    return HISTORY_CACHE_DIR / f"{ticker}_{interval}.pkl"
+
+
+def _load_history(ticker, interval):
+    """Load cached bars (memory first, then disk); None if missing or due a full refresh"""
+    df = _history_memo.get((ticker, interval))
+    if df is None:
+        try:
+            df = pd.read_pickle(_history_cache_path(ticker, interval))
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"History cache read failed for {ticker} {interval}: {e}")
+            return None
+        _history_memo[(ticker, interval)] = df
+
+    full_fetch = df.attrs.get("full_fetch")
+    if df.empty or full_fetch is None:
+        return None
+    if datetime.now() - full_fetch > timedelta(days=HISTORY_FULL_REFRESH_DAYS):
+        return None
+    return df
+
+
+def _save_history(ticker, interval, df):
+    """Save bars to the memory and disk history caches"""
+    _history_memo[(ticker, interval)] = df
+    try:
+        df.to_pickle(_history_cache_path(ticker, interval))
+    except (IOError, OSError) as e:
+        logger.warning(f"History cache write failed for {ticker} {interval}: {e}")
+
+
+def _download_cached_batch(tickers, interval):
+    """Download one batch, fetching only bars newer than each ticker's cache"""
+    period, period_days = HISTORY_PERIODS[interval]
+    cached = {ticker: _load_history(ticker, interval) for ticker in tickers}
+    cold = [ticker for ticker in tickers if cached[ticker] is None]
+    warm = [ticker for ticker in tickers if cached[ticker] is not None]
+
+    fresh = {}
+    if cold:
+        fresh.update(_download_batch(cold, interval=interval, period=period))
+    if warm:
+        # Re-fetch the last cached bar too, it may have been a partial session
+        start = min(cached[ticker].index[-1] for ticker in warm)
+        fresh.update(_download_batch(warm, interval=interval, start=start))
+
+    histories = {}
+    for ticker, df in fresh.items():
+        old = cached[ticker]
+        if old is None:
+            full_fetch = datetime.now()
+        else:
+            full_fetch = old.attrs["full_fetch"]
+            df = pd.concat([old[old.index < df.index[0]], df])
+            df = df[df.index >= df.index[-1] - timedelta(days=period_days)]
+        df.attrs["full_fetch"] = full_fetch
+        _save_history(ticker, interval, df)
+        histories[ticker] = df
+    return histories
+
+
+def fetch_price_histories(
+    tickers,
+    daily_bars=60,
+    weekly_bars=52,
+    as_of_date=None,
+    batch_size=HISTORY_BATCH_SIZE,
+):
+    """Batch-download daily and weekly history for many tickers at once.
+
+    Uses the same windows as analyze_ticker (3y daily, 10y weekly, ending at
+    as_of_date if given). Tickers with a fresh result cache are skipped, and
+    tickers whose download failed are left out so analyze_ticker fetches them
+    itself. Live bars are kept in an on-disk history cache so later scans only
+    download the bars added since.
+
+    Args:
+        tickers: List of ticker symbols
+        daily_bars: Number of daily bars (only used for the cache check)
+        weekly_bars: Number of weekly bars (only used for the cache check)
+        as_of_date: Optional datetime or date string (YYYY-MM-DD) for backtesting
+        batch_size: Tickers per yf.download request
+
+    Returns:
+        Dict of ticker -> (daily_df, weekly_df)
+    """
+    if as_of_date:
+        if isinstance(as_of_date, str):
+            end_date = datetime.strptime(as_of_date, "%Y-%m-%d")
+        else:
+            end_date = as_of_date
+        daily_kwargs = {"start": end_date - timedelta(days=3 * 365), "end": end_date}
+        weekly_kwargs = {
+            "start": end_date - timedelta(days=10 * 365),
+            "end": end_date,
+        }
+    else:
+        tickers = [t for t in tickers if not _is_cached(t, daily_bars, weekly_bars)]
+
+    histories = {}
+    for i in range(0, len(tickers), batch_size):
+        batch = tickers[i : i + batch_size]
+        if as_of_date:
+            daily = _download_batch(batch, interval="1d", **daily_kwargs)
+            weekly = _download_batch(batch, interval="1wk", **weekly_kwargs)
+        else:
+            daily = _download_cached_batch(batch, "1d")
+            weekly = _download_cached_batch(batch, "1wk")
+        for ticker in batch:
+            if ticker in daily and ticker in weekly:
+                histories[ticker] = (daily[ticker], weekly[ticker])
+    return histories
 
 
 # Parse stocks.txt file to extract individual tickers and baskets
@@ -436,7 +770,7 @@ def analyze_basket(basket_name, constituent_tickers, daily_bars=60, weekly_bars=
             if "error" not in result:
                 # Fetch market cap
                 try:
-                    stock = yf.Ticker(ticker)
+                    stock = get_ticker(ticker)
                     info = stock.info
                     market_cap = info.get("marketCap", 0)
                     if market_cap and market_cap > 0:
@@ -502,25 +836,42 @@ def analyze_basket(basket_name, constituent_tickers, daily_bars=60, weekly_bars=
         return {"ticker": basket_name, "error": str(e)}
 
 
+@njit(cache=True, nogil=True)
+def _smma_kernel(values, length):
+    """SMMA over a float64 array, seeded with the SMA of the first window"""
+    result = np.full(len(values), np.nan)
+    if len(values) < length:
+        return result
+    result[length - 1] = values[:length].mean()
+    for i in range(length, len(values)):
+        result[i] = (result[i - 1] * (length - 1) + values[i]) / length
+    return result
+
+
+if NUMBA_AVAILABLE:
+    # Compile once at import instead of inside the first scan thread
+    _smma_kernel(np.zeros(100), 10)
+
+
+def _sma_last(values, length):
+    """Latest value of a simple moving average over a NumPy array"""
+    return values[-length:].mean()
+
+
 # SMMA function (for Larsson)
 def smma(series, length):
-    smma_result = pd.Series(np.nan, index=series.index)
-    sma_val = series.rolling(length).mean()
-    smma_result.iloc[length - 1] = sma_val.iloc[length - 1]
-    for i in range(length, len(series)):
-        smma_result.iloc[i] = (
-            smma_result.iloc[i - 1] * (length - 1) + series.iloc[i]
-        ) / length
-    return smma_result
+    return pd.Series(
+        _smma_kernel(series.to_numpy(dtype=np.float64), length), index=series.index
+    )
 
 
 # Larsson state
 def get_larsson_state(df, fast=15, slow=19, v1len=25, v2len=29):
-    hl2 = (df["High"] + df["Low"]) / 2
-    v1 = smma(hl2, fast).iloc[-1]
-    m1 = smma(hl2, slow).iloc[-1]
-    m2 = smma(hl2, v1len).iloc[-1]
-    v2 = smma(hl2, v2len).iloc[-1]
+    hl2 = ((df["High"] + df["Low"]) / 2).to_numpy(dtype=np.float64)
+    v1 = _smma_kernel(hl2, fast)[-1]
+    m1 = _smma_kernel(hl2, slow)[-1]
+    m2 = _smma_kernel(hl2, v1len)[-1]
+    v2 = _smma_kernel(hl2, v2len)[-1]
     if np.isnan([v1, m1, m2, v2]).any():
         return 0
     p2 = ((v1 < m1) != (v1 < v2)) or ((m2 < v2) != (v1 < v2))
@@ -529,6 +880,127 @@ def get_larsson_state(df, fast=15, slow=19, v1len=25, v2len=29):
     return 1 if p1 else -1 if p3 else 0
 
 
+# ============================================================================
+# UNIVERSE-WIDE INDICATORS - One vectorized pass over all tickers of a scan
+# ============================================================================
+
+
+def _stack_right_aligned(arrays):
+    """Stack 1-D arrays into a NaN-padded matrix with each row ending in the last column.
+
+    Returns: tuple (matrix, lengths)
+    """
+    lengths = np.array([len(values) for values in arrays], dtype=np.int64)
+    matrix = np.full((len(arrays), max(lengths.max(initial=0), 1)), np.nan)
+    for row, values in enumerate(arrays):
+        if len(values):
+            matrix[row, -len(values) :] = values
+    return matrix, lengths
+
+
+def _smma_last_rows(matrix, lengths, length):
+    """Latest SMMA value of every row of a right-aligned matrix (NaN if too short)"""
+    n_rows, width = matrix.shape
+    seed_col = width - lengths + length - 1
+    has_seed = lengths >= length
+
+    # Seed each row with the SMA of its own first window, like _smma_kernel
+    seeds = np.full(n_rows, np.nan)
+    for row in np.flatnonzero(has_seed):
+        start = width - lengths[row]
+        seeds[row] = matrix[row, start : start + length].mean()
+
+    current = np.full(n_rows, np.nan)
+    if has_seed.any():
+        # Rows are NaN until their seed column, so one recursion covers them all
+        for col in range(seed_col[has_seed].min(), width):
+            current = (current * (length - 1) + matrix[:, col]) / length
+            current = np.where(seed_col == col, seeds, current)
+    return current
+
+
+def _larsson_states(matrix, lengths, fast=15, slow=19, v1len=25, v2len=29):
+    """Vectorized get_larsson_state over every row of a right-aligned hl2 matrix"""
+    v1 = _smma_last_rows(matrix, lengths, fast)
+    m1 = _smma_last_rows(matrix, lengths, slow)
+    m2 = _smma_last_rows(matrix, lengths, v1len)
+    v2 = _smma_last_rows(matrix, lengths, v2len)
+    p2 = ((v1 < m1) != (v1 < v2)) | ((m2 < v2) != (v1 < v2))
+    p3 = ~p2 & (v1 < v2)
+    states = np.where(p2, 0, np.where(p3, -1, 1))
+    return np.where(np.isnan(np.stack([v1, m1, m2, v2])).any(axis=0), 0, states)
+
+
+def compute_universe_indicators(histories, rsi_period=14):
+    """Compute D50/D100/D200, RSI and Larsson states for many tickers at once.
+
+    Each ticker's bars are stacked into one right-aligned matrix so the
+    indicators are computed with array operations across the whole universe
+    instead of once per ticker. Values match the per-ticker functions used by
+    analyze_ticker.
+
+    Args:
+        histories: Dict of ticker -> (daily_df, weekly_df) from fetch_price_histories
+        rsi_period: RSI lookback in bars
+
+    Returns:
+        Dict of ticker -> dict with d50, d100, d200, rsi, daily_state, weekly_state
+    """
+    if not histories:
+        return {}
+
+    tickers = list(histories)
+    dailies = [histories[t][0] for t in tickers]
+    weeklies = [histories[t][1] for t in tickers]
+
+    closes, close_lengths = _stack_right_aligned(
+        [df["Close"].to_numpy(dtype=np.float64) for df in dailies]
+    )
+    daily_hl2, daily_lengths = _stack_right_aligned(
+        [((df["High"] + df["Low"]) / 2).to_numpy(dtype=np.float64) for df in dailies]
+    )
+    weekly_hl2, weekly_lengths = _stack_right_aligned(
+        [((df["High"] + df["Low"]) / 2).to_numpy(dtype=np.float64) for df in weeklies]
+    )
+
+    def sma_last(length):
+        if closes.shape[1] < length:
+            return np.full(len(tickers), np.nan)
+        return closes[:, -length:].mean(axis=1)
+
+    d50, d100, d200 = sma_last(50), sma_last(100), sma_last(200)
+
+    # RSI from the last rsi_period price changes (see calculate_rsi)
+    if closes.shape[1] > rsi_period:
+        delta = np.diff(closes[:, -(rsi_period + 1) :], axis=1)
+        gain = np.where(delta > 0, delta, 0.0).mean(axis=1)
+        loss = np.where(delta < 0, -delta, 0.0).mean(axis=1)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            rsi = 100 - (100 / (1 + gain / loss))
+    else:
+        rsi = np.full(len(tickers), np.nan)
+
+    daily_states = _larsson_states(daily_hl2, daily_lengths)
+    weekly_states = _larsson_states(weekly_hl2, weekly_lengths)
+
+    indicators = {}
+    for i, ticker in enumerate(tickers):
+        n_bars = close_lengths[i]
+        indicators[ticker] = {
+            "d50": d50[i] if n_bars >= 50 else None,
+            "d100": d100[i] if n_bars >= 100 else None,
+            "d200": d200[i] if n_bars >= 200 else None,
+            "rsi": (
+                float(rsi[i])
+                if n_bars >= rsi_period + 1 and not np.isnan(rsi[i])
+                else None
+            ),
+            "daily_state": int(daily_states[i]),
+            "weekly_state": int(weekly_states[i]),
+        }
+    return indicators
+
+
 # ============================================================================
 # MOMENTUM & VOLATILITY INDICATORS (RSI & BOLLINGER BANDS)
 # ============================================================================
@@ -543,18 +1015,17 @@ def calculate_rsi(df, period=14):
     if df.empty or len(df) < period + 1:
         return None
 
-    close = df["Close"]
-    delta = close.diff()
+    # Only the last `period` price changes feed the current value
+    delta = np.diff(df["Close"].to_numpy(dtype=np.float64)[-(period + 1) :])
 
     # Separate gains and losses
-    gain = (delta.where(delta > 0, 0)).rolling(window=period).mean()
-    loss = (-delta.where(delta < 0, 0)).rolling(window=period).mean()
+    gain = np.where(delta > 0, delta, 0.0).mean()
+    loss = np.where(delta < 0, -delta, 0.0).mean()
 
     # Calculate RS and RSI
-    rs = gain / loss
-    rsi = 100 - (100 / (1 + rs))
-
-    current_rsi = rsi.iloc[-1]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        rs = np.float64(gain) / loss
+        current_rsi = 100 - (100 / (1 + rs))
 
     return float(current_rsi) if not np.isnan(current_rsi) else None
 
@@ -657,6 +1128,30 @@ def calculate_daily_volatility(df, period=20):
 # ============================================================================
 
 
+@njit(cache=True, nogil=True)
+def _volume_at_price_kernel(low, high, volume, bin_edges):
+    """Spread each bar's volume evenly over the price bins its Low-High range covers"""
+    price_bins = len(bin_edges) - 1
+    volume_at_price = np.zeros(price_bins)
+    for bar in range(len(low)):
+        # Find which bins this bar's price range covers
+        low_idx = np.searchsorted(bin_edges, low[bar], side="right") - 1
+        high_idx = np.searchsorted(bin_edges, high[bar], side="left")
+
+        # Distribute volume across the price range
+        bins_covered = max(1, high_idx - low_idx)
+        volume_per_bin = volume[bar] / bins_covered
+
+        for i in range(max(0, low_idx), min(price_bins, high_idx)):
+            volume_at_price[i] += volume_per_bin
+    return volume_at_price
+
+
+if NUMBA_AVAILABLE:
+    # Compile once at import instead of inside the first scan thread
+    _volume_at_price_kernel(np.ones(2), np.ones(2), np.ones(2), np.linspace(0, 2, 3))
+
+
 def calculate_volume_profile(df, price_bins=50):
     """
     Calculate volume profile for the visible range (dataframe passed).
@@ -680,19 +1175,12 @@ def calculate_volume_profile(df, price_bins=50):
     bin_centers = (bin_edges[:-1] + bin_edges[1:]) / 2
 
     # Accumulate volume at each price level
-    volume_at_price = np.zeros(price_bins)
-
-    for _, row in df.iterrows():
-        # Find which bins this bar's price range covers
-        low_idx = np.searchsorted(bin_edges, row["Low"], side="right") - 1
-        high_idx = np.searchsorted(bin_edges, row["High"], side="left")
-
-        # Distribute volume across the price range
-        bins_covered = max(1, high_idx - low_idx)
-        volume_per_bin = row["Volume"] / bins_covered
-
-        for i in range(max(0, low_idx), min(price_bins, high_idx)):
-            volume_at_price[i] += volume_per_bin
+    volume_at_price = _volume_at_price_kernel(
+        df["Low"].to_numpy(dtype=np.float64),
+        df["High"].to_numpy(dtype=np.float64),
+        df["Volume"].to_numpy(dtype=np.float64),
+        bin_edges,
+    )
 
     # Point of Control (POC) - price with highest volume
     poc_idx = np.argmax(volume_at_price)
@@ -775,27 +1263,30 @@ def detect_swings(df, strength=12, strength_resistance=None):
     Detect swing highs and lows.
     strength_resistance: Optional separate strength for resistance detection (lower = more recent levels)
     """
-    highs = df["High"]
-    lows = df["Low"]
-    swing_highs = []
-    swing_lows = []
-
     # Use separate strength for resistances if provided
     r_strength = strength_resistance if strength_resistance is not None else strength
 
     # Detect swing highs (resistances) with potentially lower strength
-    for i in range(r_strength, len(df) - r_strength):
-        if highs.iloc[i] == highs.iloc[i - r_strength : i + r_strength + 1].max():
-            swing_highs.append(highs.iloc[i])
+    swing_highs = _swing_pivots(df["High"], r_strength, np.fmax)
 
     # Detect swing lows (supports) with original strength
-    for i in range(strength, len(df) - strength):
-        if lows.iloc[i] == lows.iloc[i - strength : i + strength + 1].min():
-            swing_lows.append(lows.iloc[i])
+    swing_lows = _swing_pivots(df["Low"], strength, np.fmin)
 
     return swing_highs, swing_lows
 
 
+def _swing_pivots(series, strength, extreme):
+    """Bars equal to the extreme (np.fmax/np.fmin, NaN-skipping like pandas) of
+    their +/- strength window, over all full windows at once"""
+    values = series.to_numpy(dtype=np.float64)
+    window = 2 * strength + 1
+    if len(values) < window:
+        return []
+    windows = np.lib.stride_tricks.sliding_window_view(values, window)
+    centers = values[strength : len(values) - strength]
+    return list(centers[centers == extreme.reduce(windows, axis=1)])
+
+
 def select_top_sr(
     swing_highs,
     swing_lows,
@@ -1611,7 +2102,15 @@ def adjust_sell_levels_for_mas(d50, d100, d200, r1, r2, r3, current_price):
     return adjusted_r1, adjusted_r2, adjusted_r3, feasibility_note
 
 
-def analyze_ticker(ticker, daily_bars=60, weekly_bars=52, as_of_date=None):
+def analyze_ticker(
+    ticker,
+    daily_bars=60,
+    weekly_bars=52,
+    as_of_date=None,
+    daily_df=None,
+    weekly_df=None,
+    indicators=None,
+):
     """Fetch data and compute indicators for a single ticker. Returns a dict with results.
 
     Args:
@@ -1620,21 +2119,44 @@ def analyze_ticker(ticker, daily_bars=60, weekly_bars=52, as_of_date=None):
         weekly_bars: Number of weekly bars to analyze (default 52)
         as_of_date: Optional datetime or date string (YYYY-MM-DD) to limit data to historical point
                     If provided, only data up to this date will be used (for backtesting)
+        daily_df: Optional prefetched daily history (see fetch_price_histories)
+        weekly_df: Optional prefetched weekly history (see fetch_price_histories)
+        indicators: Optional precomputed indicators for the prefetched history
+                    (see compute_universe_indicators)
     """
     ticker = ticker.upper()
+    args = (ticker, daily_bars, weekly_bars, as_of_date, daily_df, weekly_df)
 
     # Skip cache for historical backtesting (as_of_date provided)
     # Cache only applies to live/current data
-    if as_of_date is None:
+    if as_of_date is not None:
+        return _analyze_ticker(*args, indicators=indicators)
+
+    # Concurrent scans sharing a ticker wait here and reuse the first result
+    with _result_lock(ticker, daily_bars, weekly_bars):
         cached_result = _load_from_cache(ticker, daily_bars, weekly_bars)
         if cached_result is not None:
             return cached_result
+        return _analyze_ticker(*args, indicators=indicators)
+
 
-    # Add delay before making API request to avoid rate limiting
-    _smart_delay()
+def _analyze_ticker(
+    ticker,
+    daily_bars=60,
+    weekly_bars=52,
+    as_of_date=None,
+    daily_df=None,
+    weekly_df=None,
+    indicators=None,
+):
+    """Uncached body of analyze_ticker (saves live results to the cache)"""
+    # Requests are paced by _throttle(); only jitter the start here
+    # (backtests with prefetched history make no requests at all)
+    if not (as_of_date and daily_df is not None and weekly_df is not None):
+        _smart_delay()
 
     try:
-        stock = yf.Ticker(ticker)
+        stock = get_ticker(ticker)
 
         # Handle as_of_date for historical simulation
         if as_of_date:
@@ -1655,10 +2177,12 @@ def analyze_ticker(ticker, daily_bars=60, weekly_bars=52, as_of_date=None):
         # Daily data - fetch up to end_date
         # When using historical simulation, must use start/end dates instead of period
         # because yfinance ignores 'end' parameter when 'period' is used
-        if as_of_date:
-            daily = stock.history(start=start_date_daily, end=end_date)
+        if daily_df is not None:
+            daily = daily_df
+        elif as_of_date:
+            daily = _with_backoff(stock.history, start=start_date_daily, end=end_date)
         else:
-            daily = stock.history(period="3y")
+            daily = _with_backoff(stock.history, period="3y")
         if daily.empty:
             return {"ticker": ticker, "error": "no daily data"}
 
@@ -1668,7 +2192,7 @@ def analyze_ticker(ticker, daily_bars=60, weekly_bars=52, as_of_date=None):
             current_price = float(daily["Close"].iloc[-1])
             price_note = f"close as of {today}"
         else:
-            info = stock.info
+            info = _with_backoff(lambda: stock.info)
             # Check for rate limit indicators
             if not info or len(info) == 0:
                 return {"ticker": ticker, "error": "rate_limit_possible"}
@@ -1682,26 +2206,31 @@ def analyze_ticker(ticker, daily_bars=60, weekly_bars=52, as_of_date=None):
 
         # Weekly data - fetch up to end_date
         # When using historical simulation, must use start/end dates instead of period
-        if as_of_date:
-            weekly = stock.history(
-                start=start_date_weekly, end=end_date, interval="1wk"
+        if weekly_df is not None:
+            weekly = weekly_df
+        elif as_of_date:
+            weekly = _with_backoff(
+                stock.history, start=start_date_weekly, end=end_date, interval="1wk"
             )
         else:
-            weekly = stock.history(period="10y", interval="1wk")
+            weekly = _with_backoff(stock.history, period="10y", interval="1wk")
         if weekly.empty:
             return {"ticker": ticker, "error": "no weekly data"}
 
         # Calculate daily SMAs (D50, D100, D200)
-        d50 = daily["Close"].rolling(50).mean().iloc[-1] if len(daily) >= 50 else None
-        d100 = (
-            daily["Close"].rolling(100).mean().iloc[-1] if len(daily) >= 100 else None
-        )
-        d200 = (
-            daily["Close"].rolling(200).mean().iloc[-1] if len(daily) >= 200 else None
-        )
+        if indicators is not None:
+            d50, d100, d200 = indicators["d50"], indicators["d100"], indicators["d200"]
+        else:
+            daily_close = daily["Close"].to_numpy(dtype=np.float64)
+            d50 = _sma_last(daily_close, 50) if len(daily) >= 50 else None
+            d100 = _sma_last(daily_close, 100) if len(daily) >= 100 else None
+            d200 = _sma_last(daily_close, 200) if len(daily) >= 200 else None
 
         # Calculate RSI and Bollinger Bands
-        rsi = calculate_rsi(daily, period=14)
+        if indicators is not None:
+            rsi = indicators["rsi"]
+        else:
+            rsi = calculate_rsi(daily, period=14)
         bb_upper, bb_middle, bb_lower, bb_position_sigma = calculate_bollinger_bands(
             daily, period=20, num_std=2
         )
@@ -1760,8 +2289,12 @@ def analyze_ticker(ticker, daily_bars=60, weekly_bars=52, as_of_date=None):
         )
 
         # Signal
-        daily_state = get_larsson_state(daily)
-        weekly_state = get_larsson_state(weekly)
+        if indicators is not None:
+            daily_state = indicators["daily_state"]
+            weekly_state = indicators["weekly_state"]
+        else:
+            daily_state = get_larsson_state(daily)
+            weekly_state = get_larsson_state(weekly)
         mapping = {
             (1, 1): "FULL HOLD + ADD",
             (1, 0): "HOLD",
@@ -0,0 +1,79 @@
+import pandas as pd
+import numpy as np
+from datetime import datetime
+from pathlib import Path
+
+from src.archive.backtest_watchlist import WatchlistBacktest
+
+
+def make_prices(n, start="2025-01-02", low_dip_day=None, high_spike_day=None):
+    dates = pd.date_range(start=start, periods=n, freq="D")
+    df = pd.DataFrame(
+        {
+            "High": np.linspace(101, 120, n),
+            "Low": np.linspace(99, 118, n),
+            "Close": np.linspace(100, 119, n),
+            "Volume": np.arange(n) + 1000,
+        },
+        index=dates,
+    )
+    if low_dip_day is not None:
+        df.iloc[low_dip_day, df.columns.get_loc("Low")] = 80.0
+    if high_spike_day is not None:
+        df.iloc[high_spike_day, df.columns.get_loc("High")] = 150.0
+    return df
+
+
+def make_report():
+    return pd.DataFrame(
+        {
+            "Rank": [1, 2, 3, 4],
+            "Ticker": ["AAA", "BBB", "CCC", None],
+            "Signal": ["FULL HOLD + ADD"] * 4,
+            "Quality": ["EXCELLENT", "GOOD", "GOOD", "GOOD"],
+            "Quality Flag": ["SAFE ENTRY", "", "THIN", ""],
+            "Current Price": [100.0, 100.0, 0.0, 100.0],
+            "Vol R:R": ["1:3.5", "N/A", "1:2.0", "1:1.0"],
+            "Vol Stop Loss %": ["-6.0%", "-5.0%", "-5.0%", "-5.0%"],
+            "Target R1": [130.0, np.nan, 110.0, 110.0],
+            "report_date": datetime(2025, 1, 1),
+            "report_file": "sp500_watchlist_20250101_1600.xlsx",
+        }
+    )
+
+
+def test_calculate_performance_stop_before_target():
+    prices = make_prices(40, low_dip_day=3, high_spike_day=10)
+    perf = WatchlistBacktest().calculate_performance(100.0, prices, 5.0, 130.0)
+
+    assert perf["exit_reason_7d"] == "stop"
+    assert perf["return_7d"] == -5.0
+    assert perf["exit_reason_30d"] == "stop"
+    assert perf["actual_days_90d"] == 40
+    assert perf["mae_7d"] == -20.0
+
+
+def test_calculate_performance_target_and_hold():
+    prices = make_prices(40, high_spike_day=10)
+    perf = WatchlistBacktest().calculate_performance(100.0, prices, 5.0, 130.0)
+
+    assert perf["exit_reason_7d"] == "hold"
+    assert abs(perf["return_7d"] - (prices["Close"].iloc[6] - 100.0)) < 1e-4
+    assert perf["exit_reason_14d"] == "target"
+    assert abs(perf["return_14d"] - 30.0) < 1e-4
+    assert abs(perf["mfe_14d"] - 50.0) < 1e-4
+
+
+def test_backtest_report_parses_and_skips_invalid_rows(monkeypatch):
+    backtester = WatchlistBacktest(Path("missing_results_dir"))
+    monkeypatch.setattr(backtester, "parse_watchlist_excel", lambda fp: make_report())
+    monkeypatch.setattr(
+        backtester, "fetch_price_history", lambda t, s, e: make_prices(60)
+    )
+
+    res = backtester.backtest_report(Path("sp500_watchlist_20250101_1600.xlsx"))
+
+    assert res["ticker"].tolist() == ["AAA", "BBB"]
+    assert res["vol_rr"].tolist() == [3.5, 0.0]
+    assert abs(res["vol_stop_price"].iloc[0] - 94.0) < 1e-4
+    assert res["quality_flag"].tolist() == ["SAFE ENTRY", ""]
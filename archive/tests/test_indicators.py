@@ -0,0 +1,136 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.technical_analysis import (
+    _sma_last,
+    _swing_pivots,
+    _volume_at_price_kernel,
+    calculate_rsi,
+    compute_universe_indicators,
+    get_larsson_state,
+)
+
+
+def make_history(n, seed, flat_tail=0, freq="B"):
+    rng = np.random.default_rng(seed)
+    close = 100 * np.exp(np.cumsum(rng.normal(0.001, 0.02, n)))
+    if flat_tail:
+        close[-flat_tail:] = close[-flat_tail - 1]
+    spread = rng.uniform(0.0, 0.02, n)
+    if flat_tail:
+        spread[-flat_tail:] = 0.01
+    return pd.DataFrame(
+        {
+            "Open": close,
+            "High": close * (1 + spread),
+            "Low": close * (1 - spread),
+            "Close": close,
+            "Volume": rng.integers(1_000, 100_000, n).astype(float),
+        },
+        index=pd.date_range(end="2024-06-28", periods=n, freq=freq),
+    )
+
+
+def test_universe_indicators_match_per_ticker():
+    # (daily bars, weekly bars, flat tail) - includes histories shorter than
+    # the 29-bar Larsson window, the RSI window and every SMA length
+    shapes = {
+        "TINY": (5, 3, 0),
+        "SHORT": (20, 12, 0),
+        "W28": (28, 28, 0),
+        "W29": (29, 29, 0),
+        "D60": (60, 40, 0),
+        "D150": (150, 80, 0),
+        "D260": (260, 260, 0),
+        "FLAT": (220, 120, 30),
+    }
+    histories = {
+        ticker: (
+            make_history(n_daily, seed, flat_tail),
+            make_history(n_weekly, seed + 100, flat_tail, freq="W-FRI"),
+        )
+        for seed, (ticker, (n_daily, n_weekly, flat_tail)) in enumerate(shapes.items())
+    }
+
+    indicators = compute_universe_indicators(histories)
+
+    assert sorted(indicators) == sorted(shapes)
+    for ticker, (daily, weekly) in histories.items():
+        close = daily["Close"].to_numpy(dtype=np.float64)
+        got = indicators[ticker]
+        for field, length in (("d50", 50), ("d100", 100), ("d200", 200)):
+            if len(daily) >= length:
+                assert got[field] == pytest.approx(_sma_last(close, length))
+            else:
+                assert got[field] is None
+        expected_rsi = calculate_rsi(daily)
+        if expected_rsi is None:
+            assert got["rsi"] is None
+        else:
+            assert got["rsi"] == pytest.approx(expected_rsi)
+        assert got["daily_state"] == get_larsson_state(daily)
+        assert got["weekly_state"] == get_larsson_state(weekly)
+
+    # A flat tail has no gains or losses, so RSI is undefined
+    assert indicators["FLAT"]["rsi"] is None
+
+
+def swing_pivots_loop(series, strength, pick):
+    """Bar-by-bar swing detection, as detect_swings used to do it"""
+    pivots = []
+    for i in range(strength, len(series) - strength):
+        window = series.iloc[i - strength : i + strength + 1]
+        if series.iloc[i] == getattr(window, pick)():
+            pivots.append(series.iloc[i])
+    return pivots
+
+
+@pytest.mark.parametrize("strength", [1, 3, 12])
+def test_swing_pivots_match_loop(strength):
+    df = make_history(120, seed=7)
+    # Ties and gaps must be handled like the pandas max/min (NaN-skipping)
+    df.iloc[40, df.columns.get_loc("High")] = df["High"].iloc[41]
+    df.iloc[60, df.columns.get_loc("Low")] = np.nan
+    df.iloc[61, df.columns.get_loc("High")] = np.nan
+
+    assert _swing_pivots(df["High"], strength, np.fmax) == swing_pivots_loop(
+        df["High"], strength, "max"
+    )
+    assert _swing_pivots(df["Low"], strength, np.fmin) == swing_pivots_loop(
+        df["Low"], strength, "min"
+    )
+    assert _swing_pivots(df["High"].iloc[: 2 * strength], strength, np.fmax) == []
+
+
+def volume_at_price_loop(df, bin_edges):
+    """Row-by-row volume distribution, as calculate_volume_profile used to do it"""
+    price_bins = len(bin_edges) - 1
+    volume_at_price = np.zeros(price_bins)
+    for _, row in df.iterrows():
+        low_idx = np.searchsorted(bin_edges, row["Low"], side="right") - 1
+        high_idx = np.searchsorted(bin_edges, row["High"], side="left")
+        bins_covered = max(1, high_idx - low_idx)
+        volume_per_bin = row["Volume"] / bins_covered
+        for i in range(max(0, low_idx), min(price_bins, high_idx)):
+            volume_at_price[i] += volume_per_bin
+    return volume_at_price
+
+
+def test_volume_at_price_kernel_matches_loop():
+    df = make_history(200, seed=11)
+    # A zero-range bar and a bar sitting exactly on a bin edge
+    df.iloc[10, df.columns.get_loc("High")] = df["Low"].iloc[10]
+    bin_edges = np.linspace(df["Low"].min(), df["High"].max(), 51)
+    df.iloc[20, df.columns.get_loc("Low")] = bin_edges[25]
+    df.iloc[20, df.columns.get_loc("High")] = bin_edges[30]
+
+    volume_at_price = _volume_at_price_kernel(
+        df["Low"].to_numpy(dtype=np.float64),
+        df["High"].to_numpy(dtype=np.float64),
+        df["Volume"].to_numpy(dtype=np.float64),
+        bin_edges,
+    )
+
+    np.testing.assert_allclose(volume_at_price, volume_at_price_loop(df, bin_edges))
+    assert volume_at_price.sum() == pytest.approx(df["Volume"].sum())
@@ -0,0 +1,145 @@
+from datetime import datetime, timedelta
+
+import pandas as pd
+from yfinance.exceptions import YFRateLimitError
+
+import src.technical_analysis as ta
+
+
+def make_bars(start, n, close=100.0, tz=None):
+    dates = pd.date_range(start=start, periods=n, freq="D", tz=tz)
+    return pd.DataFrame(
+        {
+            "Open": close,
+            "High": close + 1.0,
+            "Low": close - 1.0,
+            "Close": close,
+            "Volume": 1000.0,
+        },
+        index=dates,
+    )
+
+
+class FakeYahooTicker:
+    """Stands in for the yf.Ticker used inside yf.download"""
+
+    failures = {}  # ticker -> exceptions to raise, in order
+    calls = []
+
+    def __init__(self, ticker):
+        self.ticker = ticker
+        self._price_history = None
+
+    def history(self, **kwargs):
+        FakeYahooTicker.calls.append(self.ticker)
+        pending = FakeYahooTicker.failures.get(self.ticker)
+        if pending:
+            raise pending.pop(0)
+        return make_bars("2024-01-01", 5, tz="America/New_York")
+
+
+def fake_yahoo(monkeypatch, failures):
+    FakeYahooTicker.failures = failures
+    FakeYahooTicker.calls = []
+    monkeypatch.setattr("yfinance.multi.Ticker", FakeYahooTicker)
+    monkeypatch.setattr(ta, "RATE_LIMIT_MAX_BACKOFF", 0)
+    monkeypatch.setitem(ta._rate_state, "gap", ta.RATE_LIMIT_MIN_GAP)
+
+
+def test_download_batch_retries_rate_limited_tickers(monkeypatch):
+    fake_yahoo(monkeypatch, {"BBB": [YFRateLimitError()]})
+    adjustments = []
+    monkeypatch.setattr(
+        ta, "_adjust_rate", lambda rate_limited: adjustments.append(rate_limited)
+    )
+
+    histories = ta._download_batch(["AAA", "BBB", "CCC"], interval="1d", period="1mo")
+
+    assert sorted(histories) == ["AAA", "BBB", "CCC"]
+    # Only the throttled ticker is downloaded again
+    assert sorted(FakeYahooTicker.calls) == ["AAA", "BBB", "BBB", "CCC"]
+    assert True in adjustments
+
+
+def test_download_batch_does_not_retry_other_failures(monkeypatch):
+    fake_yahoo(monkeypatch, {"BBB": [ValueError("BBB: possibly delisted")]})
+
+    histories = ta._download_batch(["AAA", "BBB"], interval="1d", period="1mo")
+
+    assert sorted(histories) == ["AAA"]
+    assert sorted(FakeYahooTicker.calls) == ["AAA", "BBB"]
+
+
+def fake_batches(monkeypatch, tmp_path, bars):
+    """Redirect the history cache to tmp_path and stub _download_batch"""
+    monkeypatch.setattr(ta, "HISTORY_CACHE_DIR", tmp_path)
+    monkeypatch.setattr(ta, "_history_memo", {})
+    calls = []
+
+    def download_batch(tickers, **kwargs):
+        calls.append((tickers, kwargs))
+        return {ticker: bars.copy() for ticker in tickers}
+
+    monkeypatch.setattr(ta, "_download_batch", download_batch)
+    return calls
+
+
+def seed_cache(bars, full_fetch):
+    bars.attrs["full_fetch"] = full_fetch
+    ta._save_history("AAA", "1d", bars)
+    # Force the next load to come from disk
+    ta._history_memo.clear()
+
+
+def test_cold_fetch_downloads_full_period(monkeypatch, tmp_path):
+    calls = fake_batches(monkeypatch, tmp_path, make_bars("2024-01-01", 10))
+    before = datetime.now()
+
+    histories = ta._download_cached_batch(["AAA"], "1d")
+
+    assert calls == [(["AAA"], {"interval": "1d", "period": "3y"})]
+    assert len(histories["AAA"]) == 10
+    assert histories["AAA"].attrs["full_fetch"] >= before
+    assert (tmp_path / "AAA_1d.pkl").exists()
+
+
+def test_warm_fetch_replaces_last_partial_bar(monkeypatch, tmp_path):
+    calls = fake_batches(monkeypatch, tmp_path, make_bars("2024-01-10", 3, 101.0))
+    full_fetch = datetime.now() - timedelta(days=1)
+    seed_cache(make_bars("2024-01-01", 10), full_fetch)
+
+    df = ta._download_cached_batch(["AAA"], "1d")["AAA"]
+
+    assert calls == [(["AAA"], {"interval": "1d", "start": pd.Timestamp("2024-01-10")})]
+    assert df.index.is_unique
+    assert list(df.index) == list(pd.date_range("2024-01-01", "2024-01-12"))
+    assert df.loc["2024-01-09", "Close"] == 100.0
+    assert df.loc["2024-01-10", "Close"] == 101.0
+    assert df.attrs["full_fetch"] == full_fetch
+    assert pd.read_pickle(tmp_path / "AAA_1d.pkl").equals(df)
+
+
+def test_warm_fetch_trims_to_period(monkeypatch, tmp_path):
+    period_days = ta.HISTORY_PERIODS["1d"][1]
+    cached = make_bars("2020-01-01", period_days + 10)
+    fake_batches(monkeypatch, tmp_path, make_bars(cached.index[-1], 5))
+    seed_cache(cached, datetime.now())
+
+    df = ta._download_cached_batch(["AAA"], "1d")["AAA"]
+
+    assert df.index[-1] == cached.index[-1] + timedelta(days=4)
+    assert df.index[0] == df.index[-1] - timedelta(days=period_days)
+    assert len(df) == period_days + 1
+
+
+def test_stale_cache_is_downloaded_again_in_full(monkeypatch, tmp_path):
+    calls = fake_batches(monkeypatch, tmp_path, make_bars("2024-01-05", 10, 101.0))
+    stale = datetime.now() - timedelta(days=ta.HISTORY_FULL_REFRESH_DAYS + 1)
+    seed_cache(make_bars("2024-01-01", 10), stale)
+
+    df = ta._download_cached_batch(["AAA"], "1d")["AAA"]
+
+    assert calls == [(["AAA"], {"interval": "1d", "period": "3y"})]
+    # The fresh download replaces the cached bars instead of extending them
+    assert df.index[0] == pd.Timestamp("2024-01-05")
+    assert df.attrs["full_fetch"] > stale